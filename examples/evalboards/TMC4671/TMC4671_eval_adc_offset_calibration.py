@@ -15,6 +15,7 @@ from pytrinamic.connections import ConnectionManager
 from pytrinamic.connections import UartIcInterface
 from pytrinamic.evalboards import TMC4671_eval
 from pytrinamic.ic import TMC4671
+from pytrinamic.helpers import BitField
 
 pytrinamic.show_info()
 
@@ -76,15 +77,13 @@ with ConnectionManager().connect() as my_interface:
 
     startTime = time.time()
 
-    # select the use of ADC_RAW in ADC_RAW_DATA
-    eval_board.write_register(mc.REG.ADC_RAW_ADDR, 0)
-
     while (time.time() - startTime) <= measurementTime:
         measurements += 1
 
-        # Read adc values
-        adc_i0 = eval_board.read_register_field(mc.FIELD.ADC_I0_RAW)
-        adc_i1 = eval_board.read_register_field(mc.FIELD.ADC_I1_RAW)
+        # Read adc values, ADC_RAW_ADDR is only written for the first sample
+        adc_raw = eval_board.read_multiplexed(mc.REG.ADC_RAW_DATA, mc.VARIANT.ADC_RAW_ADDR_ADC_I1_RAW_ADC_I0_RAW)
+        adc_i0 = BitField.field_get(adc_raw, mc.FIELD.ADC_I0_RAW[1], mc.FIELD.ADC_I0_RAW[2])
+        adc_i1 = BitField.field_get(adc_raw, mc.FIELD.ADC_I1_RAW[1], mc.FIELD.ADC_I1_RAW[2])
         print("ADC_I0_Value: %d" % adc_i0)
         print("ADC_I1_Value: %d" % adc_i1)
         lAdcI0Raw.append(adc_i0)
@@ -1,10 +1,36 @@
-from .dummy_tmcl_interface import DummyTmclInterface
-from .can_tmcl.pcan_tmcl_interface import PcanTmclInterface
-from .can_tmcl.socketcan_tmcl_interface import SocketcanTmclInterface
-from .can_tmcl.kvaser_tmcl_interface import KvaserTmclInterface
-from .serial_tmcl_interface import SerialTmclInterface
-from .uart_ic_interface import UartIcInterface
-from .usb_tmcl_interface import UsbTmclInterface
-from .can_tmcl.slcan_tmcl_interface import SlcanTmclInterface
-from .can_tmcl.ixxat_tmcl_interface import IxxatTmclInterface
-from .connection_manager import ConnectionManager
+from ..lazy_import import lazy_exports
+
+# The submodules are imported on first access of their exported names
+__all__ = lazy_exports(__name__, {
+    "DummyTmclInterface": ".dummy_tmcl_interface",
+    "PcanTmclInterface": ".can_tmcl.pcan_tmcl_interface",
+    "SocketcanTmclInterface": ".can_tmcl.socketcan_tmcl_interface",
+    "KvaserTmclInterface": ".can_tmcl.kvaser_tmcl_interface",
+    "SerialTmclInterface": ".serial_tmcl_interface",
+    "UartIcInterface": ".uart_ic_interface",
+    "UsbTmclInterface": ".usb_tmcl_interface",
+    "SlcanTmclInterface": ".can_tmcl.slcan_tmcl_interface",
+    "IxxatTmclInterface": ".can_tmcl.ixxat_tmcl_interface",
+    "RecordingTmclInterface": ".recording_tmcl_interface",
+    "TmclRecording": ".recording_tmcl_interface",
+    "TmclRecord": ".recording_tmcl_interface",
+    "ReplayTmclInterface": ".replay_tmcl_interface",
+    "SimulatedTmclInterface": ".simulated_tmcl_interface",
+    "SimulatedModule": ".simulated_tmcl_interface",
+    "SerialBaudRate": ".serial_baud_rate",
+    "PortListCache": ".port_cache",
+    "TmclBroker": ".tmcl_broker",
+    "BrokerTmclInterface": ".broker_tmcl_interface",
+    "TcpTmclInterface": ".tcp_tmcl_interface",
+    "ConnectionManager": ".connection_manager",
+    "TmclDiscovery": ".tmcl_discovery",
+    "DiscoveredModule": ".tmcl_discovery",
+    "TmclPipeline": ".tmcl_pipeline",
+    "TmclFuture": ".tmcl_pipeline",
+    "TmclStatistics": ".tmcl_statistics",
+    "PreparedTmclRequest": ".tmcl_prepared_request",
+    "AsyncTmclInterface": ".async_tmcl_interface",
+    "AsyncSerialTmclInterface": ".async_tmcl_interface",
+    "AsyncCanTmclInterface": ".async_tmcl_interface",
+    "ThreadedTmclInterface": ".threaded_tmcl_interface",
+})
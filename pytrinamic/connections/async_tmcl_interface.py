@@ -0,0 +1,307 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import asyncio
+
+from ..tmcl import (TMCLCommand, TMCLReply, TMCLReplyError, TMCLReplyStatusError, TMCLReplyChecksumError,
+                    TMCLTimeoutError)
+from ..helpers import to_signed_32
+from .tmcl_interface import ParameterReply, _error_status
+from .serial_tmcl_interface import SerialTmclInterface
+
+
+class AsyncTmclInterface:
+    """
+    asyncio front end for a (blocking) TmclInterface.
+
+    Any number of coroutines can share one instance. Requests are written as
+    soon as less than [window] requests are in flight, a single reader task
+    per bus receives the replies and hands each one to the coroutine waiting
+    for it. The assignment of replies to requests is done by the wrapped
+    interface (see TmclInterface._match_reply()).
+
+    The reader of this base class runs the blocking _recv() of the wrapped
+    interface in the default executor. Subclasses may override _read() with a
+    native asynchronous receive function.
+
+    Example:
+        async with AsyncTmclInterface(UsbTmclInterface("COM3")) as interface:
+            positions = await asyncio.gather(*(interface.get_axis_parameter(1, axis) for axis in range(3)))
+    """
+
+    def __init__(self, interface, window=8):
+        """
+        :param interface: The TmclInterface to use for the communication.
+        :param int window: Maximum number of requests in flight.
+        """
+        if window < 1:
+            raise ValueError(f"Value {window} for parameter window is outside the allowed range (1..)!")
+
+        self._interface = interface
+        self.logger = interface.logger
+        self._window = asyncio.Semaphore(window)
+        self._requests = []
+        self._futures = []
+        self._reader_task = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exit_type, value, traceback):
+        """
+        Close the connection at the end of an async with-statement block.
+        """
+        del exit_type, value, traceback
+        await self.close()
+
+    async def close(self):
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+        self._fail_all(ConnectionError("Connection closed"))
+        self._interface.close()
+
+    @property
+    def interface(self):
+        """The wrapped blocking TmclInterface."""
+        return self._interface
+
+    async def _read(self):
+        """
+        Receive the next reply datagram as a 9 byte bytearray.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._interface._recv, self._interface._host_id,
+                                          self._requests[0].moduleAddress)
+
+    def _fail_all(self, exception):
+        futures = self._futures
+        self._requests = []
+        self._futures = []
+        for future in futures:
+            if not future.done():
+                future.set_exception(exception)
+
+    async def _reader(self):
+        while self._futures:
+            try:
+                data = await self._read()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The assignment of later replies is unknown after a failed receive.
+                self._fail_all(e)
+                break
+
+            reply = TMCLReply.from_buffer(data)
+            index = self._interface._match_reply(self._requests, reply)
+            if index is None:
+                self.logger.warning("Dropping reply without matching request: %s", reply)
+                continue
+
+            request = self._requests.pop(index)
+            future = self._futures.pop(index)
+            if future.done():
+                # The waiting coroutine has been cancelled
+                continue
+            try:
+                self._interface._handle_reply(request, reply)
+            except TMCLReplyError as e:
+                future.set_exception(e)
+            else:
+                future.set_result(reply)
+
+        self._reader_task = None
+
+    async def send_request(self, request):
+        """
+        Send a TMCLRequest and wait for the TMCLReply.
+        """
+        async with self._window:
+            future = asyncio.get_running_loop().create_future()
+            self._requests.append(request)
+            self._futures.append(future)
+
+            self.logger.debug("Tx: %s", request)
+            try:
+                self._interface._send(self._interface._host_id, request.moduleAddress, request.to_buffer())
+            except Exception:
+                index = self._futures.index(future)
+                del self._requests[index]
+                del self._futures[index]
+                raise
+
+            if self._reader_task is None:
+                self._reader_task = asyncio.get_running_loop().create_task(self._reader())
+
+            return await future
+
+    async def send(self, opcode, op_type, motor, value, module_id=None):
+        """
+        Send a TMCL datagram and wait for the reply.
+        """
+        return await self.send_request(self._interface._create_request(opcode, op_type, motor, value, module_id))
+
+    async def get_version_string(self, module_id=None):
+        try:
+            reply = await self.send(TMCLCommand.GET_FIRMWARE_VERSION, 0, 0, 0, module_id)
+        except (TMCLReplyStatusError, TMCLReplyChecksumError) as exc:
+            return exc.reply.version_string()
+        return reply.version_string()
+
+    # Axis parameter access functions
+    async def _send_ap_cmd(self, cmd, index, axis, value, module_id, index_bit_width):
+        request = self._interface._create_ap_request(cmd, index, axis, value, module_id,
+                                                     self._interface._ap_encoding(index_bit_width))
+        return await self.send_request(request)
+
+    async def get_axis_parameter(self, index, axis, module_id=None, signed=False, index_bit_width=None):
+        value = (await self._send_ap_cmd(TMCLCommand.GAP, index, axis, 0, module_id, index_bit_width)).value
+        return to_signed_32(value) if signed else value
+
+    async def set_axis_parameter(self, index, axis, value, module_id=None, index_bit_width=None):
+        return (await self._send_ap_cmd(TMCLCommand.SAP, index, axis, value, module_id, index_bit_width)).value
+
+    async def store_axis_parameter(self, index, axis, module_id=None, index_bit_width=None):
+        return (await self._send_ap_cmd(TMCLCommand.STAP, index, axis, 0, module_id, index_bit_width)).value
+
+    async def get_axis_parameters(self, parameters, module_id=None, signed=False, index_bit_width=None):
+        """
+        Read many axis parameters concurrently, see TmclInterface.get_axis_parameters().
+        """
+        encoding = self._interface._ap_encoding(index_bit_width)
+        rows = []
+        requests = []
+        for row in parameters:
+            index, axis = int(row[0]), int(row[1])
+            row_module_id = int(row[2]) if len(row) > 2 else module_id
+            rows.append((index, axis))
+            requests.append(self._interface._create_ap_request(TMCLCommand.GAP, index, axis, 0, row_module_id,
+                                                               encoding))
+
+        results = await asyncio.gather(*(self.send_request(request) for request in requests), return_exceptions=True)
+
+        replies = []
+        for (index, axis), request, result in zip(rows, requests, results):
+            if isinstance(result, TMCLReplyError):
+                replies.append(ParameterReply(index, axis, request.moduleAddress, None, _error_status(result)))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                value = to_signed_32(result.value) if signed else result.value
+                replies.append(ParameterReply(index, axis, request.moduleAddress, value, result.status))
+        return replies
+
+    # Global parameter access functions
+    async def get_global_parameter(self, command_type, bank, module_id=None, signed=False):
+        value = (await self.send(TMCLCommand.GGP, command_type, bank, 0, module_id)).value
+        return to_signed_32(value) if signed else value
+
+    async def set_global_parameter(self, command_type, bank, value, module_id=None):
+        return await self.send(TMCLCommand.SGP, command_type, bank, value, module_id)
+
+    async def store_global_parameter(self, command_type, bank, module_id=None):
+        return await self.send(TMCLCommand.STGP, command_type, bank, 0, module_id)
+
+    # Register access functions
+    async def write_mc(self, register_address, value, module_id=None):
+        return await self.write_register(register_address, TMCLCommand.WRITE_MC, 0, value, module_id)
+
+    async def read_mc(self, register_address, module_id=None, signed=False):
+        return await self.read_register(register_address, TMCLCommand.READ_MC, 0, module_id, signed)
+
+    async def write_drv(self, register_address, value, module_id=None):
+        return await self.write_register(register_address, TMCLCommand.WRITE_DRV, 1, value, module_id)
+
+    async def read_drv(self, register_address, module_id=None, signed=False):
+        return await self.read_register(register_address, TMCLCommand.READ_DRV, 1, module_id, signed)
+
+    async def read_register(self, register_address, command, channel, module_id=None, signed=False):
+        tmcl_motor = (channel & 0x0F) | ((register_address & 0x0F00) >> 4)
+        tmcl_type = register_address & 0xFF
+        value = (await self.send(command, tmcl_type, tmcl_motor, 0, module_id)).value
+        return to_signed_32(value) if signed else value
+
+    async def write_register(self, register_address, command, channel, value, module_id=None):
+        tmcl_motor = (channel & 0x0F) | ((register_address & 0x0F00) >> 4)
+        tmcl_type = register_address & 0xFF
+        return await self.send(command, tmcl_type, tmcl_motor, value, module_id)
+
+    # Motion control functions
+    async def rotate(self, motor, velocity, module_id=None):
+        return await self.send(TMCLCommand.ROR, 0, motor, velocity, module_id)
+
+    async def stop(self, motor, module_id=None):
+        return await self.send(TMCLCommand.MST, 0, motor, 0, module_id)
+
+    async def move(self, move_type, motor, position, module_id=None):
+        return await self.send(TMCLCommand.MVP, move_type, motor, position, module_id)
+
+    async def move_to(self, motor, position, module_id=None):
+        return (await self.move(0, motor, position, module_id)).value
+
+    async def move_by(self, motor, distance, module_id=None):
+        return (await self.move(1, motor, distance, module_id)).value
+
+    def __str__(self):
+        return "Async{}".format(self._interface)
+
+
+class AsyncSerialTmclInterface(AsyncTmclInterface):
+    """
+    Opens a serial TMCL connection for use with asyncio.
+
+    The default window of one request in flight serializes the requests of
+    all coroutines, which is required on half-duplex RS485 busses. USB and
+    RS232 connections can use a larger window.
+    """
+
+    def __init__(self, com_port, datarate=115200, host_id=2, module_id=1, timeout_s=5, window=1):
+        AsyncTmclInterface.__init__(self, SerialTmclInterface(com_port, datarate, host_id, module_id, timeout_s),
+                                    window)
+
+
+class AsyncCanTmclInterface(AsyncTmclInterface):
+    """
+    asyncio front end for a CanTmclInterface (e.g. KvaserTmclInterface).
+
+    A python-can Notifier feeds the received frames into the event loop, so no
+    executor thread is blocked while waiting. Requests to different module IDs
+    are in flight at the same time and their replies are assigned by module
+    address and opcode.
+
+    Example:
+        async with AsyncCanTmclInterface(KvaserTmclInterface()) as interface:
+            ids = await asyncio.gather(*(interface.get_global_parameter(71, 0, module_id) for module_id in (3, 4, 5)))
+    """
+
+    def __init__(self, interface, window=16):
+        AsyncTmclInterface.__init__(self, interface, window)
+        self._buffered_reader = None
+        self._notifier = None
+
+    async def close(self):
+        if self._notifier:
+            self._notifier.stop()
+            self._notifier = None
+        await AsyncTmclInterface.close(self)
+
+    async def _read(self):
+        import can
+
+        if self._notifier is None:
+            self._buffered_reader = can.AsyncBufferedReader()
+            self._notifier = can.Notifier(self._interface._connection, [self._buffered_reader],
+                                          loop=asyncio.get_running_loop())
+
+        host_id = self._interface._host_id
+        while True:
+            try:
+                msg = await asyncio.wait_for(self._buffered_reader.get_message(), self._interface._timeout_s)
+            except asyncio.TimeoutError as e:
+                raise TMCLTimeoutError(f"Recv timed out ({self._interface.__class__.__name__}, "
+                                       f"on channel {str(self._interface._channel)})") from e
+            if msg.arbitration_id == host_id:
+                return bytearray([msg.arbitration_id]) + msg.data
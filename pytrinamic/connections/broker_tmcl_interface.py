@@ -0,0 +1,192 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import logging
+import os
+import socket
+from collections import deque
+
+from ..tmcl import TMCLRequest, TMCLCommand, TMCLReplyChecksumError, TMCLTimeoutError
+from ..connections.tmcl_interface import TmclInterface
+from .tmcl_broker import (TmclBroker, recv_exact, PACKET_HEADER, ITEM_SIZE, MAX_ITEMS, ITEM_REPLY, ITEM_NO_REPLY,
+                          REPLY_CHECKSUM_ERROR, REPLY_TIMEOUT, REPLY_OK)
+
+
+class BrokerTmclInterface(TmclInterface):
+    """
+    Opens a TMCL connection through a TmclBroker, which shares one physical
+    connection between multiple processes.
+
+    Sent requests are collected and written to the broker as one packet when
+    the next reply is read, so pipelined requests (see pipeline()) travel in a
+    single packet and are in flight on the bus at the same time.
+    """
+
+    def __init__(self, port=TmclBroker.DEFAULT_ADDRESS, datarate=0, host_id=2, module_id=1, timeout_s=5):
+        """
+        :param str port: Socket path of the broker.
+        """
+        del datarate
+        if not isinstance(port, str):
+            raise TypeError
+
+        TmclInterface.__init__(self, host_id, module_id)
+
+        self.logger = logging.getLogger("{}.{}".format(self.__class__.__name__, port))
+
+        self._port = port
+        if timeout_s == 0:
+            timeout_s = None
+        try:
+            self._socket = self._connect(port, timeout_s)
+        except OSError as e:
+            raise ConnectionError(f"Failed to connect to the TMCL broker at {port}") from e
+
+        self._tx_data = bytearray()
+        self._tx_count = 0
+        self._rx_items = deque()
+        self._outstanding = 0
+        self._discard = 0
+        self._checksum_error = False
+
+    def _connect(self, port, timeout_s):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout_s)
+        sock.connect(port)
+        return sock
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        """
+        Close the connection at the end of a with-statement block.
+        """
+        del exit_type, value, traceback
+        self.close()
+
+    def close(self):
+        self.logger.info("Closing connection.")
+        self._socket.close()
+
+    def _queue(self, data, flag):
+        self._tx_data.append(flag)
+        self._tx_data += data
+        self._tx_count += 1
+        if self._tx_count == MAX_ITEMS:
+            self._flush()
+
+    def _flush(self):
+        if not self._tx_count:
+            return
+        try:
+            self._socket.sendall(PACKET_HEADER.pack(self._tx_count) + self._tx_data)
+        except OSError as e:
+            raise ConnectionError(f"Failed to send to the TMCL broker at {self._port}") from e
+        finally:
+            self._tx_data = bytearray()
+            self._tx_count = 0
+
+    def _read_packet(self):
+        try:
+            header = recv_exact(self._socket, PACKET_HEADER.size)
+            data = recv_exact(self._socket, PACKET_HEADER.unpack(header)[0] * ITEM_SIZE) if header else None
+        except socket.timeout as e:
+            raise TMCLTimeoutError(f"Recv timed out ({self.__class__.__name__}, on port {self._port})") from e
+        except OSError as e:
+            raise ConnectionError(f"Failed to receive from the TMCL broker at {self._port}") from e
+        if data is None:
+            raise ConnectionError(f"The TMCL broker at {self._port} closed the connection")
+        for offset in range(0, len(data), ITEM_SIZE):
+            self._rx_items.append((data[offset], data[offset + 1:offset + ITEM_SIZE]))
+
+    def _send(self, host_id, module_id, data):
+        """
+            Queue the bytearray parameter [data] for sending.
+
+            This is a required override function for using the tmcl_interface
+            class.
+        """
+        del host_id, module_id
+
+        self._queue(data, ITEM_REPLY)
+        self._outstanding += 1
+
+    def _recv(self, host_id, module_id):
+        """
+            Send the queued requests, then read 9 bytes and return them as a
+            bytearray.
+
+            This is a required override function for using the tmcl_interface
+            class.
+        """
+        del host_id, module_id
+
+        self._flush()
+        while True:
+            while not self._rx_items:
+                try:
+                    self._read_packet()
+                except ConnectionError:
+                    # Replies arriving later belong to failed requests
+                    self._discard = self._outstanding
+                    raise
+            status, data = self._rx_items.popleft()
+            self._outstanding -= 1
+            if self._discard:
+                # Reply of a request that already failed together with an earlier one
+                self._discard -= 1
+                continue
+            break
+
+        if status != REPLY_OK and status != REPLY_CHECKSUM_ERROR:
+            # The caller fails all requests in flight, so drop their replies
+            self._discard = self._outstanding
+            if status == REPLY_TIMEOUT:
+                raise TMCLTimeoutError(f"Recv timed out ({self.__class__.__name__}, on port {self._port})")
+            raise ConnectionError(f"The TMCL broker at {self._port} failed to reach the module")
+
+        self._checksum_error = status == REPLY_CHECKSUM_ERROR
+        return data
+
+    def _reply_check(self, reply):
+        if self._checksum_error:
+            raise TMCLReplyChecksumError(reply)
+
+    def send_boot(self, module_id=None):
+        """
+        Send the command for entering bootloader mode. This TMCL command does
+        result in a reply.
+        """
+        if not module_id:
+            module_id = self._default_module_id
+
+        request = TMCLRequest(module_id, TMCLCommand.BOOT, 0x81, 0x92, 0xA3B4C5D6)
+
+        self.logger.debug("Tx: %s", request)
+
+        self._queue(request.to_buffer(), ITEM_NO_REPLY)
+        self._flush()
+
+    @staticmethod
+    def supports_tmcl():
+        return True
+
+    @staticmethod
+    def list():
+        """
+            Return a list of available connection ports as a list of strings.
+
+            This function is required for using this interface with the
+            connection manager.
+        """
+        return [TmclBroker.DEFAULT_ADDRESS] if os.path.exists(TmclBroker.DEFAULT_ADDRESS) else []
+
+    @property
+    def port_id(self):
+        return "broker", self._port
+
+    def __str__(self):
+        return "Connection: type={} port={}".format(type(self).__name__, self._port)
@@ -7,12 +7,38 @@
 ################################################################################
 
 import logging
+import threading
+import time
 import can
 from ..connections.tmcl_interface import TmclInterface
+from ..tmcl import TMCLReply, TMCLCommand, TMCLTimeoutError
+
+
+class _PendingReply:
+    """A request of send_request() waiting for its reply."""
+
+    __slots__ = ("request", "reply")
+
+    def __init__(self, request):
+        self.request = request
+        self.reply = None
 
 
 class CanTmclInterface(TmclInterface):
-    """Generic CAN interface class for the CAN adapters."""
+    """
+    Generic CAN interface class for the CAN adapters.
+
+    send_request() and all functions based on it can be called from multiple
+    threads, e.g. by TMCLModule objects for different module IDs on the same
+    bus. The requests of all threads are in flight at the same time. The
+    thread that is currently receiving routes each reply to the waiting
+    thread by module address and opcode (see _match_reply()).
+    """
+
+    # All requests have to pass the reply dispatcher
+    _direct_io = False
+    # Each module replies independently and replies are matched by module address
+    _unordered_replies = True
 
     def __init__(self, channel, datarate, host_id, default_module_id, timeout_s):
 
@@ -27,6 +53,12 @@ class CanTmclInterface(TmclInterface):
 
         self.logger = logging.getLogger(f"{self.__class__.__name__}.{self._channel}")
 
+        # Reply dispatcher of send_request()
+        self._send_lock = threading.Lock()
+        self._dispatch = threading.Condition()
+        self._pending = []
+        self._receiving = False
+
     def __enter__(self):
         return self
 
@@ -76,7 +108,7 @@ class CanTmclInterface(TmclInterface):
                 ) from e
 
             if not msg:
-                raise ConnectionError(f"Recv timed out ({self.__class__.__name__}, on channel {str(self._channel)})")
+                raise TMCLTimeoutError(f"Recv timed out ({self.__class__.__name__}, on channel {str(self._channel)})")
 
             if msg.arbitration_id != host_id:
                 # The filter shouldn't let wrong messages through.
@@ -88,9 +120,85 @@ class CanTmclInterface(TmclInterface):
 
         return bytearray([msg.arbitration_id]) + msg.data
 
+    def _match_reply(self, requests, reply):
+        """
+        Modules on a CAN bus reply independently of each other, so the replies
+        of pipelined requests are assigned by module address and opcode.
+        """
+        for index, request in enumerate(requests):
+            if request.moduleAddress == reply.module_address and request.command == reply.command:
+                return index
+        # The ASCII firmware version reply (see get_version_string()) consists
+        # of the version string only, it belongs to the oldest version request
+        for index, request in enumerate(requests):
+            if request.command == TMCLCommand.GET_FIRMWARE_VERSION and request.commandType == 0:
+                return index
+        return None
+
+    def _send_request(self, request):
+        """
+        Thread-safe implementation of send_request().
+        """
+        pending = _PendingReply(request)
+        with self._dispatch:
+            self._pending.append(pending)
+
+        self.logger.debug("Tx: %s", request)
+        try:
+            with self._send_lock:
+                self._send(self._host_id, request.moduleAddress, request.to_buffer())
+            self._wait_for_reply(pending)
+        except Exception:
+            with self._dispatch:
+                if pending in self._pending:
+                    self._pending.remove(pending)
+            raise
+
+        self._handle_reply(request, pending.reply)
+
+        return pending.reply
+
+    def _wait_for_reply(self, pending):
+        """
+        Wait until the reply of [pending] has been received.
+
+        Only one thread receives at a time. The other threads wait until the
+        receiving thread hands them their reply or stops receiving, in which
+        case one of them takes over.
+        """
+        deadline = None if self._timeout_s is None else time.monotonic() + self._timeout_s
+        with self._dispatch:
+            while pending.reply is None and self._receiving:
+                timeout = None if deadline is None else deadline - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    raise TMCLTimeoutError(f"Recv timed out ({self.__class__.__name__}, on channel {str(self._channel)})")
+                self._dispatch.wait(timeout)
+            if pending.reply is not None:
+                return
+            self._receiving = True
+
+        try:
+            while pending.reply is None:
+                reply = TMCLReply.from_buffer(self._recv(self._host_id, pending.request.moduleAddress))
+                with self._dispatch:
+                    index = self._match_reply([item.request for item in self._pending], reply)
+                    if index is None:
+                        self.logger.warning("Dropping reply without matching request: %s", reply)
+                        continue
+                    self._pending.pop(index).reply = reply
+                    self._dispatch.notify_all()
+        finally:
+            with self._dispatch:
+                self._receiving = False
+                self._dispatch.notify_all()
+
     @staticmethod
     def supports_tmcl():
         return True
 
+    @property
+    def port_id(self):
+        return self.__class__.__name__, str(self._channel), self._bitrate
+
     def __str__(self):
         return f"Connection: Type = {self.__class__.__name__}, Channel = {self._channel}, Bitrate = {self._bitrate}"
@@ -10,19 +10,31 @@ import sys
 import logging
 import argparse
 
-from ..connections import DummyTmclInterface
-from ..connections import PcanTmclInterface
-from ..connections import SocketcanTmclInterface
-from ..connections import KvaserTmclInterface
-from ..connections import SerialTmclInterface
-from ..connections import UartIcInterface
-from ..connections import UsbTmclInterface
-from ..connections import SlcanTmclInterface
-from ..connections import IxxatTmclInterface
+from .. import connections
+from .serial_baud_rate import SerialBaudRate
+from .port_cache import PortListCache
 
 logger = logging.getLogger(__name__)
 
 
+class _InterfaceList:
+    """
+    Class attribute resolving the interface class names to the classes on
+    first access. This imports all interfaces and their drivers, so the
+    ConnectionManager itself only imports the selected interface.
+    """
+
+    def __init__(self, interface_specs):
+        self._interface_specs = interface_specs
+        self._interfaces = None
+
+    def __get__(self, instance, owner):
+        if self._interfaces is None:
+            self._interfaces = [(name, getattr(connections, class_name), data_rate)
+                                for name, class_name, data_rate in self._interface_specs]
+        return self._interfaces
+
+
 class ConnectionManager:
     """
     This class provides a centralized way of extracting connection-specific
@@ -59,7 +71,10 @@ class ConnectionManager:
             - Any other string:
                 Attempt to use the provided string to connect with the selected
                 interface directly. E.g. for a serial connection you can use
-                "COM3" on windows or "/dev/tty3" on linux.
+                "COM3" on windows or "/dev/tty3" on linux. The replay_tmcl
+                interface expects the path of a recording, the broker_tmcl
+                interface the socket path of a TmclBroker and the tcp_tmcl
+                interface the "host:port" address of a TmclBroker.
 
             Default value: "any"
 
@@ -86,6 +101,14 @@ class ConnectionManager:
 
             Default value: 5.0
 
+        --negotiate-baud-rate
+            Opt-in for serial_tmcl: After connecting, detect the baud rate of
+            the module and switch the module and the connection to the highest
+            baud rate that passes a burst of checksummed requests. The new rate
+            is not stored on the module. The --data-rate argument is used as
+            the first guess of the current module baud rate. Native USB
+            connections (usb_tmcl) have no baud rate and are not changed.
+
         --host-id <host-id>
             The host id to use with a TMCL connection.
 
@@ -98,19 +121,31 @@ class ConnectionManager:
     """
 
     # All available interfaces
-    # The tuples consist of (string representation, class type, default datarate)
-    INTERFACES = [
-        ("dummy_tmcl", DummyTmclInterface, 0),
-        ("kvaser_tmcl", KvaserTmclInterface, 1000000),
-        ("pcan_tmcl", PcanTmclInterface, 1000000),
-        ("slcan_tmcl", SlcanTmclInterface, 1000000),
-        ("socketcan_tmcl", SocketcanTmclInterface, 1000000),
-        ("serial_tmcl", SerialTmclInterface, 9600),
-        ("uart_ic", UartIcInterface, 9600),
-        ("usb_tmcl", UsbTmclInterface, 115200),
-        ("ixxat_tmcl", IxxatTmclInterface, 1000000),
+    # The tuples consist of (string representation, class name, default datarate)
+    _INTERFACE_SPECS = [
+        ("dummy_tmcl", "DummyTmclInterface", 0),
+        ("kvaser_tmcl", "KvaserTmclInterface", 1000000),
+        ("pcan_tmcl", "PcanTmclInterface", 1000000),
+        ("slcan_tmcl", "SlcanTmclInterface", 1000000),
+        ("socketcan_tmcl", "SocketcanTmclInterface", 1000000),
+        ("serial_tmcl", "SerialTmclInterface", 9600),
+        ("uart_ic", "UartIcInterface", 9600),
+        ("usb_tmcl", "UsbTmclInterface", 115200),
+        ("ixxat_tmcl", "IxxatTmclInterface", 1000000),
+        ("replay_tmcl", "ReplayTmclInterface", 0),
+        ("simulated_tmcl", "SimulatedTmclInterface", 0),
+        ("broker_tmcl", "BrokerTmclInterface", 0),
+        ("tcp_tmcl", "TcpTmclInterface", 0),
     ]
 
+    # The tuples consist of (string representation, class type, default datarate)
+    # Accessing this list imports all interfaces.
+    INTERFACES = _InterfaceList(_INTERFACE_SPECS)
+
+    # Port lists are shared by all ConnectionManager instances, so reconnects
+    # don't list the ports again. Set PORT_CACHE.ttl_s = 0 to disable caching.
+    PORT_CACHE = PortListCache()
+
     def __init__(self, arg_list=None, connection_type="any"):
         # Attributes
         self.__connection = None
@@ -131,7 +166,7 @@ class ConnectionManager:
         args = arg_parser.parse_known_args(arg_list)[0]
 
         # Argument storage - default parameters are set here
-        self.__interface  = UsbTmclInterface
+        self.__interface  = None
         self.__port       = "any"
         self.__no_port    = []
         self.__data_rate  = 115200
@@ -142,14 +177,18 @@ class ConnectionManager:
 
         # ## Interpret given arguments
         # Interface
-        for actual_interface in self.INTERFACES:
-            if connection_type == "tmcl" and not(actual_interface[1].supports_tmcl()):
+        for interface_name, class_name, data_rate in self._INTERFACE_SPECS:
+            if args.interface[0] != interface_name:
                 continue
 
-            if args.interface[0] == actual_interface[0]:
-                self.__interface = actual_interface[1]
-                self.__data_rate = actual_interface[2]
-                break
+            # Only the selected interface gets imported
+            interface = getattr(connections, class_name)
+            if connection_type == "tmcl" and not(interface.supports_tmcl()):
+                continue
+
+            self.__interface = interface
+            self.__data_rate = data_rate
+            break
         else:
             # The for loop never hit the break statement -> invalid interface
             raise ValueError("Invalid interface: {0:s}".format(args.interface[0]))
@@ -175,6 +214,9 @@ class ConnectionManager:
         # Timeout
         self.__timeout_s = args.timeout_s
 
+        # Baud rate negotiation
+        self.__negotiate_baud_rate = args.negotiate_baud_rate
+
         # Host ID
         try:
             self.__host_id = int(args.host_id[0])
@@ -256,16 +298,39 @@ class ConnectionManager:
                 # Open the connection to a direct IC interface
                 self.__connection = self.__interface(port, self.__data_rate, timeout_s=self.__timeout_s)
         except ConnectionError as e:
+            # The port might be gone, list the ports again on the next attempt
+            self.PORT_CACHE.invalidate(self.__interface)
             raise ConnectionError("Couldn't connect to port " + port + ". Connection failed.") from e
 
+        if self.__negotiate_baud_rate:
+            # Imported here, both interfaces pull in pyserial
+            from .serial_tmcl_interface import SerialTmclInterface
+            from .usb_tmcl_interface import UsbTmclInterface
+            if isinstance(self.__connection, UsbTmclInterface):
+                logger.info("Skipping the baud rate negotiation, %s has no baud rate.", self.__interface.__qualname__)
+            elif isinstance(self.__connection, SerialTmclInterface):
+                try:
+                    SerialBaudRate.negotiate(self.__connection, module_id=self.__module_id)
+                except ConnectionError:
+                    self.__connection.close()
+                    raise
+            else:
+                logger.warning("Baud rate negotiation is not supported by %s.", self.__interface.__qualname__)
+
         return self.__connection
 
     def disconnect(self):
         self.__connection.close()
 
-    def list_connections(self):
+    def list_connections(self, refresh=False):
+        """
+        Return the available ports of the selected interface, excluding the
+        blacklisted ones. The port list is cached, see PORT_CACHE.
+
+        :param bool refresh: List the ports again instead of using the cache.
+        """
         # Get the list of ports
-        port_list = self.__interface.list()
+        port_list = self.PORT_CACHE.list(self.__interface, refresh)
 
         # Apply the port blacklist
         port_list = [port for port in port_list if port not in self.__no_port]
@@ -273,9 +338,11 @@ class ConnectionManager:
         return port_list
 
     def __interactive_port_selection(self):
+        refresh = False
         while True:
             # Get all available ports
-            port_list = self.list_connections()
+            port_list = self.list_connections(refresh)
+            refresh = True
 
             print("Available options:")
             for i, entry in enumerate(port_list, 1):
@@ -323,7 +390,7 @@ class ConnectionManager:
 
         group = arg_parser.add_argument_group("ConnectionManager options")
         group.add_argument('--interface', dest='interface', action='store', nargs=1, type=str,
-                           choices=[actual_interface[0] for actual_interface in ConnectionManager.INTERFACES],
+                           choices=ConnectionManager.list_supported_interfaces(),
                            default=['usb_tmcl'], help='Connection interface (default: %(default)s)')
         group.add_argument('--port', dest='port', action='store', nargs=1, type=str, default=['any'],
                            help='Connection port (default: %(default)s, n: Use n-th available port, "any": Use any available port, "interactive": Interactive dialogue for port selection, String: Attempt to use the provided string - e.g. COM6 or /dev/tty3)')
@@ -333,6 +400,8 @@ class ConnectionManager:
                            help='Connection data-rate (default: %(default)s)')
         group.add_argument('--timeout', dest='timeout_s', action='store', type=_positive_float, default=5.0,
                            help='Connection rx timeout in seconds (default: %(default)s)', metavar="SECONDS")
+        group.add_argument('--negotiate-baud-rate', dest='negotiate_baud_rate', action='store_true',
+                           help='Switch serial_tmcl connections to the highest working baud rate')
 
         group = arg_parser.add_argument_group("ConnectionManager TMCL options")
 
@@ -345,7 +414,30 @@ class ConnectionManager:
 
     @staticmethod
     def list_supported_interfaces():
-        return [x[0] for x in ConnectionManager.INTERFACES]
+        return [x[0] for x in ConnectionManager._INTERFACE_SPECS]
+
+    @staticmethod
+    def list_all_connections(interfaces=None, refresh=False):
+        """
+        List the available ports of multiple interfaces in parallel.
+
+        :param interfaces: Interface names, per default all supported interfaces.
+        :param bool refresh: List the ports again instead of using the cache.
+        :return: A dict mapping the interface names to their port lists.
+        """
+        if interfaces is None:
+            interfaces = ConnectionManager.list_supported_interfaces()
+        classes = {}
+        for name in interfaces:
+            for interface_name, class_name, _ in ConnectionManager._INTERFACE_SPECS:
+                if interface_name == name:
+                    classes[name] = getattr(connections, class_name)
+                    break
+            else:
+                raise ValueError("Invalid interface: {0:s}".format(name))
+
+        port_lists = ConnectionManager.PORT_CACHE.list_many(classes.values(), refresh)
+        return {name: port_lists[interface] for name, interface in classes.items()}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class PortListCache:
+    """
+    Caches the port lists returned by the list() functions of the interfaces.
+
+    Listing ports (e.g. serial.tools.list_ports.comports()) can take hundreds
+    of milliseconds on systems with many devices. A cached list is reused for
+    [ttl_s] seconds, unless a device has been added or removed in the meantime.
+    On Linux, added and removed devices are detected by the modification time
+    of the device directories (/dev, /sys/class/tty, ...), on other systems
+    only the TTL applies.
+    """
+
+    WATCHED_PATHS = ["/dev", "/dev/serial/by-id", "/sys/class/tty", "/sys/class/net"]
+
+    def __init__(self, ttl_s=5.0):
+        """
+        :param float ttl_s: Maximum age of a cached port list in seconds. 0 disables the cache.
+        """
+        self.ttl_s = ttl_s
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _device_state(cls):
+        """
+        Return a value that changes when devices are added or removed.
+        """
+        state = []
+        for path in cls.WATCHED_PATHS:
+            try:
+                state.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                state.append(None)
+        return tuple(state)
+
+    def invalidate(self, interface=None):
+        """
+        Drop the cached port list of [interface], or of all interfaces if None.
+        """
+        with self._lock:
+            if interface is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(interface, None)
+
+    def list(self, interface, refresh=False):
+        """
+        Return the port list of the [interface] class.
+
+        :param bool refresh: Ignore the cached list.
+        """
+        now = time.monotonic()
+        state = self._device_state()
+        if not refresh and self.ttl_s > 0:
+            with self._lock:
+                entry = self._entries.get(interface)
+            if entry is not None and now - entry[0] < self.ttl_s and entry[1] == state:
+                return list(entry[2])
+
+        ports = interface.list()
+        logger.debug("Listed %d ports of %s in %.3fs.", len(ports), interface.__qualname__, time.monotonic() - now)
+        with self._lock:
+            self._entries[interface] = (now, state, list(ports))
+        return ports
+
+    def list_many(self, interfaces, refresh=False):
+        """
+        Return the port lists of multiple interface classes, listed in parallel.
+
+        Interfaces failing to list their ports (e.g. due to a missing driver)
+        are logged and get an empty list.
+
+        :return: A dict mapping each interface class to its port list.
+        """
+        interfaces = list(dict.fromkeys(interfaces))
+
+        def list_ports(interface):
+            try:
+                return self.list(interface, refresh)
+            except Exception as e:
+                logger.info("Listing the ports of %s failed: %s", interface.__qualname__, e)
+                return []
+
+        if len(interfaces) <= 1:
+            return {interface: list_ports(interface) for interface in interfaces}
+        with ThreadPoolExecutor(max_workers=len(interfaces)) as executor:
+            return dict(zip(interfaces, executor.map(list_ports, interfaces)))
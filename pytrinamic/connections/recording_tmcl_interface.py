@@ -0,0 +1,203 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import namedtuple
+
+from ..tmcl import TMCLRequest, TMCLReply
+from .tmcl_interface import TmclInterface
+
+# File layout: A header (magic, format version) followed by fixed size records
+# of (timestamp in ns since the epoch, direction, 9 byte datagram).
+_MAGIC = b"TMCLREC\x00"
+_VERSION = 1
+_HEADER = struct.Struct("<8sI")
+_RECORD = struct.Struct("<qB9s")
+
+TmclRecord = namedtuple("TmclRecord", ["timestamp_ns", "direction", "data"])
+
+
+class TmclRecording:
+    """
+    Read-only, memory-mapped view of a TMCL traffic recording written by a
+    RecordingTmclInterface.
+
+    The recording is a sequence of TmclRecord(timestamp_ns, direction, data)
+    tuples with the direction TX for requests and RX for replies.
+    """
+
+    TX = 0
+    RX = 1
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not a TMCL recording") from None
+
+        magic, version = _HEADER.unpack_from(self._mmap) if len(self._mmap) >= _HEADER.size else (None, None)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a TMCL recording (version {_VERSION})")
+
+        # A partially written record at the end of the file is ignored
+        self._length = (len(self._mmap) - _HEADER.size) // _RECORD.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        del exit_type, value, traceback
+        self.close()
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Record index out of range")
+        return TmclRecord._make(_RECORD.unpack_from(self._mmap, _HEADER.size + index * _RECORD.size))
+
+    def __iter__(self):
+        for offset in range(_HEADER.size, _HEADER.size + self._length * _RECORD.size, _RECORD.size):
+            yield TmclRecord._make(_RECORD.unpack_from(self._mmap, offset))
+
+    def requests(self):
+        """
+        Yield (timestamp_ns, TMCLRequest) for all recorded requests.
+        """
+        for record in self:
+            if record.direction == self.TX:
+                yield record.timestamp_ns, TMCLRequest.from_buffer(record.data)
+
+    def replies(self):
+        """
+        Yield (timestamp_ns, TMCLReply) for all recorded replies.
+        """
+        for record in self:
+            if record.direction == self.RX:
+                yield record.timestamp_ns, TMCLReply.from_buffer(record.data)
+
+
+class RecordingTmclInterface(TmclInterface):
+    """
+    Wraps a TmclInterface and appends all sent and received datagrams with
+    nanosecond timestamps to a binary recording file.
+
+    Recordings can be read with TmclRecording and played back with the
+    ReplayTmclInterface.
+
+    Example:
+        with RecordingTmclInterface(UsbTmclInterface("COM3"), "session.tmclrec") as interface:
+            module = TMCM1636(interface)
+    """
+
+    def __init__(self, interface, path):
+        """
+        :param interface: The TmclInterface to record.
+        :param str path: Recording file. If it exists, the records are appended.
+        """
+        TmclInterface.__init__(self, interface._host_id, interface._default_module_id,
+                               interface._default_ap_index_bit_width)
+        self.logger = interface.logger
+
+        self._interface = interface
+        self._direct_io = interface._direct_io
+        self._checksum_replies = interface._checksum_replies
+        self._unordered_replies = interface._unordered_replies
+        self._path = path
+        self._lock = threading.Lock()
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            # Validate the header before appending
+            with TmclRecording(path) as recording:
+                size = _HEADER.size + len(recording) * _RECORD.size
+            self._file = open(path, "ab")
+            # Drop a partial record of an interrupted recording, the appended
+            # records would be misaligned otherwise
+            self._file.truncate(size)
+        else:
+            self._file = open(path, "wb")
+            self._file.write(_HEADER.pack(_MAGIC, _VERSION))
+
+        # High resolution timestamps relative to the wall clock at opening time
+        self._time_offset_ns = time.time_ns() - time.perf_counter_ns()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        """
+        Close the connection at the end of a with-statement block.
+        """
+        del exit_type, value, traceback
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self._interface.close()
+
+    @property
+    def interface(self):
+        """The recorded TmclInterface."""
+        return self._interface
+
+    def flush(self):
+        """
+        Write all buffered records to the recording file.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def _record(self, direction, data):
+        record = _RECORD.pack(self._time_offset_ns + time.perf_counter_ns(), direction, bytes(data))
+        with self._lock:
+            # Datagrams still in flight after closing are not recorded
+            if self._file is not None:
+                self._file.write(record)
+
+    def _send(self, host_id, module_id, data):
+        self._record(TmclRecording.TX, data)
+        self._interface._send(host_id, module_id, data)
+
+    def _recv(self, host_id, module_id):
+        data = self._interface._recv(host_id, module_id)
+        self._record(TmclRecording.RX, data)
+        return data
+
+    def _reply_check(self, reply):
+        self._interface._reply_check(reply)
+
+    def _match_reply(self, requests, reply):
+        return self._interface._match_reply(requests, reply)
+
+    @staticmethod
+    def supports_tmcl():
+        return True
+
+    @property
+    def port_id(self):
+        return self._interface.port_id
+
+    def __str__(self):
+        return "Recording{} to {}".format(self._interface, self._path)
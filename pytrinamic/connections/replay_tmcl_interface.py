@@ -0,0 +1,127 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import logging
+import time
+
+from ..connections.tmcl_interface import TmclInterface
+from .recording_tmcl_interface import TmclRecording
+
+
+class ReplayTmclInterface(TmclInterface):
+    """
+    Plays back a recording of a RecordingTmclInterface.
+
+    Every received datagram is the next reply of the recording. Sent requests
+    are compared with the recorded requests and a warning is logged on the
+    first difference, which usually means the control code diverged from the
+    recorded session.
+
+    By default the replies are served as fast as possible. With realtime=True
+    each reply is delayed until its recorded time relative to the start of the
+    recording has passed.
+    """
+
+    def __init__(self, port, datarate=115200, host_id=2, module_id=1, timeout_s=5, realtime=False):
+        """
+        :param str port: Path of the recording file.
+        :param bool realtime: Reproduce the recorded timing of the replies.
+        """
+        del datarate, timeout_s
+        if not isinstance(port, str):
+            raise TypeError
+
+        TmclInterface.__init__(self, host_id, module_id)
+
+        self.logger = logging.getLogger("{}.{}".format(self.__class__.__name__, port))
+
+        try:
+            self._recording = TmclRecording(port)
+        except (OSError, ValueError) as e:
+            raise ConnectionError(f"Failed to open the recording {port}") from e
+
+        self._port = port
+        self._realtime = realtime
+        self._requests = [record for record in self._recording if record.direction == TmclRecording.TX]
+        self._replies = [record for record in self._recording if record.direction == TmclRecording.RX]
+        self._request_index = 0
+        self._reply_index = 0
+        self._diverged = False
+        self._start_ns = None
+        self._first_timestamp_ns = self._recording[0].timestamp_ns if len(self._recording) else 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        """
+        Close the connection at the end of a with-statement block.
+        """
+        del exit_type, value, traceback
+        self.close()
+
+    def close(self):
+        self._recording.close()
+
+    def rewind(self):
+        """
+        Restart the playback at the beginning of the recording.
+        """
+        self._request_index = 0
+        self._reply_index = 0
+        self._diverged = False
+        self._start_ns = None
+
+    def _send(self, host_id, module_id, data):
+        del host_id, module_id
+
+        if self._start_ns is None:
+            self._start_ns = time.perf_counter_ns()
+
+        if self._request_index < len(self._requests):
+            expected = self._requests[self._request_index].data
+            self._request_index += 1
+            if not self._diverged and bytes(data) != expected:
+                self._diverged = True
+                self.logger.warning("Request %d differs from the recording (sent %s, recorded %s)",
+                                    self._request_index - 1, bytes(data).hex(), expected.hex())
+
+    def _recv(self, host_id, module_id):
+        del host_id, module_id
+
+        if self._reply_index >= len(self._replies):
+            raise ConnectionError(f"End of the recording {self._port} reached")
+
+        record = self._replies[self._reply_index]
+        self._reply_index += 1
+
+        if self._realtime:
+            if self._start_ns is None:
+                self._start_ns = time.perf_counter_ns()
+            delay_ns = (record.timestamp_ns - self._first_timestamp_ns) - (time.perf_counter_ns() - self._start_ns)
+            if delay_ns > 0:
+                time.sleep(delay_ns / 1e9)
+
+        return bytearray(record.data)
+
+    @staticmethod
+    def supports_tmcl():
+        return True
+
+    @staticmethod
+    def list():
+        """
+            Return a list of available connection ports as a list of strings.
+
+            Recordings have to be selected explicitly by passing the path as port.
+        """
+        return []
+
+    @property
+    def port_id(self):
+        return "replay", self._port
+
+    def __str__(self):
+        return "Connection: type={}, recording={}".format(type(self).__name__, self._port)
@@ -0,0 +1,159 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import logging
+
+from ..tmcl import TMCLCommand, TMCLReplyError
+
+logger = logging.getLogger(__name__)
+
+
+class SerialBaudRate:
+    """
+    Baud rate detection and negotiation for serial (RS232/RS485) TMCL modules.
+
+    The module baud rate is set with global parameter 65 (bank 0), which uses
+    a code instead of the baud rate itself. The new rate is not stored in the
+    EEPROM, so a module reset restores the previous rate unless store=True is
+    passed to negotiate().
+    """
+
+    GP_SERIAL_BAUD_RATE = 65
+
+    CODES = {
+        9600: 0,
+        14400: 1,
+        19200: 2,
+        28800: 3,
+        38400: 4,
+        57600: 5,
+        76800: 6,
+        115200: 7,
+        230400: 8,
+        250000: 9,
+        500000: 10,
+        1000000: 11,
+    }
+
+    DEFAULT_RATES = [1000000, 500000, 250000, 230400, 115200, 57600, 38400, 19200, 9600]
+
+    @staticmethod
+    def _switch(interface, baudrate):
+        interface.set_baudrate(baudrate)
+        interface._serial.reset_input_buffer()
+
+    @staticmethod
+    def _check(interface, module_id, count):
+        """
+        Read the baud rate parameter [count] times. Serial replies are
+        checksum checked, so any corruption raises an exception.
+        """
+        try:
+            for _ in range(count):
+                interface.send(TMCLCommand.GGP, SerialBaudRate.GP_SERIAL_BAUD_RATE, 0, 0, module_id)
+        except (TMCLReplyError, ConnectionError, RuntimeError, OSError):
+            return False
+        return True
+
+    @staticmethod
+    def probe(interface, rates=None, module_id=None, timeout_s=0.2):
+        """
+        Find the baud rate the module currently uses.
+
+        The current rate of the interface is tried first, then [rates].
+
+        :return: The detected baud rate or None. The interface is left at the
+            detected rate, or at its original rate if none was detected.
+        """
+        original_rate = interface.get_baudrate()
+        original_timeout = interface.get_timeout()
+        rates = [original_rate] + [rate for rate in (rates or SerialBaudRate.DEFAULT_RATES) if rate != original_rate]
+
+        interface.set_timeout(timeout_s)
+        try:
+            for rate in rates:
+                SerialBaudRate._switch(interface, rate)
+                if SerialBaudRate._check(interface, module_id, 1):
+                    logger.info("Module responds at %d baud.", rate)
+                    return rate
+            SerialBaudRate._switch(interface, original_rate)
+            return None
+        finally:
+            interface.set_timeout(original_timeout)
+
+    @staticmethod
+    def negotiate(interface, rates=None, module_id=None, burst=16, store=False, timeout_s=0.2):
+        """
+        Switch the module and the interface to the highest baud rate of [rates]
+        at which a burst of [burst] requests succeeds.
+
+        Each candidate rate above the current one is set on the module, then the
+        link is verified. If the verification fails, the module is switched back
+        to the previous rate and the next lower candidate is tried. If setting a
+        rate fails, the rate of the module is probed again, it might have
+        switched anyway.
+
+        :param interface: An open SerialTmclInterface.
+        :param rates: Candidate baud rates, per default DEFAULT_RATES.
+        :param int burst: Number of checksummed requests to verify a rate with.
+        :param bool store: Store the final rate in the module EEPROM.
+        :param float timeout_s: Receive timeout while probing.
+        :return: The baud rate in use afterwards.
+        """
+        rates = sorted(rates or SerialBaudRate.DEFAULT_RATES, reverse=True)
+        for rate in rates:
+            if rate not in SerialBaudRate.CODES:
+                raise ValueError(f"Unsupported baud rate {rate}, supported are {sorted(SerialBaudRate.CODES)}")
+
+        current = SerialBaudRate.probe(interface, rates, module_id, timeout_s)
+        if current is None:
+            raise ConnectionError("No response from the module at any of the baud rates {}".format(rates))
+
+        original_timeout = interface.get_timeout()
+        interface.set_timeout(timeout_s)
+        try:
+            for rate in rates:
+                if rate <= current:
+                    break
+
+                logger.info("Trying %d baud.", rate)
+                try:
+                    # The reply is still sent at the current rate
+                    interface.set_global_parameter(SerialBaudRate.GP_SERIAL_BAUD_RATE, 0, SerialBaudRate.CODES[rate],
+                                                   module_id)
+                except (TMCLReplyError, ConnectionError, RuntimeError, OSError):
+                    # The module might have switched before the reply got lost
+                    SerialBaudRate._switch(interface, current)
+                    detected = SerialBaudRate.probe(interface, rates, module_id, timeout_s)
+                    if detected is None:
+                        raise ConnectionError(f"Lost the connection while switching to {rate} baud")
+                    if detected != rate:
+                        logger.info("Module rejected %d baud.", rate)
+                        current = detected
+                        continue
+
+                SerialBaudRate._switch(interface, rate)
+                if SerialBaudRate._check(interface, module_id, burst):
+                    current = rate
+                    break
+
+                logger.info("Verification at %d baud failed, falling back to %d baud.", rate, current)
+                try:
+                    # A corrupted reply still means the module received the request
+                    interface.set_global_parameter(SerialBaudRate.GP_SERIAL_BAUD_RATE, 0,
+                                                   SerialBaudRate.CODES[current], module_id)
+                except (TMCLReplyError, ConnectionError, RuntimeError, OSError):
+                    pass
+                SerialBaudRate._switch(interface, current)
+                if SerialBaudRate.probe(interface, [current], module_id, timeout_s) != current:
+                    raise ConnectionError(f"Lost the connection while falling back to {current} baud")
+
+            if store:
+                interface.send(TMCLCommand.STGP, SerialBaudRate.GP_SERIAL_BAUD_RATE, 0, 0, module_id)
+        finally:
+            interface.set_timeout(original_timeout)
+
+        logger.info("Using %d baud.", current)
+        return current
@@ -11,13 +11,15 @@ import logging
 from serial import Serial, SerialException
 import serial.tools.list_ports
 from ..connections.tmcl_interface import TmclInterface
-from ..tmcl import TMCLReplyChecksumError
+from ..tmcl import TMCLReplyChecksumError, TMCLTimeoutError
 
 
 class SerialTmclInterface(TmclInterface):
     """
     Opens a serial TMCL connection
     """
+    _checksum_replies = True
+
     def __init__(self, com_port, datarate=115200, host_id=2, module_id=1, timeout_s=5):
         if not isinstance(com_port, str):
             raise TypeError
@@ -72,7 +74,7 @@ class SerialTmclInterface(TmclInterface):
         data = self._serial.read(9)
 
         if len(data) != 9:
-            raise RuntimeError("TMCL datagram timed out")
+            raise TMCLTimeoutError("TMCL datagram timed out")
 
         return data
 
@@ -86,6 +88,17 @@ class SerialTmclInterface(TmclInterface):
     def get_timeout(self):
         return self._serial.timeout
 
+    def set_baudrate(self, baudrate):
+        """
+        Change the baud rate of the host side of the connection.
+        See SerialBaudRate for changing the baud rate of the module.
+        """
+        self._serial.baudrate = baudrate
+        self._baudrate = baudrate
+
+    def get_baudrate(self):
+        return self._baudrate
+
     @staticmethod
     def supports_tmcl():
         return True
@@ -104,5 +117,9 @@ class SerialTmclInterface(TmclInterface):
 
         return connected
 
+    @property
+    def port_id(self):
+        return "serial", self._serial.port
+
     def __str__(self):
         return "Connection: type={} port={} baudrate={}".format(type(self).__name__, self._serial.portstr, self._baudrate)
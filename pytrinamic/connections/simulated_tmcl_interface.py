@@ -0,0 +1,430 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import logging
+import re
+import time
+from collections import deque
+
+from ..tmcl import TMCLRequest, TMCLReply, TMCLCommand, TMCLStatus, TMCLTimeoutError
+from ..connections.tmcl_interface import TmclInterface
+
+
+class SimulatedModule:
+    """
+    Simulated TMCL module for the SimulatedTmclInterface.
+
+    The module keeps axis and global parameters, a register file per IC and
+    the RAMDebug state in memory. If a module class is given (e.g. TMCM1636),
+    only the axes and the axis/global parameters defined by that class are
+    accepted, other requests are answered with an error status like a real
+    module would do. The register files accept the addresses of the REG class
+    of the given IC classes (e.g. TMC5160), or any address without IC class.
+
+    Motion commands complete instantly: MVP sets the target and actual
+    position, ROR/ROL/MST set the target and actual velocity.
+    """
+
+    RAMDEBUG_CHANNELS = 4
+    RAMDEBUG_ELEMENTS = 2048
+    RAMDEBUG_FREQUENCY = 1000
+
+    def __init__(self, module_class=None, version=None, mc=None, drv=None, axes=None):
+        """
+        :param module_class: TMCLModule subclass to take the axes and the AP/GP
+            definitions from, e.g. TMCM6214. None accepts everything.
+        :param str version: 8 character firmware version string, e.g. "1636V100".
+            Per default derived from the module class name.
+        :param mc: IC class of the register file accessed by READ_MC/WRITE_MC.
+        :param drv: IC class of the register file accessed by READ_DRV/WRITE_DRV.
+        :param int axes: Number of axes if no module class is given.
+        """
+        self.axis_parameters = {}
+        self.global_parameters = {}
+        self.stored_axis_parameters = {}
+        self.stored_global_parameters = {}
+        self.io = {}
+        self.registers = {TMCLCommand.READ_MC: {}, TMCLCommand.READ_DRV: {}}
+
+        self._ap_index_bit_width = 8
+        self._aps = None
+        self._ap_names = None
+        self._gps = None
+
+        if module_class is not None:
+            module = module_class(None)
+            self._ap_index_bit_width = module.ap_index_bit_width
+            self._aps = [set(self._class_values(motor.AP).values()) for motor in module.motors]
+            self._ap_names = [self._class_values(motor.AP) for motor in module.motors]
+            self._gps = {}
+            for name, value in vars(module_class).items():
+                match = re.fullmatch(r"GP(\d*)", name)
+                if match and isinstance(value, type):
+                    self._gps[int(match.group(1) or 0)] = set(self._class_values(value).values())
+            if version is None:
+                digits = re.sub(r"\D", "", module_class.__name__)
+                version = f"{digits[:4]:0>4}V100"
+        elif axes is not None:
+            self._aps = [None] * axes
+
+        self.version = version or "0000V000"
+        if len(self.version) != 8:
+            raise ValueError(f"Invalid version string {self.version!r}, expected 8 characters!")
+
+        self._register_addresses = {
+            TMCLCommand.READ_MC: self._seed_registers(mc, self.registers[TMCLCommand.READ_MC]),
+            TMCLCommand.READ_DRV: self._seed_registers(drv, self.registers[TMCLCommand.READ_DRV]),
+        }
+
+        self._ramdebug_init()
+
+    @staticmethod
+    def _class_values(cls):
+        return {name: value for name, value in vars(cls).items() if not name.startswith("_") and isinstance(value, int)}
+
+    def _seed_registers(self, ic_class, registers):
+        if ic_class is None:
+            return None
+        addresses = set(self._class_values(ic_class.REG).values())
+        for address in addresses:
+            registers[(0, address)] = 0
+        return addresses
+
+    def _ap_name(self, axis, name):
+        if self._ap_names is None:
+            return None
+        return self._ap_names[axis].get(name)
+
+    # Request handling
+    def handle(self, request):
+        """
+        Execute a TMCLRequest and return the (status, value) of the reply.
+        """
+        handler = self._HANDLERS.get(request.command)
+        if handler is None:
+            return TMCLStatus.INVALID_COMMAND, 0
+        return handler(self, request)
+
+    def _decode_ap(self, request):
+        axis_bit_width = 16 - self._ap_index_bit_width
+        axis = request.motorBank & ((1 << axis_bit_width) - 1)
+        index = request.commandType | ((request.motorBank >> axis_bit_width) << 8)
+        if self._aps is not None:
+            if axis >= len(self._aps):
+                return None, None, TMCLStatus.INVALID_VALUE
+            if self._aps[axis] is not None and index not in self._aps[axis]:
+                return None, None, TMCLStatus.WRONG_TYPE
+        return axis, index, TMCLStatus.SUCCESS
+
+    def _sap(self, request):
+        axis, index, status = self._decode_ap(request)
+        if status == TMCLStatus.SUCCESS:
+            self.axis_parameters[(axis, index)] = request.value
+        return status, request.value
+
+    def _gap(self, request):
+        axis, index, status = self._decode_ap(request)
+        if status != TMCLStatus.SUCCESS:
+            return status, 0
+        return status, self.axis_parameters.get((axis, index), 0)
+
+    def _stap(self, request):
+        axis, index, status = self._decode_ap(request)
+        if status == TMCLStatus.SUCCESS:
+            self.stored_axis_parameters[(axis, index)] = self.axis_parameters.get((axis, index), 0)
+        return status, 0
+
+    def _check_gp(self, request):
+        if self._gps is None or request.motorBank == 2:
+            # Bank 2 holds the user variables
+            return TMCLStatus.SUCCESS
+        if request.commandType not in self._gps.get(request.motorBank, ()):
+            return TMCLStatus.WRONG_TYPE
+        return TMCLStatus.SUCCESS
+
+    def _sgp(self, request):
+        status = self._check_gp(request)
+        if status == TMCLStatus.SUCCESS:
+            self.global_parameters[(request.motorBank, request.commandType)] = request.value
+        return status, request.value
+
+    def _ggp(self, request):
+        status = self._check_gp(request)
+        if status != TMCLStatus.SUCCESS:
+            return status, 0
+        return status, self.global_parameters.get((request.motorBank, request.commandType), 0)
+
+    def _stgp(self, request):
+        status = self._check_gp(request)
+        if status == TMCLStatus.SUCCESS:
+            key = (request.motorBank, request.commandType)
+            self.stored_global_parameters[key] = self.global_parameters.get(key, 0)
+        return status, 0
+
+    def _set_motion(self, axis, **values):
+        for name, value in values.items():
+            index = self._ap_name(axis, name)
+            if index is not None:
+                self.axis_parameters[(axis, index)] = value & 0xFFFFFFFF
+
+    def _check_axis(self, axis):
+        return self._aps is None or axis < len(self._aps)
+
+    def _mvp(self, request):
+        axis = request.motorBank
+        if not self._check_axis(axis):
+            return TMCLStatus.INVALID_VALUE, 0
+        if request.commandType == 0:
+            position = request.value
+        elif request.commandType == 1:
+            index = self._ap_name(axis, "ActualPosition")
+            position = (self.axis_parameters.get((axis, index), 0) + request.value) & 0xFFFFFFFF
+        else:
+            return TMCLStatus.WRONG_TYPE, 0
+        self._set_motion(axis, TargetPosition=position, ActualPosition=position, PositionReachedFlag=1,
+                         TargetVelocity=0, ActualVelocity=0)
+        return TMCLStatus.SUCCESS, position
+
+    def _rotate(self, request, sign):
+        axis = request.motorBank
+        if not self._check_axis(axis):
+            return TMCLStatus.INVALID_VALUE, 0
+        velocity = sign * (request.value - (1 << 32) if request.value & 0x80000000 else request.value)
+        self._set_motion(axis, TargetVelocity=velocity, ActualVelocity=velocity, PositionReachedFlag=0)
+        return TMCLStatus.SUCCESS, request.value
+
+    def _ror(self, request):
+        return self._rotate(request, 1)
+
+    def _rol(self, request):
+        return self._rotate(request, -1)
+
+    def _mst(self, request):
+        return self._rotate(TMCLRequest(request.moduleAddress, request.command, 0, request.motorBank, 0), 1)
+
+    def _sio(self, request):
+        self.io[(request.motorBank, request.commandType)] = request.value
+        return TMCLStatus.SUCCESS, request.value
+
+    def _gio(self, request):
+        return TMCLStatus.SUCCESS, self.io.get((request.motorBank, request.commandType), 0)
+
+    def _register(self, request):
+        # Inverse of TmclInterface.read_register()/write_register()
+        read_command = {TMCLCommand.WRITE_MC: TMCLCommand.READ_MC,
+                        TMCLCommand.WRITE_DRV: TMCLCommand.READ_DRV}.get(request.command, request.command)
+        channel = request.motorBank & 0x0F
+        address = request.commandType | ((request.motorBank & 0xF0) << 4)
+        addresses = self._register_addresses[read_command]
+        if addresses is not None and address not in addresses:
+            return TMCLStatus.WRONG_TYPE, 0
+
+        registers = self.registers[read_command]
+        if request.command == read_command:
+            return TMCLStatus.SUCCESS, registers.get((channel, address), 0)
+        registers[(channel, address)] = request.value
+        return TMCLStatus.SUCCESS, request.value
+
+    def _firmware_version(self, request):
+        if request.commandType == 1:
+            major, minor = int(self.version[5]), int(self.version[6:8])
+            return TMCLStatus.SUCCESS, (int(self.version[:4]) << 16) | (major << 8) | minor
+        # The ASCII version replaces the whole reply, see TMCLReply.version_string()
+        return None, self.version
+
+    # RAMDebug
+    def _ramdebug_init(self):
+        self._ramdebug_channels = []
+        self._ramdebug_sample_count = self.RAMDEBUG_ELEMENTS
+        self._ramdebug_samples = []
+        self._ramdebug_state = 0
+
+    def _ramdebug_source(self, channel_type, value, tick):
+        if channel_type == 1:
+            return self.axis_parameters.get(((value >> 24) & 0xFF, value & 0x0FFF), 0)
+        if channel_type == 2:
+            return self.registers[TMCLCommand.READ_MC].get(((value >> 24) & 0x0F, value & 0xFFFF), 0)
+        if channel_type == 4:
+            return tick
+        if channel_type == 6:
+            return self.io.get((1, value & 0xFF), 0)
+        if channel_type == 8:
+            return self.global_parameters.get(((value >> 24) & 0xFF, value & 0xFF), 0)
+        return 0
+
+    def _ramdebug(self, request):
+        command, value = request.commandType, request.value
+        if command == 0:
+            self._ramdebug_init()
+        elif command == 1:
+            self._ramdebug_sample_count = min(value, self.RAMDEBUG_ELEMENTS)
+        elif command == 4:
+            if len(self._ramdebug_channels) >= self.RAMDEBUG_CHANNELS:
+                return TMCLStatus.INVALID_VALUE, 0
+            self._ramdebug_channels.append((request.motorBank, value))
+        elif command == 7:
+            # Trigger and capture instantly, each sample is the current value of its source
+            channels = self._ramdebug_channels or [(0, 0)]
+            self._ramdebug_samples = [self._ramdebug_source(*channels[i % len(channels)], i // len(channels))
+                                      & 0xFFFFFFFF for i in range(self._ramdebug_sample_count)]
+            self._ramdebug_state = 3
+        elif command == 8:
+            return TMCLStatus.SUCCESS, self._ramdebug_state
+        elif command == 9:
+            if value >= len(self._ramdebug_samples):
+                return TMCLStatus.INVALID_VALUE, 0
+            return TMCLStatus.SUCCESS, self._ramdebug_samples[value]
+        elif command == 10:
+            info = {0: self.RAMDEBUG_CHANNELS, 1: self.RAMDEBUG_ELEMENTS, 2: self.RAMDEBUG_FREQUENCY,
+                    3: len(self._ramdebug_samples)}
+            if value not in info:
+                return TMCLStatus.WRONG_TYPE, 0
+            return TMCLStatus.SUCCESS, info[value]
+        elif command == 14:
+            return TMCLStatus.SUCCESS, 0
+        elif command > 21:
+            return TMCLStatus.WRONG_TYPE, 0
+        return TMCLStatus.SUCCESS, 0
+
+    _HANDLERS = {
+        TMCLCommand.SAP: _sap,
+        TMCLCommand.GAP: _gap,
+        TMCLCommand.STAP: _stap,
+        TMCLCommand.SGP: _sgp,
+        TMCLCommand.GGP: _ggp,
+        TMCLCommand.STGP: _stgp,
+        TMCLCommand.MVP: _mvp,
+        TMCLCommand.ROR: _ror,
+        TMCLCommand.ROL: _rol,
+        TMCLCommand.MST: _mst,
+        TMCLCommand.SIO: _sio,
+        TMCLCommand.GIO: _gio,
+        TMCLCommand.WRITE_MC: _register,
+        TMCLCommand.READ_MC: _register,
+        TMCLCommand.WRITE_DRV: _register,
+        TMCLCommand.READ_DRV: _register,
+        TMCLCommand.GET_FIRMWARE_VERSION: _firmware_version,
+        TMCLCommand.RAMDEBUG: _ramdebug,
+    }
+
+
+class SimulatedTmclInterface(TmclInterface):
+    """
+    TMCL connection to simulated modules, for tests and benchmarks without
+    hardware.
+
+    The timing of a real link is modelled with a per-request latency of the
+    module and the transmission time of the datagrams: Each frame occupies the
+    link for bits_per_frame/datarate seconds. Requests queue up behind each
+    other on the link, so pipelined requests overlap their latencies like on
+    real hardware. A datarate of 0 disables the transmission time.
+
+    Requests to module IDs without a simulated module are not answered and
+    result in a receive timeout, without actually waiting.
+
+    Example:
+        interface = SimulatedTmclInterface(modules={1: SimulatedModule(TMCM1636), 2: SimulatedModule(TMCM6214)})
+        module = TMCM6214(interface, module_id=2)
+    """
+
+    def __init__(self, port="sim", datarate=0, host_id=2, module_id=1, timeout_s=5, modules=None, latency_s=0.0,
+                 bits_per_frame=90):
+        """
+        :param dict modules: SimulatedModule per module ID. Per default one
+            SimulatedModule without restrictions is created for [module_id].
+        :param float latency_s: Processing time of a module per request.
+        :param int bits_per_frame: Bits on the wire per datagram, e.g. 90 for
+            9 UART bytes with start and stop bit or ~111 for a CAN frame.
+        """
+        del timeout_s
+        if not isinstance(port, str):
+            raise TypeError
+
+        TmclInterface.__init__(self, host_id, module_id)
+
+        self.logger = logging.getLogger("{}.{}".format(self.__class__.__name__, port))
+
+        self._port = port
+        self.modules = modules if modules is not None else {module_id: SimulatedModule()}
+        self.latency_s = latency_s
+        self._frame_ns = int(bits_per_frame * 1e9 / datarate) if datarate else 0
+        self._latency_ns = int(latency_s * 1e9)
+        self._link_free_ns = 0
+        self._replies = deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        """
+        Close the connection at the end of a with-statement block.
+        """
+        del exit_type, value, traceback
+        self.close()
+
+    def close(self):
+        self._replies.clear()
+
+    def _send(self, host_id, module_id, data):
+        request = TMCLRequest.from_buffer(data)
+
+        now = time.perf_counter_ns()
+        sent = max(now, self._link_free_ns) + self._frame_ns
+        self._link_free_ns = sent
+
+        module = self.modules.get(module_id)
+        if module is None:
+            self._replies.append((sent, None))
+            return
+
+        status, value = module.handle(request)
+        if status is None:
+            reply = bytes([host_id]) + value.encode("ascii")
+        else:
+            reply = TMCLReply(host_id, module_id, status, request.command, value).to_buffer()
+        self._replies.append((sent + self._latency_ns + self._frame_ns, reply))
+
+    def _recv(self, host_id, module_id):
+        del host_id, module_id
+
+        if not self._replies:
+            raise TMCLTimeoutError(f"Recv timed out ({self.__class__.__name__}, no request pending)")
+
+        ready_ns, reply = self._replies.popleft()
+        if reply is None:
+            raise TMCLTimeoutError(f"Recv timed out ({self.__class__.__name__}, on port {self._port})")
+
+        delay_ns = ready_ns - time.perf_counter_ns()
+        if delay_ns > 0:
+            time.sleep(delay_ns / 1e9)
+
+        return bytearray(reply)
+
+    def add_module(self, module_id, module):
+        """
+        Add a SimulatedModule to the simulated bus.
+        """
+        self.modules[module_id] = module
+
+    @staticmethod
+    def supports_tmcl():
+        return True
+
+    @staticmethod
+    def list():
+        """
+            Return a list of available connection ports as a list of strings.
+
+            This function is required for using this interface with the
+            connection manager.
+        """
+        return ["sim"]
+
+    @property
+    def port_id(self):
+        return "simulated", self._port
+
+    def __str__(self):
+        return "Connection: type={}, modules={}".format(type(self).__name__, sorted(self.modules))
@@ -0,0 +1,48 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import socket
+
+from .broker_tmcl_interface import BrokerTmclInterface
+from .tmcl_broker import TmclBroker, parse_address
+
+
+class TcpTmclInterface(BrokerTmclInterface):
+    """
+    Opens a TMCL connection to a TmclBroker listening on a TCP port, e.g. on
+    an edge PC with the modules attached:
+
+        python -m pytrinamic.connections.tmcl_broker --interface usb_tmcl --listen 0.0.0.0:9393
+
+    Like the BrokerTmclInterface, requests are batched into one packet per
+    reply read, so pipelined requests (see pipeline()) pay the network round
+    trip time once per batch instead of once per request.
+    """
+
+    def __init__(self, port="localhost:{}".format(TmclBroker.DEFAULT_TCP_PORT), datarate=0, host_id=2, module_id=1,
+                 timeout_s=5):
+        """
+        :param str port: Address of the broker as "host:port" or "host". The
+            port defaults to TmclBroker.DEFAULT_TCP_PORT.
+        """
+        BrokerTmclInterface.__init__(self, port, datarate, host_id, module_id, timeout_s)
+
+    def _connect(self, port, timeout_s):
+        address = parse_address(port)
+        if not isinstance(address, tuple):
+            address = (port, TmclBroker.DEFAULT_TCP_PORT)
+        sock = socket.create_connection((address[0] or "localhost", address[1]), timeout_s)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    @staticmethod
+    def list():
+        """
+            Return a list of available connection ports as a list of strings.
+
+            Brokers on the network are not discovered, so the port has to be
+            given explicitly.
+        """
+        return []
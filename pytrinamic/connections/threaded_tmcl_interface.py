@@ -0,0 +1,233 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import queue
+import threading
+from concurrent.futures import Future
+
+from ..tmcl import TMCLRequest, TMCLCommand
+from .tmcl_interface import TmclInterface
+from .tmcl_pipeline import TmclPipeline
+
+
+class _ThreadedPipeline:
+    """
+    Pipeline front end of a ThreadedTmclInterface. The requests are handed to
+    the I/O thread, which keeps them in flight, so submit() never blocks.
+    """
+
+    def __init__(self, interface):
+        self._interface = interface
+        self._futures = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        del exit_type, value, traceback
+        self.flush()
+
+    def submit(self, request):
+        future = self._interface.submit(request)
+        self._futures.append(future)
+        return future
+
+    def send(self, opcode, op_type, motor, value, module_id=None):
+        return self.submit(self._interface._create_request(opcode, op_type, motor, value, module_id))
+
+    def flush(self):
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.exception()
+
+
+class ThreadedTmclInterface(TmclInterface):
+    """
+    Thread-safe front end for a TmclInterface.
+
+    A single I/O thread owns the wrapped interface and sends the requests of
+    all calling threads through a TmclPipeline, so up to [window] requests
+    (e.g. to different module IDs) are in flight at the same time. Callers
+    either block in the usual TmclInterface functions or use submit() to get a
+    concurrent.futures.Future of the reply.
+
+    The wrapped interface must not be used directly while it is owned by a
+    ThreadedTmclInterface. On a half-duplex RS485 bus use a window of 1.
+
+    If the I/O thread fails unexpectedly, all pending requests fail with that
+    error and further requests raise a ConnectionError.
+
+    Example:
+        with ThreadedTmclInterface(UsbTmclInterface("COM3")) as interface:
+            module = TMCM1636(interface)  # Safe to share between threads
+    """
+
+    _direct_io = False
+
+    def __init__(self, interface, window=8):
+        """
+        :param interface: The TmclInterface to take ownership of.
+        :param int window: Maximum number of requests in flight.
+        """
+        TmclInterface.__init__(self, interface._host_id, interface._default_module_id,
+                               interface._default_ap_index_bit_width)
+        self.logger = interface.logger
+
+        self._interface = interface
+        self._pipeline = TmclPipeline(interface, window)
+        self._queue = queue.Queue()
+        self._closed = False
+        self._failure = None
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=f"ThreadedTmclInterface({interface})", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        """
+        Close the connection at the end of a with-statement block.
+        """
+        del exit_type, value, traceback
+        self.close()
+
+    def close(self):
+        """
+        Finish all queued requests, stop the I/O thread and close the wrapped
+        interface.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        self._interface.close()
+
+    @property
+    def interface(self):
+        """The wrapped TmclInterface."""
+        return self._interface
+
+    def _run(self):
+        try:
+            self._serve()
+        except Exception as e:
+            self.logger.exception("The I/O thread failed.")
+            self._fail(e)
+
+    def _fail(self, exception):
+        with self._close_lock:
+            self._failure = exception
+        # Nothing is queued after the failure is set
+        self._pipeline.abort(exception)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(exception)
+
+    def _serve(self):
+        pipeline = self._pipeline
+        while True:
+            try:
+                # Only block on the queue if there is no reply to wait for
+                item = self._queue.get(block=pipeline.in_flight == 0)
+            except queue.Empty:
+                pipeline.receive()
+                continue
+
+            if item is None:
+                break
+
+            request, future, expect_reply = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                if expect_reply:
+                    tmcl_future = pipeline.submit(request)
+                else:
+                    pipeline.flush()
+                    self.logger.debug("Tx: %s", request)
+                    self._interface._send(self._host_id, request.moduleAddress, request.to_buffer())
+                    future.set_result(None)
+                    continue
+            except Exception as e:
+                future.set_exception(e)
+                continue
+
+            tmcl_future.add_done_callback(lambda done, future=future: self._resolve(done, future))
+
+        pipeline.flush()
+
+    @staticmethod
+    def _resolve(tmcl_future, future):
+        exception = tmcl_future.exception()
+        if exception:
+            future.set_exception(exception)
+        else:
+            future.set_result(tmcl_future.result())
+
+    def _put(self, request, expect_reply):
+        future = Future()
+        with self._close_lock:
+            if self._closed:
+                raise ConnectionError("Connection closed")
+            if self._failure is not None:
+                raise ConnectionError("The I/O thread failed") from self._failure
+            self._queue.put((request, future, expect_reply))
+        return future
+
+    def submit(self, request):
+        """
+        Queue a TMCLRequest and return a concurrent.futures.Future of its
+        TMCLReply. This function does not block.
+        """
+        return self._put(request, True)
+
+    def send_request(self, request):
+        return self.submit(request).result()
+
+    def pipeline(self, window=8):
+        """
+        Create a pipeline for this interface. The number of requests in flight
+        is limited by the window of the I/O thread, [window] is ignored.
+        """
+        del window
+        return _ThreadedPipeline(self)
+
+    def enable_statistics(self, statistics=None):
+        """
+        Start recording the statistics of the wrapped interface.
+        """
+        return self._interface.enable_statistics(statistics)
+
+    def disable_statistics(self):
+        self._interface.disable_statistics()
+
+    @property
+    def statistics(self):
+        return self._interface.statistics
+
+    def send_boot(self, module_id=None):
+        if not module_id:
+            module_id = self._default_module_id
+
+        self._put(TMCLRequest(module_id, TMCLCommand.BOOT, 0x81, 0x92, 0xA3B4C5D6), False).result()
+
+    @staticmethod
+    def supports_tmcl():
+        return True
+
+    @property
+    def port_id(self):
+        return self._interface.port_id
+
+    def __str__(self):
+        return "Threaded{}".format(self._interface)
@@ -0,0 +1,412 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import errno
+import logging
+import os
+import socket
+import stat
+import struct
+import sys
+import threading
+from collections import deque
+
+from ..tmcl import TMCLRequest, TMCLReplyChecksumError, TMCLReplyStatusError, TMCLTimeoutError
+from .tmcl_pipeline import TmclPipeline, TmclFuture
+
+logger = logging.getLogger(__name__)
+
+# Wire protocol: Each packet is a 16 bit big-endian item count followed by the
+# items. A request item is a flag byte (ITEM_REPLY or ITEM_NO_REPLY) and the
+# 9 byte request datagram. A reply item is a status byte (REPLY_*) and the 9
+# byte reply datagram. Replies are sent in the order of the requests of each
+# client and a client may send further packets before receiving the replies.
+PACKET_HEADER = struct.Struct(">H")
+ITEM_SIZE = 10
+MAX_ITEMS = 0xFFFF
+
+ITEM_REPLY = 0
+ITEM_NO_REPLY = 1
+
+REPLY_OK = 0
+REPLY_CHECKSUM_ERROR = 1
+REPLY_TIMEOUT = 2
+REPLY_LINK_ERROR = 3
+
+
+def recv_exact(sock, size):
+    """
+    Receive exactly [size] bytes, None if the connection has been closed.
+    """
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def parse_address(address):
+    """
+    Convert a "host:port" string into a TCP (host, port) tuple. Other strings
+    are returned unchanged as Unix domain socket paths.
+    """
+    if isinstance(address, str) and "/" not in address and "\\" not in address:
+        host, separator, port = address.rpartition(":")
+        if separator and port.isdigit():
+            return host.strip("[]"), int(port)
+    return address
+
+
+class _BrokerClient:
+
+    def __init__(self, sock, name):
+        self.socket = sock
+        self.name = name
+        self.pending = deque()
+        self.in_flight = deque()
+        self.closed = False
+
+
+class TmclBroker:
+    """
+    Shares one TmclInterface between many client processes.
+
+    The broker owns the physical connection and serves clients connected to
+    a Unix domain socket, e.g. with the BrokerTmclInterface, or to a TCP port,
+    e.g. with the TcpTmclInterface from remote hosts. The requests of
+    all clients are scheduled round-robin, one request per client in turn,
+    and sent through a TmclPipeline with up to [window] requests in flight,
+    so the bus stays busy regardless of the number of clients.
+
+    The Unix domain socket is only accessible by the user running the broker.
+    If serving the device fails, all requests in flight and all further
+    requests are answered with a link error.
+
+    The broker can run in the background (start()) or in the foreground
+    (serve_forever()). It can also be started from the command line:
+
+        python -m pytrinamic.connections.tmcl_broker --interface serial_tmcl --port COM3 --listen /tmp/tmcl.sock
+        python -m pytrinamic.connections.tmcl_broker --interface usb_tmcl --listen 0.0.0.0:9393
+    """
+
+    DEFAULT_ADDRESS = "/tmp/pytrinamic-tmcl.sock"
+    DEFAULT_TCP_PORT = 9393
+
+    def __init__(self, interface, address=DEFAULT_ADDRESS, window=8):
+        """
+        :param interface: The TmclInterface to share. It is closed with the broker.
+        :param address: Path of the Unix domain socket, or a TCP address as
+            (host, port) tuple or "host:port" string. Port 0 picks a free port.
+        :param int window: Maximum number of requests in flight on the interface.
+        """
+        self._interface = interface
+        self._pipeline = TmclPipeline(interface, window)
+        self._clients = []
+        self._next_client = 0
+        self._condition = threading.Condition()
+        self._closing = False
+        self._threads = []
+        self._failure = None
+        # Device and inode of the socket file this broker bound
+        self._socket_file = None
+
+        address = parse_address(address)
+        self._tcp = isinstance(address, tuple)
+        self._listener = self._listen(address)
+        # The actually bound address, e.g. with the port picked by the system
+        self._address = self._listener.getsockname()[:2] if self._tcp else address
+
+    def _listen(self, address):
+        if self._tcp:
+            return socket.create_server(address)
+        if os.path.exists(address):
+            self._remove_stale_socket(address)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(address)
+        # Restrict the access before listening, any client could drive the motors
+        os.chmod(address, stat.S_IRUSR | stat.S_IWUSR)
+        listener.listen()
+        status = os.stat(address)
+        self._socket_file = (status.st_dev, status.st_ino)
+        return listener
+
+    @staticmethod
+    def _remove_stale_socket(address):
+        """
+        Remove the socket file of a previous broker no longer listening. Other
+        files and the socket of a running broker are left alone.
+        """
+        if not stat.S_ISSOCK(os.stat(address).st_mode):
+            raise FileExistsError(errno.EEXIST, "Not a socket, refusing to replace it", address)
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(address)
+        except ConnectionRefusedError:
+            os.unlink(address)
+            return
+        finally:
+            probe.close()
+        raise OSError(errno.EADDRINUSE, "A TMCL broker is already listening on this socket", address)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        del exit_type, value, traceback
+        self.close()
+
+    @property
+    def address(self):
+        """The socket path or the TCP (host, port) the broker listens on."""
+        return self._address
+
+    def start(self):
+        """
+        Serve clients in background threads.
+        """
+        for target in (self._accept, self._serve_device):
+            thread = threading.Thread(target=target, name=f"TmclBroker {target.__name__}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def serve_forever(self):
+        """
+        Serve clients until close() is called or the process is interrupted.
+        """
+        accept_thread = threading.Thread(target=self._accept, name="TmclBroker _accept", daemon=True)
+        accept_thread.start()
+        self._threads.append(accept_thread)
+        try:
+            self._serve_device()
+        finally:
+            self.close()
+
+    def close(self):
+        with self._condition:
+            if self._closing:
+                return
+            self._closing = True
+            self._condition.notify_all()
+            clients = list(self._clients)
+
+        try:
+            # Wakes up the accept() call on Linux
+            self._listener.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._listener.close()
+        for client in clients:
+            try:
+                client.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            client.socket.close()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        self._cleanup()
+        self._interface.close()
+
+    def _cleanup(self):
+        if self._socket_file is None:
+            return
+        try:
+            status = os.stat(self._address)
+        except FileNotFoundError:
+            return
+        # Another broker may have replaced the socket file meanwhile
+        if (status.st_dev, status.st_ino) == self._socket_file:
+            os.unlink(self._address)
+
+    # Client handling
+    def _accept(self):
+        while True:
+            try:
+                sock, peer = self._listener.accept()
+            except OSError:
+                return
+            if self._tcp:
+                # Replies are written as one packet per batch, don't delay them
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                peer = "{}:{}".format(*peer[:2])
+            client = _BrokerClient(sock, peer or f"client {len(self._clients)}")
+            with self._condition:
+                if self._closing:
+                    sock.close()
+                    return
+                self._clients.append(client)
+            logger.info("Client %s connected.", client.name)
+            thread = threading.Thread(target=self._read_client, args=(client,), name=f"TmclBroker {client.name}",
+                                      daemon=True)
+            thread.start()
+
+    def _read_client(self, client):
+        try:
+            while True:
+                header = recv_exact(client.socket, PACKET_HEADER.size)
+                if header is None:
+                    break
+                count = PACKET_HEADER.unpack(header)[0]
+                data = recv_exact(client.socket, count * ITEM_SIZE)
+                if data is None:
+                    break
+                items = [(TMCLRequest.from_buffer(data[offset + 1:offset + ITEM_SIZE]), data[offset] == ITEM_REPLY)
+                         for offset in range(0, len(data), ITEM_SIZE)]
+                with self._condition:
+                    if self._failure is not None:
+                        self._reject(client, items)
+                        continue
+                    client.pending.extend(items)
+                    self._condition.notify_all()
+        except OSError:
+            pass
+        finally:
+            with self._condition:
+                client.closed = True
+                client.pending.clear()
+                self._condition.notify_all()
+            logger.info("Client %s disconnected.", client.name)
+
+    # Device handling
+    def _schedule(self, count):
+        """
+        Take up to [count] pending requests, one client at a time.
+        """
+        batch = []
+        clients = self._clients
+        while count > 0:
+            for offset in range(len(clients)):
+                client = clients[(self._next_client + offset) % len(clients)]
+                if client.pending:
+                    batch.append((client, *client.pending.popleft()))
+                    self._next_client = (self._next_client + offset + 1) % len(clients)
+                    count -= 1
+                    break
+            else:
+                break
+        return batch
+
+    def _serve_device(self):
+        try:
+            self._serve()
+        except Exception as e:
+            logger.exception("Serving the device failed.")
+            self._fail(e)
+
+    def _fail(self, exception):
+        self._pipeline.abort(exception)
+        with self._condition:
+            self._failure = exception
+            for client in self._clients:
+                items = list(client.pending)
+                client.pending.clear()
+                self._reject(client, items)
+
+    def _reject(self, client, items):
+        """
+        Answer the [items] of [client] with a link error after a failure.
+        Called with the condition held, so the replies stay in order.
+        """
+        exception = ConnectionError("The TMCL broker failed to serve the device")
+        exception.__cause__ = self._failure
+        for request, expect_reply in items:
+            if expect_reply:
+                future = TmclFuture(self._pipeline, request)
+                future._set_exception(exception)
+                client.in_flight.append(future)
+        self._send_client_replies(client)
+
+    def _serve(self):
+        pipeline = self._pipeline
+        interface = self._interface
+        while True:
+            with self._condition:
+                while (not self._closing and pipeline.in_flight == 0
+                       and not any(client.pending for client in self._clients)):
+                    self._condition.wait()
+                if self._closing:
+                    break
+                self._clients = [client for client in self._clients if not (client.closed and not client.in_flight)]
+                batch = self._schedule(pipeline.window - pipeline.in_flight)
+
+            for client, request, expect_reply in batch:
+                if expect_reply:
+                    try:
+                        future = pipeline.submit(request)
+                    except Exception as e:
+                        future = TmclFuture(pipeline, request)
+                        future._set_exception(e)
+                    client.in_flight.append(future)
+                else:
+                    pipeline.flush()
+                    self._send_replies()
+                    try:
+                        interface._send(interface._host_id, request.moduleAddress, request.to_buffer())
+                    except Exception as e:
+                        logger.warning("Failed to send %s: %s", request, e)
+
+            if pipeline.in_flight:
+                pipeline.receive()
+            self._send_replies()
+
+        pipeline.flush()
+
+    @staticmethod
+    def _encode_reply(future):
+        exception = future.exception()
+        if exception is None:
+            return bytes([REPLY_OK]) + future.result().to_buffer()
+        if isinstance(exception, TMCLReplyChecksumError):
+            return bytes([REPLY_CHECKSUM_ERROR]) + exception.reply.to_buffer()
+        if isinstance(exception, TMCLReplyStatusError):
+            # The client checks the status itself
+            return bytes([REPLY_OK]) + exception.reply.to_buffer()
+        status = REPLY_TIMEOUT if isinstance(exception, TMCLTimeoutError) else REPLY_LINK_ERROR
+        return bytes([status]) + bytes(9)
+
+    def _send_replies(self):
+        """
+        Send the replies of all finished requests, one packet per client.
+        """
+        for client in self._clients:
+            self._send_client_replies(client)
+
+    def _send_client_replies(self, client):
+        items = []
+        while client.in_flight and client.in_flight[0].done() and len(items) < MAX_ITEMS:
+            items.append(self._encode_reply(client.in_flight.popleft()))
+        if items and not client.closed:
+            try:
+                client.socket.sendall(PACKET_HEADER.pack(len(items)) + b"".join(items))
+            except OSError:
+                client.closed = True
+
+
+def main(argv=None):
+    import argparse
+    from .connection_manager import ConnectionManager
+
+    parser = argparse.ArgumentParser(description="Share a TMCL connection between multiple processes")
+    ConnectionManager.argparse(parser)
+    parser.add_argument("--listen", default=TmclBroker.DEFAULT_ADDRESS,
+                        help="Socket path or TCP host:port to serve the clients on (default: %(default)s)")
+    parser.add_argument("--window", type=int, default=8, help="Requests in flight on the bus (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    interface = ConnectionManager(argv if argv is not None else sys.argv[1:], "tmcl").connect()
+    broker = TmclBroker(interface, args.listen, args.window)
+    logger.info("Serving %s on %s.", interface, broker.address)
+    try:
+        broker.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
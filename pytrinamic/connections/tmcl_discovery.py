@@ -0,0 +1,192 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import logging
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from ..tmcl import TMCLCommand, TMCLReplyError
+from .. import connections
+from .connection_manager import ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+DiscoveredModule = namedtuple("DiscoveredModule", ["interface", "port", "module_id", "version", "module_type"])
+
+
+class TmclDiscovery:
+    """
+    Finds the TMCL modules connected to the available ports.
+
+    All ports of the selected interfaces are scanned concurrently. On each
+    port the module IDs are probed with a binary firmware version request
+    (GET_FIRMWARE_VERSION type 1) and a short receive timeout. Interfaces
+    with independent replies per module (CAN) probe [window] module IDs at
+    once, so a CAN bus is scanned in about len(module_ids) / window timeouts.
+    Other interfaces probe one module ID at a time.
+
+    A port listed by multiple interfaces (e.g. a USB serial port listed by
+    usb_tmcl and serial_tmcl) is scanned by one interface after the other,
+    until one of them finds modules.
+
+    Example:
+        for module in TmclDiscovery(["pcan_tmcl", "usb_tmcl"]).scan():
+            print(module)
+    """
+
+    # Interface names as used by the ConnectionManager, in scan order
+    DEFAULT_INTERFACES = ["usb_tmcl", "serial_tmcl", "pcan_tmcl", "kvaser_tmcl", "ixxat_tmcl", "socketcan_tmcl",
+                          "slcan_tmcl"]
+
+    def __init__(self, interfaces=None, module_ids=range(1, 256), timeout_s=0.05, window=32, host_id=2,
+                 data_rates=None, exclude=()):
+        """
+        :param interfaces: Interface names to scan, per default DEFAULT_INTERFACES.
+        :param module_ids: Module IDs to probe on each port.
+        :param float timeout_s: Receive timeout of the probe requests.
+        :param int window: Module IDs probed at once on CAN interfaces.
+        :param int host_id: TMCL host ID to use.
+        :param dict data_rates: Data rate per interface name, per default the
+            ConnectionManager defaults.
+        :param exclude: Ports not to scan, e.g. ports in use by other programs.
+        """
+        if window < 1:
+            raise ValueError(f"Value {window} for parameter window is outside the allowed range (1..)!")
+
+        specs = {name: (class_name, data_rate) for name, class_name, data_rate in ConnectionManager._INTERFACE_SPECS}
+        self._interfaces = OrderedDict()
+        for name in (interfaces if interfaces is not None else self.DEFAULT_INTERFACES):
+            if name not in specs:
+                raise ValueError("Invalid interface: {0:s}".format(name))
+            class_name, data_rate = specs[name]
+            data_rate = (data_rates or {}).get(name, data_rate)
+            self._interfaces[name] = (class_name, data_rate)
+
+        self.module_ids = list(module_ids)
+        self.timeout_s = timeout_s
+        self.window = window
+        self.host_id = host_id
+        self.exclude = set(exclude)
+
+    @staticmethod
+    def probe(interface, module_ids, window=32):
+        """
+        Probe the module IDs on an open TmclInterface.
+
+        The receive timeout of the interface determines how long each probe
+        waits for a reply.
+
+        :return: A list of (module_id, version, module_type) tuples of the
+            modules that replied. version is the firmware version string (e.g.
+            "1636V105") and module_type the module number (e.g. 1636). Both are
+            None if the module replied with an error.
+        """
+        if not interface._unordered_replies:
+            # A missing reply would shift the assignment of the following replies
+            window = 1
+
+        module_ids = list(module_ids)
+        found = []
+        for start in range(0, len(module_ids), window):
+            batch = module_ids[start:start + window]
+            with interface.pipeline(window) as pipeline:
+                futures = [pipeline.send(TMCLCommand.GET_FIRMWARE_VERSION, 1, 0, 0, module_id) for module_id in batch]
+
+            for module_id, future in zip(batch, futures):
+                exception = future.exception()
+                if exception is None:
+                    reply = future.result()
+                elif isinstance(exception, TMCLReplyError):
+                    reply = exception.reply
+                else:
+                    # No reply
+                    continue
+                if reply.module_address != module_id:
+                    # E.g. a module on a point-to-point link answering to any address
+                    continue
+                if exception is None:
+                    module_type, major, minor = reply.value >> 16, (reply.value >> 8) & 0xFF, reply.value & 0xFF
+                    found.append((module_id, "{:04d}V{:d}{:02d}".format(module_type, major, minor), module_type))
+                else:
+                    # A module replied, but doesn't support the request or the reply is corrupted
+                    found.append((module_id, None, None))
+        return found
+
+    def _scan_port(self, port, names):
+        for name in names:
+            class_name, data_rate = self._interfaces[name]
+            try:
+                interface = getattr(connections, class_name)(port, data_rate, self.host_id, 1, timeout_s=self.timeout_s)
+            except Exception as e:
+                logger.debug("Opening %s port %s failed: %s", name, port, e)
+                continue
+
+            try:
+                with interface:
+                    found = self.probe(interface, self.module_ids, self.window)
+            except Exception as e:
+                logger.info("Scanning %s port %s failed: %s", name, port, e)
+                continue
+
+            logger.info("Found %d modules on %s port %s.", len(found), name, port)
+            if found:
+                return [DiscoveredModule(name, port, *module) for module in found]
+        return []
+
+    def scan(self):
+        """
+        Scan all ports of the selected interfaces concurrently.
+
+        :return: A list of DiscoveredModule(interface, port, module_id,
+            version, module_type) tuples, see probe().
+        """
+        port_lists = ConnectionManager.list_all_connections(list(self._interfaces))
+
+        # Interfaces sharing a port have to take turns
+        ports = OrderedDict()
+        for name in self._interfaces:
+            for port in port_lists[name]:
+                if port not in self.exclude:
+                    ports.setdefault(port, []).append(name)
+
+        if not ports:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(ports), 32)) as executor:
+            results = executor.map(lambda item: self._scan_port(*item), ports.items())
+            return [module for result in results for module in result]
+
+    @staticmethod
+    def format_table(modules):
+        """
+        Format a list of DiscoveredModule as a text table.
+        """
+        rows = [("Interface", "Port", "Module ID", "Version", "Type")]
+        rows += [(module.interface, module.port, str(module.module_id), module.version or "?",
+                  "?" if module.module_type is None else str(module.module_type)) for module in modules]
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Find the TMCL modules connected to this computer")
+    parser.add_argument("--interface", dest="interfaces", action="append",
+                        help="Interface to scan, can be given multiple times (default: {})".format(
+                            ", ".join(TmclDiscovery.DEFAULT_INTERFACES)))
+    parser.add_argument("--first-id", type=int, default=1, help="First module ID to probe (default: %(default)s)")
+    parser.add_argument("--last-id", type=int, default=255, help="Last module ID to probe (default: %(default)s)")
+    parser.add_argument("--timeout", dest="timeout_s", type=float, default=0.05,
+                        help="Probe timeout in seconds (default: %(default)s)")
+    parser.add_argument("--no-port", dest="exclude", action="append", default=[], help="Port not to scan")
+    args = parser.parse_args(argv)
+
+    discovery = TmclDiscovery(args.interfaces, range(args.first_id, args.last_id + 1), args.timeout_s,
+                              exclude=args.exclude)
+    print(TmclDiscovery.format_table(discovery.scan()))
+
+
+if __name__ == "__main__":
+    main()
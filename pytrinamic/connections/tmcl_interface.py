@@ -9,8 +9,24 @@
 import logging
 import warnings
 from abc import ABC
-from ..tmcl import TMCL, TMCLRequest, TMCLCommand, TMCLReply, TMCLReplyChecksumError, TMCLReplyStatusError
+from collections import namedtuple
+from ..tmcl import (TMCL, TMCLRequest, TMCLCommand, TMCLReply, TMCLReplyError, TMCLReplyChecksumError,
+                    TMCLReplyStatusError)
 from ..helpers import to_signed_32
+from .tmcl_pipeline import TmclPipeline
+from .tmcl_statistics import TmclStatistics
+from .tmcl_prepared_request import PreparedTmclRequest
+
+ParameterReply = namedtuple("ParameterReply", ["index", "axis", "module_id", "value", "status"])
+
+
+def _error_status(exc):
+    """
+    The ParameterReply status of a failed reply, None if the checksum was wrong.
+    """
+    if isinstance(exc, TMCLReplyChecksumError):
+        return None
+    return exc.reply.status
 
 
 class TmclInterface(ABC):
@@ -31,6 +47,14 @@ class TmclInterface(ABC):
 
     """
 
+    # Prepared requests may use _send()/_recv() directly (see prepare())
+    _direct_io = True
+    # The replies carry a valid checksum that is checked by _reply_check()
+    _checksum_replies = False
+    # Replies of modules that don't answer don't delay the replies of other
+    # modules, so requests to unknown module IDs can be pipelined (see _match_reply())
+    _unordered_replies = False
+
     def __init__(self, host_id=2, default_module_id=1, default_ap_index_bit_width=8):
         """
         :param int host_id: The ID of the TMCL host. This ID is the same for each module
@@ -54,6 +78,12 @@ class TmclInterface(ABC):
 
         self._default_ap_index_bit_width = default_ap_index_bit_width
 
+        # Reused transmit buffer of send_request()
+        self._tx_buffer = bytearray(9)
+
+        # Optional request statistics, see enable_statistics()
+        self._statistics = None
+
     def _send(self, host_id, module_id, data):
         """
         Send the bytearray [data] representing a TMCL command. The length of
@@ -82,32 +112,86 @@ class TmclInterface(ABC):
         """
         pass
 
-    def send_request(self, request):
+    def _match_reply(self, requests, reply):
         """
-        Send a TMCL_Request and read back a TMCL_Reply. This function blocks until
-        the reply has been received.
+        Find the request a received reply belongs to.
+
+        This is used when multiple requests are in flight, see pipeline().
+        Per default the replies arrive in the same order the requests have
+        been sent, so the reply always belongs to the oldest request.
+
+        :param requests: List of the TMCLRequests in flight, oldest first.
+        :param reply: The TMCLReply received.
+        :return: Index of the matching request or None if the reply does not
+            belong to any of the requests.
         """
-        self.logger.debug("Tx: %s", request)
+        del requests, reply
+        return 0
 
-        self._send(self._host_id, request.moduleAddress, request.to_buffer())
-        reply = TMCLReply.from_buffer(self._recv(self._host_id, request.moduleAddress))
+    def _handle_reply(self, request, reply):
+        """
+        Log and check a reply received for the given request.
 
+        Raises a TMCLReplyError if the reply indicates a failure.
+        """
         self.logger.debug("Rx: %s", reply)
 
         self._reply_check(reply)
 
         # Status codes below 100 indicate an error response.
-        # Ignore status when reading TMCL memory. 
+        # Ignore status when reading TMCL memory.
         if reply.status < 100 and request.command != TMCLCommand.READ_TMCL_MEMORY:
             raise TMCLReplyStatusError(reply)
 
+    def send_request(self, request):
+        """
+        Send a TMCL_Request and read back a TMCL_Reply. This function blocks until
+        the reply has been received.
+        """
+        if self._statistics is not None:
+            return self._statistics.measure(self._send_request, request)
+        return self._send_request(request)
+
+    def _send_request(self, request):
+        self.logger.debug("Tx: %s", request)
+
+        request.pack_into(self._tx_buffer)
+        self._send(self._host_id, request.moduleAddress, self._tx_buffer)
+        reply = TMCLReply.from_buffer(self._recv(self._host_id, request.moduleAddress))
+
+        self._handle_reply(request, reply)
+
         return reply
 
-    def send(self, opcode, op_type, motor, value, module_id=None):
+    def enable_statistics(self, statistics=None):
         """
-        Send a TMCL datagram and read back a reply. This function blocks until
-        the reply has been received.
+        Start recording request counters and latencies.
+
+        :param statistics: TmclStatistics object to record into, e.g. to
+            combine multiple interfaces. Per default a new one is created.
+        :return: The TmclStatistics object.
         """
+        self._statistics = statistics if statistics is not None else TmclStatistics()
+        return self._statistics
+
+    def disable_statistics(self):
+        self._statistics = None
+
+    @property
+    def statistics(self):
+        """The TmclStatistics object or None if the statistics are disabled."""
+        return self._statistics
+
+    @property
+    def port_id(self):
+        """
+        Hashable identity of the bus port the interface is connected to, e.g.
+        the serial port name, or None if unknown. Interfaces with the same
+        port_id reach the same modules.
+        """
+        return None
+
+    def _create_request(self, opcode, op_type, motor, value, module_id=None):
         if any(not isinstance(arg, int) for arg in [opcode, op_type, motor, value]):
             raise TypeError("Expected integer values!")
 
@@ -115,9 +199,58 @@ class TmclInterface(ABC):
         if not module_id:
             module_id = self._default_module_id
 
-        request = TMCLRequest(module_id, opcode, op_type, motor, value)
+        return TMCLRequest(module_id, opcode, op_type, motor, value)
 
-        return self.send_request(request)
+    def send(self, opcode, op_type, motor, value, module_id=None):
+        """
+        Send a TMCL datagram and read back a reply. This function blocks until
+        the reply has been received.
+        """
+        return self.send_request(self._create_request(opcode, op_type, motor, value, module_id))
+
+    def pipeline(self, window=8):
+        """
+        Create a TmclPipeline for this interface.
+
+        The pipeline keeps up to [window] requests in flight instead of waiting
+        for each reply before sending the next request. Use it as a context
+        manager, all outstanding replies are collected when the block is left:
+
+            with interface.pipeline(window=8) as pipeline:
+                futures = [pipeline.send(TMCLCommand.GAP, index, 0, 0) for index in range(40)]
+            values = [future.result().value for future in futures]
+
+        :param int window: Maximum number of requests in flight.
+        """
+        return TmclPipeline(self, window)
+
+    def prepare(self, opcode, op_type, motor, value=0, module_id=None, signed=False):
+        """
+        Validate and encode a TMCL command once and return a
+        PreparedTmclRequest handle for sending it repeatedly:
+
+            get_position = interface.prepare(TMCLCommand.GAP, 1, 0, signed=True)
+            while True:
+                position = get_position()
+
+        :param bool signed: Interpret the reply values as signed 32 bit integers.
+        """
+        return PreparedTmclRequest(self, self._create_request(opcode, op_type, motor, value, module_id), signed)
+
+    def prepare_get_axis_parameter(self, index, axis, module_id=None, signed=False, index_bit_width=None):
+        """
+        Return a PreparedTmclRequest reading an axis parameter, see prepare().
+        """
+        request = self._create_ap_request(TMCLCommand.GAP, index, axis, 0, module_id, self._ap_encoding(index_bit_width))
+        return PreparedTmclRequest(self, request, signed)
+
+    def prepare_set_axis_parameter(self, index, axis, module_id=None, index_bit_width=None):
+        """
+        Return a PreparedTmclRequest writing the value it is called with to an
+        axis parameter, see prepare().
+        """
+        request = self._create_ap_request(TMCLCommand.SAP, index, axis, 0, module_id, self._ap_encoding(index_bit_width))
+        return PreparedTmclRequest(self, request)
 
     def send_boot(self, module_id=None):
         """
@@ -168,7 +301,11 @@ class TmclInterface(ABC):
         warnings.warn("Function set_parameter() is going te be removed in future versions of pytrinamic!", FutureWarning)
         return self.send(p_command, p_type, p_axis, p_value, module_id)
 
-    def _send_ap_cmd(self, cmd, index, axis, value, module_id, index_bit_width):
+    def _ap_encoding(self, index_bit_width):
+        """
+        Return the (index limit, axis limit, index shift, index mask) used to
+        encode axis parameter indices wider than 8 bit into the motor byte.
+        """
         if not index_bit_width:
             index_bit_width = self._default_ap_index_bit_width
 
@@ -176,17 +313,101 @@ class TmclInterface(ABC):
             raise ValueError(f"Value {index_bit_width} for parameter index_bit_width is outside the allowed range (8..15)!")
 
         axis_bit_width = 16 - index_bit_width
+        return 2**index_bit_width, 2**axis_bit_width, 8 - axis_bit_width, ((2**index_bit_width) - 1) << 8
+
+    def _create_ap_request(self, cmd, index, axis, value, module_id, encoding):
+        index_limit, axis_limit, index_shift, index_mask = encoding
 
-        if index >= 2**index_bit_width:
-            raise ValueError(f"Value {index} for parameter index is outside the allowed range (0..{2**index_bit_width - 1})!")
-        if axis >= 2**axis_bit_width:
-            raise ValueError(f"Value {axis} for parameter axis is outside the allowed range (0..{2**axis_bit_width - 1})!")
+        if index >= index_limit:
+            raise ValueError(f"Value {index} for parameter index is outside the allowed range (0..{index_limit - 1})!")
+        if axis >= axis_limit:
+            raise ValueError(f"Value {axis} for parameter axis is outside the allowed range (0..{axis_limit - 1})!")
 
-        index_shift = 8 - axis_bit_width
-        index_mask = ((2**index_bit_width) - 1) << 8
         tmcl_motor = axis | ((index & index_mask) >> index_shift)
         tmcl_type = index & 0xFF
-        return self.send(cmd, tmcl_type, tmcl_motor, value, module_id)
+        return self._create_request(cmd, tmcl_type, tmcl_motor, value, module_id)
+
+    def _send_ap_cmd(self, cmd, index, axis, value, module_id, index_bit_width):
+        return self.send_request(self._create_ap_request(cmd, index, axis, value, module_id,
+                                                         self._ap_encoding(index_bit_width)))
+
+    def _send_parameter_requests(self, requests, parameters, signed, window):
+        """
+        Send pre-encoded parameter requests through a pipeline and collect the
+        replies as a list of ParameterReply tuples. Failed replies are reported
+        per parameter, link errors fail the whole call.
+        """
+        with self.pipeline(window) as pipeline:
+            futures = [pipeline.submit(request) for request in requests]
+
+        replies = []
+        for (index, axis), request, future in zip(parameters, requests, futures):
+            try:
+                reply = future.result()
+            except TMCLReplyError as exc:
+                replies.append(ParameterReply(index, axis, request.moduleAddress, None, _error_status(exc)))
+            else:
+                value = to_signed_32(reply.value) if signed else reply.value
+                replies.append(ParameterReply(index, axis, request.moduleAddress, value, reply.status))
+        return replies
+
+    # Bulk axis parameter access functions
+    def get_axis_parameters(self, parameters, module_id=None, signed=False, index_bit_width=None, window=8):
+        """
+        Read many axis parameters with pipelined requests.
+
+        All requests are encoded up front and sent with up to [window]
+        requests in flight, see pipeline().
+
+        :param parameters: Iterable of (index, axis) or (index, axis, module_id)
+            rows, e.g. a list of tuples or a NumPy integer array with two or
+            three columns. Rows without a module ID use [module_id].
+        :param int module_id: Module ID for rows without one.
+        :param bool signed: Interpret the values as signed 32 bit integers.
+        :param int index_bit_width: Axis parameter index bit-width.
+        :param int window: Maximum number of requests in flight.
+        :return: List of ParameterReply(index, axis, module_id, value, status)
+            in the order of [parameters]. If a module replied with an error
+            status the value is None. If a reply had a wrong checksum the value
+            and the status are None.
+        :raises ConnectionError: On a link failure, e.g. a timeout. The replies
+            following it can't be assigned, so no replies are returned.
+        """
+        encoding = self._ap_encoding(index_bit_width)
+        rows = []
+        requests = []
+        for row in parameters:
+            index, axis = int(row[0]), int(row[1])
+            row_module_id = int(row[2]) if len(row) > 2 else module_id
+            rows.append((index, axis))
+            requests.append(self._create_ap_request(TMCLCommand.GAP, index, axis, 0, row_module_id, encoding))
+
+        return self._send_parameter_requests(requests, rows, signed, window)
+
+    def set_axis_parameters(self, parameters, module_id=None, index_bit_width=None, window=8):
+        """
+        Write many axis parameters with pipelined requests.
+
+        :param parameters: Iterable of (index, axis, value) or
+            (index, axis, value, module_id) rows.
+        :param int module_id: Module ID for rows without one.
+        :param int index_bit_width: Axis parameter index bit-width.
+        :param int window: Maximum number of requests in flight.
+        :return: List of ParameterReply(index, axis, module_id, value, status)
+            in the order of [parameters], failed replies as in
+            get_axis_parameters().
+        :raises ConnectionError: On a link failure, e.g. a timeout.
+        """
+        encoding = self._ap_encoding(index_bit_width)
+        rows = []
+        requests = []
+        for row in parameters:
+            index, axis, value = int(row[0]), int(row[1]), int(row[2])
+            row_module_id = int(row[3]) if len(row) > 3 else module_id
+            rows.append((index, axis))
+            requests.append(self._create_ap_request(TMCLCommand.SAP, index, axis, value, row_module_id, encoding))
+
+        return self._send_parameter_requests(requests, rows, False, window)
 
     # Axis parameter access functions
     def get_axis_parameter(self, index, axis, module_id=None, signed=False, index_bit_width=None):
@@ -245,6 +466,15 @@ class TmclInterface(ABC):
     def read_drv(self, register_address, module_id=None, signed=False):
         return self.read_register(register_address, TMCLCommand.READ_DRV, 1, module_id, signed)
 
+    def read_mc_registers(self, register_addresses, module_id=None, signed=False, window=8):
+        return self.read_registers(register_addresses, TMCLCommand.READ_MC, 0, module_id, signed, window)
+
+    def read_drv_registers(self, register_addresses, module_id=None, signed=False, window=8):
+        return self.read_registers(register_addresses, TMCLCommand.READ_DRV, 1, module_id, signed, window)
+
+    def access_mc_registers(self, accesses, module_id=None, window=8):
+        return self.access_registers(accesses, TMCLCommand.READ_MC, TMCLCommand.WRITE_MC, 0, module_id, window)
+
     def read_register(self, register_address, command, channel, module_id=None, signed=False):
         tmcl_motor = (channel & 0x0F) | ((register_address & 0x0F00) >> 4)
         tmcl_type = register_address & 0xFF
@@ -256,6 +486,45 @@ class TmclInterface(ABC):
         tmcl_type = register_address & 0xFF
         return self.send(command, tmcl_type, tmcl_motor, value, module_id)
 
+    def read_registers(self, register_addresses, command, channel, module_id=None, signed=False, window=8):
+        """
+        Read many registers with pipelined requests, see pipeline().
+
+        :param register_addresses: Iterable of register addresses.
+        :param int window: Maximum number of requests in flight.
+        :return: List of the register values in the order of [register_addresses].
+        """
+        with self.pipeline(window) as pipeline:
+            futures = []
+            for register_address in register_addresses:
+                tmcl_motor = (channel & 0x0F) | ((register_address & 0x0F00) >> 4)
+                futures.append(pipeline.send(command, register_address & 0xFF, tmcl_motor, 0, module_id))
+
+        values = [future.result().value for future in futures]
+        return [to_signed_32(value) for value in values] if signed else values
+
+    def access_registers(self, accesses, read_command, write_command, channel, module_id=None, window=8):
+        """
+        Send a sequence of register reads and writes with pipelined requests,
+        see pipeline(). The module executes them in the given order, e.g. a
+        selector register write followed by a data register read.
+
+        :param accesses: Iterable of (register_address, value) tuples. A value
+            of None reads the register, other values are written.
+        :param int window: Maximum number of requests in flight.
+        :return: List of the reply values in the order of [accesses].
+        """
+        with self.pipeline(window) as pipeline:
+            futures = []
+            for register_address, value in accesses:
+                tmcl_motor = (channel & 0x0F) | ((register_address & 0x0F00) >> 4)
+                if value is None:
+                    futures.append(pipeline.send(read_command, register_address & 0xFF, tmcl_motor, 0, module_id))
+                else:
+                    futures.append(pipeline.send(write_command, register_address & 0xFF, tmcl_motor, value, module_id))
+
+        return [future.result().value for future in futures]
+
     # Motion control functions
     def rotate(self, motor, velocity, module_id=None):
         return self.send(TMCLCommand.ROR, 0, motor, velocity, module_id)
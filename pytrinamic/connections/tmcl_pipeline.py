@@ -0,0 +1,206 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import time
+
+from ..tmcl import TMCLReply, TMCLReplyError
+
+
+class TmclFuture:
+    """
+    The pending reply of a request submitted to a TmclPipeline.
+
+    Calling result() on a future that is not done yet receives replies from
+    the pipeline until this future has been resolved.
+    """
+
+    def __init__(self, pipeline, request):
+        self.request = request
+        self._pipeline = pipeline
+        self._done = False
+        self._reply = None
+        self._exception = None
+        self._callbacks = []
+        # Only set with statistics enabled
+        self._start_ns = None
+
+    def done(self):
+        return self._done
+
+    def result(self):
+        """
+        Return the TMCLReply of the request.
+
+        Raises the TMCLReplyError or connection error that occurred while
+        receiving the reply.
+        """
+        while not self._done:
+            self._pipeline.receive()
+        if self._exception:
+            raise self._exception
+        return self._reply
+
+    def exception(self):
+        while not self._done:
+            self._pipeline.receive()
+        return self._exception
+
+    def add_done_callback(self, fn):
+        """
+        Call fn(future) once the future is done. If the future is already
+        done, fn is called immediately.
+        """
+        if self._done:
+            fn(self)
+        else:
+            self._callbacks.append(fn)
+
+    def _set_reply(self, reply):
+        self._reply = reply
+        self._finish()
+
+    def _set_exception(self, exception):
+        self._exception = exception
+        self._finish()
+
+    def _finish(self):
+        self._done = True
+        callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn(self)
+
+
+class TmclPipeline:
+    """
+    Keeps multiple TMCL requests in flight on one TmclInterface.
+
+    Instead of waiting for the reply of each request before sending the next
+    one, up to [window] requests are sent ahead. Each received reply is
+    matched to its request by the interface (see TmclInterface._match_reply()),
+    which is in send order for serial and USB connections and by module
+    address and opcode for CAN.
+
+    A pipeline is not thread-safe and the interface must not be used for
+    other requests while the pipeline has requests in flight.
+
+    Note that on a half-duplex RS485 bus the modules must not reply while the
+    host is still sending. Use a window of 1 there if replies get corrupted.
+    """
+
+    def __init__(self, interface, window=8):
+        if window < 1:
+            raise ValueError(f"Value {window} for parameter window is outside the allowed range (1..)!")
+
+        self._interface = interface
+        self._window = window
+        self._requests = []
+        self._futures = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        """
+        Collect all outstanding replies at the end of a with-statement block.
+        """
+        del exit_type, value, traceback
+        self.flush()
+
+    @property
+    def window(self):
+        return self._window
+
+    @property
+    def in_flight(self):
+        """Number of requests sent for which no reply has been received yet."""
+        return len(self._futures)
+
+    def submit(self, request):
+        """
+        Send a TMCLRequest and return a TmclFuture for its reply.
+
+        Blocks for the oldest reply if the window is full.
+        """
+        while len(self._futures) >= self._window:
+            self.receive()
+
+        self._interface.logger.debug("Tx: %s", request)
+        self._interface._send(self._interface._host_id, request.moduleAddress, request.to_buffer())
+
+        future = TmclFuture(self, request)
+        if self._interface._statistics is not None:
+            future._start_ns = time.perf_counter_ns()
+        self._requests.append(request)
+        self._futures.append(future)
+        return future
+
+    def send(self, opcode, op_type, motor, value, module_id=None):
+        """
+        Send a TMCL datagram and return a TmclFuture for its reply.
+        """
+        return self.submit(self._interface._create_request(opcode, op_type, motor, value, module_id))
+
+    def receive(self):
+        """
+        Receive one reply and resolve the future of the matching request.
+
+        If receiving fails (e.g. on a timeout) the assignment of the following
+        replies is unknown, so all futures in flight fail with that error.
+        """
+        if not self._futures:
+            raise RuntimeError("No TMCL requests in flight")
+
+        interface = self._interface
+        try:
+            data = interface._recv(interface._host_id, self._requests[0].moduleAddress)
+        except Exception as e:
+            self.abort(e)
+            return
+
+        reply = TMCLReply.from_buffer(data)
+        index = interface._match_reply(self._requests, reply)
+        if index is None:
+            interface.logger.warning("Dropping reply without matching request: %s", reply)
+            return
+
+        request = self._requests.pop(index)
+        future = self._futures.pop(index)
+        try:
+            interface._handle_reply(request, reply)
+        except TMCLReplyError as e:
+            self._record(future, e)
+            future._set_exception(e)
+        except Exception as e:
+            # The future is no longer in flight, fail it before passing the error on
+            future._set_exception(e)
+            raise
+        else:
+            self._record(future)
+            future._set_reply(reply)
+
+    def abort(self, exception):
+        """
+        Fail all futures in flight with [exception], e.g. after the connection
+        has been lost.
+        """
+        futures = self._futures
+        self._requests = []
+        self._futures = []
+        for future in futures:
+            self._record(future, exception)
+            future._set_exception(exception)
+
+    def _record(self, future, exception=None):
+        statistics = self._interface._statistics
+        # Requests submitted before the statistics were enabled have no start time
+        if statistics is not None and future._start_ns is not None:
+            statistics.record(future.request, time.perf_counter_ns() - future._start_ns, exception)
+
+    def flush(self):
+        """
+        Receive the replies of all requests in flight.
+        """
+        while self._futures:
+            self.receive()
@@ -0,0 +1,76 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import logging
+import struct
+
+from ..tmcl import TMCLRequest, TMCLReply, _value_byte_sum
+
+_VALUE_STRUCT = struct.Struct(">I")
+
+
+class PreparedTmclRequest:
+    """
+    A validated and pre-encoded TMCL request for repeated use in hot loops,
+    see TmclInterface.prepare().
+
+    Calling the handle sends the cached datagram, optionally with a new value
+    patched in, and returns only the value of the reply. Error replies raise
+    the same TMCLReplyError exceptions as send_request().
+
+    On interfaces with direct I/O the datagram is written with _send() and the
+    reply read with _recv() without creating request/reply objects and
+    without debug logging. Otherwise (e.g. on thread-safe interfaces, with
+    statistics or debug logging enabled) the handle falls back to
+    send_request().
+    """
+
+    __slots__ = ("_interface", "_buffer", "_header_sum", "_host_id", "_module_id", "_signed", "_direct",
+                 "_check_checksum")
+
+    def __init__(self, interface, request, signed=False):
+        self._interface = interface
+        self._buffer = bytearray(request.to_buffer())
+        self._header_sum = request.moduleAddress + request.command + request.commandType + request.motorBank
+        self._host_id = interface._host_id
+        self._module_id = request.moduleAddress
+        self._signed = signed
+        self._direct = interface._direct_io and not interface.logger.isEnabledFor(logging.DEBUG)
+        self._check_checksum = interface._checksum_replies
+
+    @property
+    def request(self):
+        """The TMCLRequest with the most recently sent value."""
+        return TMCLRequest.from_buffer(self._buffer)
+
+    def __call__(self, value=None):
+        """
+        Send the request and return the value of the reply.
+
+        :param int value: New value of the request. None resends the previous value.
+        """
+        buffer = self._buffer
+        if value is not None:
+            value &= 0xFFFFFFFF
+            _VALUE_STRUCT.pack_into(buffer, 4, value)
+            buffer[8] = (self._header_sum + _value_byte_sum(value)) & 0xFF
+
+        interface = self._interface
+        if self._direct and interface._statistics is None:
+            interface._send(self._host_id, self._module_id, buffer)
+            data = interface._recv(self._host_id, self._module_id)
+            if data[2] < 100 or (self._check_checksum and (sum(data[:8]) & 0xFF) != data[8]):
+                # Error reply, let the interface raise the appropriate exception
+                interface._handle_reply(self.request, TMCLReply.from_buffer(data))
+            result = _VALUE_STRUCT.unpack_from(data, 4)[0]
+        else:
+            result = interface.send_request(self.request).value
+
+        if self._signed and result & 0x80000000:
+            result -= 0x100000000
+        return result
+
+    def __str__(self):
+        return "Prepared {}".format(self.request)
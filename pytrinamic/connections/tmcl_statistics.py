@@ -0,0 +1,213 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import copy
+import threading
+import time
+from collections import defaultdict
+
+from ..tmcl import TMCLReplyChecksumError, TMCLReplyStatusError, TMCLTimeoutError
+
+# Latency buckets: Exact below 16 ns, above that 8 logarithmic sub-buckets per
+# power of two, i.e. a resolution of 12.5%.
+_SUB_BUCKET_BITS = 3
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_LINEAR_BUCKETS = 2 * _SUB_BUCKETS
+
+
+def _bucket_index(value):
+    if value < _LINEAR_BUCKETS:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    return _LINEAR_BUCKETS + (shift - 1) * _SUB_BUCKETS + (value >> shift) - _SUB_BUCKETS
+
+
+def _bucket_range(index):
+    if index < _LINEAR_BUCKETS:
+        return index, index + 1
+    shift = (index - _LINEAR_BUCKETS) // _SUB_BUCKETS + 1
+    mantissa = (index - _LINEAR_BUCKETS) % _SUB_BUCKETS + _SUB_BUCKETS
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class TmclStatistics:
+    """
+    Request counters and round-trip latency histograms of a TmclInterface.
+
+    Enable the statistics with TmclInterface.enable_statistics(). Every request
+    sent with send_request() or through a pipeline is counted per opcode and
+    per module ID. The latency from sending a request until its reply has been
+    received is recorded in logarithmic histograms with a resolution of 12.5%.
+
+    Failed requests are counted as timeouts (TMCLTimeoutError), link
+    errors (any other failure of the connection), checksum errors or status
+    errors (the module replied with an error status).
+
+    Example:
+        statistics = interface.enable_statistics()
+        ...
+        print(statistics.snapshot())
+        print(statistics.latency_percentile(99, TMCLCommand.GAP))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clear all counters and histograms.
+        """
+        with self._lock:
+            self.requests = defaultdict(int)
+            self.modules = defaultdict(int)
+            self.timeouts = 0
+            self.link_errors = 0
+            self.checksum_errors = 0
+            self.status_errors = 0
+            self._histograms = defaultdict(lambda: defaultdict(int))
+            self._latency_sum_ns = defaultdict(int)
+
+    def snapshot(self):
+        """
+        Return an independent copy of the current statistics.
+        """
+        with self._lock:
+            snapshot = TmclStatistics.__new__(TmclStatistics)
+            snapshot._lock = threading.Lock()
+            snapshot.requests = copy.copy(self.requests)
+            snapshot.modules = copy.copy(self.modules)
+            snapshot.timeouts = self.timeouts
+            snapshot.link_errors = self.link_errors
+            snapshot.checksum_errors = self.checksum_errors
+            snapshot.status_errors = self.status_errors
+            snapshot._histograms = defaultdict(lambda: defaultdict(int))
+            for opcode, histogram in self._histograms.items():
+                snapshot._histograms[opcode].update(histogram)
+            snapshot._latency_sum_ns = copy.copy(self._latency_sum_ns)
+        return snapshot
+
+    def record(self, request, latency_ns, error=None):
+        """
+        Record a finished request.
+
+        :param request: The TMCLRequest.
+        :param int latency_ns: Round-trip time in nanoseconds.
+        :param error: The exception the request failed with or None.
+        """
+        with self._lock:
+            self.requests[request.command] += 1
+            self.modules[request.moduleAddress] += 1
+            if error is None or isinstance(error, TMCLReplyStatusError):
+                # A reply has been received
+                self._histograms[request.command][_bucket_index(latency_ns)] += 1
+                self._latency_sum_ns[request.command] += latency_ns
+            if error is None:
+                return
+            if isinstance(error, TMCLReplyStatusError):
+                self.status_errors += 1
+            elif isinstance(error, TMCLReplyChecksumError):
+                self.checksum_errors += 1
+            elif isinstance(error, TMCLTimeoutError):
+                self.timeouts += 1
+            else:
+                self.link_errors += 1
+
+    def measure(self, function, request):
+        """
+        Call function(request) and record its duration and outcome.
+        """
+        start = time.perf_counter_ns()
+        try:
+            reply = function(request)
+        except Exception as e:
+            self.record(request, time.perf_counter_ns() - start, e)
+            raise
+        self.record(request, time.perf_counter_ns() - start)
+        return reply
+
+    @property
+    def errors(self):
+        with self._lock:
+            return self.timeouts + self.link_errors + self.checksum_errors + self.status_errors
+
+    def count(self, opcode=None, module_id=None):
+        """
+        Number of requests, in total or for one opcode or module ID.
+        """
+        with self._lock:
+            if opcode is not None:
+                return self.requests.get(opcode, 0)
+            if module_id is not None:
+                return self.modules.get(module_id, 0)
+            return sum(self.requests.values())
+
+    def _merged_histogram(self, opcode):
+        # Called with the lock held
+        if opcode is not None:
+            return dict(self._histograms.get(opcode, {}))
+        merged = defaultdict(int)
+        for histogram in self._histograms.values():
+            for index, count in histogram.items():
+                merged[index] += count
+        return merged
+
+    def latency_histogram(self, opcode=None):
+        """
+        Return the non-empty latency buckets as a list of
+        (lower bound ns, upper bound ns, count) tuples.
+        """
+        with self._lock:
+            histogram = self._merged_histogram(opcode)
+        return [(*_bucket_range(index), histogram[index]) for index in sorted(histogram)]
+
+    def latency_percentile(self, percentile, opcode=None):
+        """
+        Return the latency in ns below which [percentile] % of the replies
+        have been received, as the upper bound of the histogram bucket. None
+        if no latencies have been recorded.
+        """
+        with self._lock:
+            histogram = self._merged_histogram(opcode)
+        total = sum(histogram.values())
+        if total == 0:
+            return None
+        threshold = total * percentile / 100
+        cumulative = 0
+        for index in sorted(histogram):
+            cumulative += histogram[index]
+            if cumulative >= threshold:
+                return _bucket_range(index)[1]
+        return _bucket_range(max(histogram))[1]
+
+    def mean_latency(self, opcode=None):
+        """
+        Return the mean latency in ns, None if no latencies have been recorded.
+        """
+        with self._lock:
+            total = sum(self._merged_histogram(opcode).values())
+            if total == 0:
+                return None
+            if opcode is not None:
+                return self._latency_sum_ns.get(opcode, 0) / total
+            return sum(self._latency_sum_ns.values()) / total
+
+    def __str__(self):
+        # Format a consistent copy, requests may be recorded meanwhile
+        statistics = self.snapshot()
+        lines = [f"Requests: {statistics.count()}, timeouts: {statistics.timeouts}, "
+                 f"link errors: {statistics.link_errors}, checksum errors: {statistics.checksum_errors}, "
+                 f"status errors: {statistics.status_errors}"]
+        for opcode in sorted(statistics.requests):
+            mean = statistics.mean_latency(opcode)
+            if mean is None:
+                lines.append(f"  Opcode {opcode:3d}: {statistics.requests[opcode]} requests")
+            else:
+                lines.append(f"  Opcode {opcode:3d}: {statistics.requests[opcode]} requests, "
+                             f"mean {mean / 1e3:.1f} us, "
+                             f"p99 {statistics.latency_percentile(99, opcode) / 1e3:.1f} us")
+        for module_id in sorted(statistics.modules):
+            lines.append(f"  Module {module_id:3d}: {statistics.modules[module_id]} requests")
+        return "\n".join(lines)
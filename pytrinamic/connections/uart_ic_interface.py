@@ -69,6 +69,18 @@ class UartIcInterface:
         self.serial.write(data)
         return self.serial.read(recv_size)
 
+    def send_datagrams(self, datagrams, recv_size):
+        """
+        Send several datagrams at once and read their replies.
+
+        :param datagrams: List of datagrams (bytes).
+        :param int recv_size: Reply length of each datagram.
+        :return: List of the replies.
+        """
+        self.serial.write(b"".join(datagrams))
+        data = self.serial.read(recv_size * len(datagrams))
+        return [data[index:index + recv_size] for index in range(0, len(data), recv_size)]
+
     @staticmethod
     def supports_tmcl():
         return False
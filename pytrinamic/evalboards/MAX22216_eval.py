@@ -14,6 +14,9 @@ class MAX22216_eval(TMCLEval):
     """
     This class represents a MAX22216 Evaluation board.
     """
+    # Use the driver controller functions for register access
+    REGISTER_CHANNEL = "drv"
+
     def __init__(self, connection, module_id=1):
         """
         Constructor for the MAX22216 evalboard instance.
@@ -33,13 +36,6 @@ class MAX22216_eval(TMCLEval):
         ]
         self.ics = [MAX22216(self)]
 
-    # Use the driver controller functions for register access
-
-    def write_register(self, register_address, value):
-        return self._connection.write_drv(register_address, value, self._module_id)
-
-    def read_register(self, register_address, signed=False):
-        return self._connection.read_drv(register_address, self._module_id, signed)
 
     class _MotorTypeA(object):
         """
@@ -20,6 +20,9 @@ class TMC2100_eval(TMCLEval):
     are provided properly. See __init__ for details on the function
     requirements.
     """
+    # Use the driver controller functions for register access
+    REGISTER_CHANNEL = "drv"
+
     
     def __init__(self, connection, module_id=1):
         """
@@ -40,14 +43,6 @@ class TMC2100_eval(TMCLEval):
         self.motors = [self._MotorTypeA(self, 0)]
         self.ics = [TMC2100()]
 
-    # Use the driver controller functions for register access
-
-    def write_register(self, register_address, value):
-        return self._connection.write_drv(register_address, value, self._module_id)
-
-    def read_register(self, register_address, signed=False):
-        return self._connection.read_drv(register_address, self._module_id, signed)
-
     # Motion Control functions
 
     def rotate(self, motor, value):
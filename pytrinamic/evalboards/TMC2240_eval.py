@@ -9,7 +9,6 @@
 from pytrinamic.evalboards import TMCLEval
 from pytrinamic.ic import TMC2240
 from pytrinamic.features import MotorControlModule
-from pytrinamic.helpers import BitField
 
 
 class TMC2240_eval(TMCLEval):
@@ -21,6 +20,9 @@ class TMC2240_eval(TMCLEval):
     are provided properly. See __init__ for details on the function
     requirements.
     """
+    # Use the motion controller functions for register access
+    REGISTER_CHANNEL = "drv"
+
     def __init__(self, connection, module_id=1):
         """
         Parameters:
@@ -40,21 +42,6 @@ class TMC2240_eval(TMCLEval):
         self.motors = [self._MotorTypeA(self, 0)]
         self.ics = [TMC2240()]
 
-    # Use the motion controller functions for register access
-
-    def write_register(self, register_address, value):
-        return self._connection.read_drv(register_address, value, self._module_id)
-
-    def read_register(self, register_address, signed=False):
-        return self._connection.read_drv(register_address, self._module_id, signed)
-
-    def write_register_field(self, field, value):
-        return self.write_register(field[0], BitField.field_set(self.read_register(field[0]),
-                                                                field[1], field[2], value))
-
-    def read_register_field(self, field):
-        return BitField.field_get(self.read_register(field[0]), field[1], field[2])
-
     # Motion control functions
 
     def rotate(self, motor, value):
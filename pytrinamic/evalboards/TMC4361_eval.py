@@ -24,14 +24,6 @@ class TMC4361_eval(TMCLEval):
         self.motors = [self._MotorTypeA(self, 0)]
         self.ics = [TMC4361()]
 
-    # Use the motion controller channel for register access
-
-    def write_register(self, register_address, value):
-        return self._connection.write_mc(register_address, value, self._module_id)
-
-    def read_register(self, register_address, signed=False):
-        return self._connection.read_mc(register_address, self._module_id, signed)
-
     # Motion control functions
 
     def rotate(self, motor, value):
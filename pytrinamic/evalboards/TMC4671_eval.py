@@ -8,6 +8,7 @@
 
 from pytrinamic.evalboards import TMCLEval
 from pytrinamic.ic import TMC4671
+from pytrinamic.ic.register_multiplexer import RegisterMultiplexer
 from pytrinamic.features import MotorControlModule, LinearRampModule
 
 
@@ -19,6 +20,7 @@ class TMC4671_eval(TMCLEval):
         TMCLEval.__init__(self, connection, module_id)
         self.motors = [self._MotorTypeA(self, 0)]
         self.ics = [TMC4671(connection)]
+        self._multiplexer = RegisterMultiplexer(self, TMC4671)
 
     # Use the motion controller channel for register access
     def move_to(self, axis, position, velocity=None):
@@ -31,11 +33,48 @@ class TMC4671_eval(TMCLEval):
             self.motors[axis].linear_ramp.max_velocity = velocity
         self.connection.move_by(axis, difference, self.module_id)
 
-    def write_register(self, register_address, value):
-        return self._connection.write_mc(register_address, value, self._module_id)
+    def _write_register(self, register_address, value):
+        result = TMCLEval._write_register(self, register_address, value)
+        self._multiplexer.track_write(register_address, value)
+        return result
 
-    def read_register(self, register_address, signed=False):
-        return self._connection.read_mc(register_address, self._module_id, signed)
+    def _access_registers(self, accesses):
+        return self._connection.access_mc_registers(accesses, self._module_id)
+
+    # Multiplexed register access, see TMC4671.MULTIPLEXED_REGISTERS
+
+    def read_multiplexed(self, data_register, selector):
+        """
+        Reads a sub-register of a multiplexed register. The selector register
+        is only written if another sub-register was selected before.
+
+        Parameters:
+        data_register: Data register, e.g. TMC4671.REG.ADC_RAW_DATA.
+        selector: Sub-register, e.g. TMC4671.VARIANT.ADC_RAW_ADDR_ADC_I1_RAW_ADC_I0_RAW.
+        """
+        return self._multiplexer.read(data_register, selector)
+
+    def write_multiplexed(self, data_register, selector, value):
+        """
+        Writes a sub-register of a multiplexed register, e.g. of TMC4671.REG.CONFIG_DATA.
+        """
+        return self._multiplexer.write(data_register, selector, value)
+
+    def read_multiplexed_registers(self, data_register, selectors):
+        """
+        Reads several sub-registers of a multiplexed register with one burst
+        of pipelined selector writes and data reads.
+
+        Returns: List of the values in the order of selectors.
+        """
+        return self._multiplexer.read_many(data_register, selectors)
+
+    def invalidate_selectors(self):
+        """
+        Forgets the tracked selector register values, e.g. after an IC reset
+        or after other programs accessed the IC.
+        """
+        self._multiplexer.invalidate()
 
     class _MotorTypeA(MotorControlModule):
         def __init__(self, eval_board, axis):
@@ -20,14 +20,6 @@ class TMC5062_eval(TMCLEval):
         self.motors = [self._MotorTypeA(self, 0), self._MotorTypeA(self, 1)]
         self.ics = [TMC5062()]
 
-    # Use the motion controller channel for register access
-
-    def write_register(self, register_address, value):
-        return self._connection.write_mc(register_address, value, self._module_id)
-
-    def read_register(self, register_address, signed=False):
-        return self._connection.read_mc(register_address, self._module_id, signed)
-
     # Motion control functions
 
     def rotate(self, motor, value):
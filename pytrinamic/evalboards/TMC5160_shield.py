@@ -23,6 +23,9 @@ class TMC5160_shield(TMCLEval):
     this class if these two functions are provided properly. See __init__ for
     details on the function requirements.
     """
+    # Registers are accessed on the channel of the shield, see _read_register()
+    REGISTER_CHANNEL = None
+
     def __init__(self, connection, channel=0, module_id=1):
         """
         Parameters:
@@ -48,10 +51,10 @@ class TMC5160_shield(TMCLEval):
         self.ics = [TMC5160()]
 
     # Use the motion controller functions for register access
-    def write_register(self, register_address, value):
+    def _write_register(self, register_address, value):
         return self._connection.write_register(register_address, TMCLCommand.WRITE_MC, self.__channel, value, self._module_id)
 
-    def read_register(self, register_address, signed=False):
+    def _read_register(self, register_address, signed=False):
         return self._connection.read_register(register_address, TMCLCommand.READ_MC, self.__channel, self._module_id, signed)
 
     # Motion control functions
@@ -7,10 +7,19 @@
 ################################################################################
 
 from pytrinamic.helpers import BitField, to_signed_32
+from pytrinamic.ic.axis_fields import AxisFields
+from pytrinamic.ic.field_transaction import FieldTransaction
+from pytrinamic.ic.register_cache import RegisterCache
+from pytrinamic.ic.register_snapshot import take_snapshot, restore_snapshot
 
 
 class TMCLEval(object):
 
+    # TMCL register access of the IC: "mc" for the readMC/writeMC commands,
+    # "drv" for readDRV/writeDRV, None if the eval board implements
+    # _read_register() and _write_register() otherwise.
+    REGISTER_CHANNEL = "mc"
+
     def __init__(self, connection, module_id=1):
         """
         Constructor for the module instance.
@@ -26,6 +35,9 @@ class TMCLEval(object):
         self.name = ""
         self.desc = ""
         self.motors = []
+        self._register_cache = None
+        self._field_transaction = None
+        self._axes = {}
 
     def set_axis_parameter(self, ap_type, axis, value):
         """
@@ -52,40 +64,236 @@ class TMCLEval(object):
         """
         return self._connection.get_axis_parameter(ap_type, axis, self._module_id, signed=signed)
 
+    def enable_register_cache(self, volatile=None):
+        """
+        Enables a shadow cache of the IC configuration registers.
+
+        Register writes go to the IC and update the cache. Reads of cached
+        registers, including the read of a field write, are served from the
+        cache. Volatile registers (positions, velocities, status, ...) are
+        always read from the IC, see the VOLATILE_REGISTERS of the IC class.
+        ICs not declaring them have no cached registers.
+
+        The cache assumes that the registers are only written through this
+        object. Use invalidate_register_cache() or refresh_register_cache()
+        after the IC has been changed otherwise, e.g. by a reset.
+
+        Parameters:
+        volatile: Further register addresses not to cache.
+
+        Returns: The RegisterCache.
+        """
+        self._register_cache = RegisterCache(self.ics[0] if getattr(self, "ics", None) else None, volatile)
+        return self._register_cache
+
+    def disable_register_cache(self):
+        """
+        Disables the register cache, all register accesses go to the IC again.
+        """
+        self._register_cache = None
+
+    @property
+    def register_cache(self):
+        """The RegisterCache or None if disabled."""
+        return self._register_cache
+
+    def invalidate_register_cache(self, register_address=None):
+        """
+        Drops the cached value of a register, or of all registers if None.
+        """
+        if self._register_cache is not None:
+            self._register_cache.invalidate(register_address)
+
+    def refresh_register_cache(self, register_addresses=None):
+        """
+        Reads registers from the IC into the cache.
+
+        Parameters:
+        register_addresses: Registers to read, per default all cached registers.
+        """
+        cache = self._register_cache
+        if cache is None:
+            return
+        if register_addresses is None:
+            register_addresses = cache.addresses()
+        for register_address in register_addresses:
+            cache.invalidate(register_address)
+            self.read_register(register_address)
+
+    def write_register(self, register_address, value):
+        """
+        Writes a register of the IC.
+
+        Parameters:
+        register_address: Register address.
+        value: Register value.
+        """
+        result = self._write_register(register_address, value)
+        if self._register_cache is not None:
+            self._register_cache.update(register_address, value)
+        return result
+
+    def read_register(self, register_address, signed=False):
+        """
+        Reads a register of the IC, or takes its value from the register
+        cache if enabled.
+
+        Parameters:
+        register_address: Register address.
+        signed: Indicates whether the value should be interpreted as signed or not.
+
+        Returns: Register value.
+        """
+        cache = self._register_cache
+        if cache is not None and not cache.is_volatile(register_address):
+            value = cache.get(register_address)
+            if value is not None:
+                return to_signed_32(value) if signed else value
+        value = self._read_register(register_address, signed)
+        if cache is not None:
+            cache.update(register_address, value)
+        return value
+
+    # Register access of the IC, see REGISTER_CHANNEL
+
+    def _write_register(self, register_address, value):
+        if self.REGISTER_CHANNEL == "drv":
+            return self._connection.write_drv(register_address, value, self._module_id)
+        return self._connection.write_mc(register_address, value, self._module_id)
+
+    def _read_register(self, register_address, signed=False):
+        if self.REGISTER_CHANNEL == "drv":
+            return self._connection.read_drv(register_address, self._module_id, signed)
+        return self._connection.read_mc(register_address, self._module_id, signed)
+
+    def read_registers(self, register_addresses):
+        """
+        Reads multiple registers of the IC. Eval boards with TMCL register
+        access read them with pipelined requests. Registers held by the
+        register cache are not read.
+
+        Parameters:
+        register_addresses: Iterable of register addresses.
+
+        Returns: List of the unsigned register values.
+        """
+        register_addresses = list(register_addresses)
+        cache = self._register_cache
+        if cache is None:
+            return self._read_registers(register_addresses)
+
+        values = [None if cache.is_volatile(address) else cache.get(address) for address in register_addresses]
+        missing = [address for address, value in zip(register_addresses, values) if value is None]
+        read_values = dict(zip(missing, self._read_registers(missing)))
+        for address, value in read_values.items():
+            cache.update(address, value)
+        return [read_values[address] if value is None else value
+                for address, value in zip(register_addresses, values)]
+
+    def _read_registers(self, register_addresses):
+        # Pipelined bulk read of TMCL connections, other connections read the
+        # registers one by one.
+        bulk_read = None
+        if self.REGISTER_CHANNEL is not None:
+            bulk_read = getattr(self._connection, "read_{}_registers".format(self.REGISTER_CHANNEL), None)
+        if bulk_read is None:
+            return [self._read_register(address) for address in register_addresses]
+        return bulk_read(register_addresses, self._module_id)
+
+    def snapshot(self, register_addresses=None):
+        """
+        Reads the registers of the IC into a RegisterSnapshot, see
+        ic.register_snapshot.take_snapshot().
+
+        Parameters:
+        register_addresses: Registers to read, per default all non-volatile
+        registers of the IC. Write-only registers are not known, leave them out
+        here to exclude them.
+        """
+        return take_snapshot(self, self.ics[0], register_addresses)
+
+    def restore(self, snapshot):
+        """
+        Writes the non-volatile registers of a snapshot whose values differ
+        from the current ones. The current values are taken from the register
+        cache if enabled, otherwise read from the IC.
+
+        Returns: The addresses of the written registers.
+        """
+        return restore_snapshot(self, self.ics[0], snapshot)
+
+    def field_transaction(self):
+        """
+        Returns a context manager collecting the register field writes.
+
+        Within the with-statement block, write_register_field() only records
+        the field values. When the block is left, each touched register is
+        read once, or not at all if the register cache holds its value or all
+        its bits were written, and written once. An exception in the block
+        discards the collected writes.
+
+        Example:
+            with eval_board.field_transaction():
+                eval_board.write_register_field(TMC5160.FIELD.TOFF, 3)
+                eval_board.write_register_field(TMC5160.FIELD.TBL, 2)
+                eval_board.write_register_field(TMC5160.FIELD.MRES, 0)
+        """
+        return FieldTransaction(self)
+
     def write_register_field(self, field, value):
+        if self._field_transaction is not None:
+            return self._field_transaction.write_register_field(field, value)
         return self.write_register(field[0], BitField.field_set(self.read_register(field[0]),
                                                                 field[1], field[2], value))
 
     def read_register_field(self, field):
+        if self._field_transaction is not None:
+            return self._field_transaction.read_register_field(field)
         return BitField.field_get(self.read_register(field[0]), field[1], field[2])
 
+    def axis(self, axis):
+        """
+        Returns the AxisFields of an axis of the IC. Its FIELD attribute holds
+        the register fields with the per-axis fields of multi-axis ICs already
+        resolved for this axis, e.g. eval_board.axis(1).FIELD.PWM_AMPL.
+        """
+        axis_fields = self._axes.get(axis)
+        if axis_fields is None:
+            axis_fields = AxisFields(self, self.ics[0], axis)
+            self._axes[axis] = axis_fields
+        return axis_fields
+
     def write_axis_field(self, axis, field, value):
         """
         Writes the given value to the axis-dependent register field.
         On multi-axis ICs, this wraps the process of resolving the actual target
         register field to be used for the given axis, when multiple fields with
-        same meaning for different axes are available.
+        same meaning for different axes are available. Use the fields of axis()
+        to skip the resolution.
 
         Parameters:
+        axis: Axis index.
         field: Base register field for any axis.
         value: Value to write to the target register field for this axis.
         """
-        return self.write_register_field(field[axis] if type(field) == list else field, value)
+        return self.write_register_field(field[axis] if isinstance(field, list) else field, value)
 
     def read_axis_field(self, axis, field, signed=False):
         """
         Reads the value of the axis-dependent register field.
         On multi-axis ICs, this wraps the process of resolving the actual target
         register field to be used for the given axis, when multiple fields with
-        same meaning for different axes are available.
+        same meaning for different axes are available. Use the fields of axis()
+        to skip the resolution.
 
         Parameters:
+        axis: Axis index.
         field: Base register field for any axis.
+        signed: Interpret the value as two's complement of the field width.
 
         Returns: Value of the target register field for the given axis.
         """
-        value = self.read_register_field(field[axis] if type(field) == list else field)
-        return BitField.to_signed_32(value) if signed else value
+        return self.axis(axis).read(field[axis] if isinstance(field, list) else field, signed)
 
     def __str__(self):
         return "{} {}".format(
@@ -7,6 +7,7 @@
 ################################################################################
 
 from pytrinamic.features.current import Current
+from pytrinamic.ic.axis_fields import AxisFields
 
 
 class CurrentIC(Current):
@@ -16,6 +17,8 @@ class CurrentIC(Current):
     def __init__(self, eval_board, ic, axis):
         super().__init__(eval_board, axis)
         self._ic = ic
+        self._axis_fields = AxisFields(eval_board, ic, axis)
+        self._fields = self._axis_fields.FIELD
 
     def set_run_current(self, current):
         """
@@ -25,7 +28,7 @@ class CurrentIC(Current):
         Parameters:
         value: Target run current.
         """
-        self._parent.write_axis_field(self._ic.FIELD.IRUN, current)
+        self._axis_fields.write(self._fields.IRUN, current)
 
     def get_run_current(self):
         """
@@ -34,7 +37,7 @@ class CurrentIC(Current):
 
         Returns: Run current for this axis.
         """
-        return self._parent.read_axis_field(self._ic.FIELD.IRUN)
+        return self._axis_fields.read(self._fields.IRUN)
 
     def set_standby_current(self, current):
         """
@@ -44,7 +47,7 @@ class CurrentIC(Current):
         Parameters:
         value: Target standby current.
         """
-        self._parent.write_axis_field(self._ic.FIELD.IHOLD, current)
+        self._axis_fields.write(self._fields.IHOLD, current)
 
     def get_standby_current(self):
         """
@@ -53,7 +56,7 @@ class CurrentIC(Current):
 
         Returns: Standby current for this axis.
         """
-        return self._parent.read_axis_field(self._ic.FIELD.IHOLD)
+        return self._axis_fields.read(self._fields.IHOLD)
 
     # Properties
     run = property(get_run_current, set_run_current)
@@ -7,6 +7,7 @@
 ################################################################################
 
 from pytrinamic.features.linear_ramp import LinearRamp
+from pytrinamic.ic.axis_fields import AxisFields
 
 
 class LinearRampIC(LinearRamp):
@@ -16,6 +17,8 @@ class LinearRampIC(LinearRamp):
     def __init__(self, eval_board, ic, axis):
         super().__init__(eval_board, axis)
         self._ic = ic
+        self._axis_fields = AxisFields(eval_board, ic, axis)
+        self._fields = self._axis_fields.FIELD
 
     def set_max_velocity(self, velocity):
         """
@@ -25,7 +28,7 @@ class LinearRampIC(LinearRamp):
         Parameters:
         velocity: Maximum positioning velocity.
         """
-        self._parent.write_axis_field(self._ic.FIELD.VMAX, velocity)
+        self._axis_fields.write(self._fields.VMAX, velocity)
 
     def get_max_velocity(self):
         """
@@ -34,7 +37,7 @@ class LinearRampIC(LinearRamp):
 
         Returns: Maximum positioning velocity for this axis.
         """
-        return self._parent.read_axis_field(self._ic.FIELD.VMAX)
+        return self._axis_fields.read(self._fields.VMAX)
 
     def set_max_acceleration(self, acceleration):
         """
@@ -44,7 +47,7 @@ class LinearRampIC(LinearRamp):
         Parameters:
         acceleration: Maximum acceleration.
         """
-        self._parent.write_axis_field(self._ic.FIELD.AMAX, acceleration)
+        self._axis_fields.write(self._fields.AMAX, acceleration)
 
     def get_max_acceleration(self):
         """
@@ -53,7 +56,7 @@ class LinearRampIC(LinearRamp):
 
         Returns: Maximum acceleration for this axis.
         """
-        return self._parent.read_axis_field(self._ic.FIELD.AMAX)
+        return self._axis_fields.read(self._fields.AMAX)
 
     # Properties
     max_velocity = property(get_max_velocity, set_max_velocity)
@@ -7,7 +7,7 @@
 ################################################################################
 
 from ..features.motor_control import MotorControl
-from ..helpers import to_signed_32
+from ..ic.axis_fields import AxisFields
 
 
 class MotorControlIc(MotorControl):
@@ -15,6 +15,8 @@ class MotorControlIc(MotorControl):
     def __init__(self, eval_board, ic, axis):
         super().__init__(eval_board, axis)
         self._ic = ic
+        self._axis_fields = AxisFields(eval_board, ic, axis)
+        self._fields = self._axis_fields.FIELD
 
     def move_to(self, position, velocity=None):
         """
@@ -28,12 +30,12 @@ class MotorControlIc(MotorControl):
 
         Returns: None
         """
-        self.write_axis_field(self._ic.FIELD.RAMPMODE, 0)
+        self._axis_fields.write(self._fields.RAMPMODE, 0)
 
         if velocity and velocity != 0:
-            self.write_axis_field(self._ic.FIELD.VMAX, velocity)
+            self._axis_fields.write(self._fields.VMAX, velocity)
 
-        self.write_axis_field(self._ic.FIELD.XTARGET, position)
+        self._axis_fields.write(self._fields.XTARGET, position)
 
     def move_by(self, distance, velocity=None):
         """
@@ -61,11 +63,11 @@ class MotorControlIc(MotorControl):
         # self.write_axis_field(self._ic.FIELD.AMAX, 1000)
 
         if velocity >= 0:
-            self.write_axis_field(self._ic.FIELD.VMAX, velocity)
-            self.write_axis_field(self._ic.FIELD.RAMPMODE, 1)
+            self._axis_fields.write(self._fields.VMAX, velocity)
+            self._axis_fields.write(self._fields.RAMPMODE, 1)
         else:
-            self.write_axis_field(self._ic.FIELD.VMAX, -velocity)
-            self.write_axis_field(self._ic.FIELD.RAMPMODE, 2)
+            self._axis_fields.write(self._fields.VMAX, -velocity)
+            self._axis_fields.write(self._fields.RAMPMODE, 2)
 
     def stop(self):
         """
@@ -94,7 +96,7 @@ class MotorControlIc(MotorControl):
 
         Returns: Target position for this axis.
         """
-        return self.read_axis_field(self._ic.FIELD.XTARGET, True)
+        return self._axis_fields.read(self._fields.XTARGET, True)
 
     def set_actual_position(self, position):
         """
@@ -104,7 +106,7 @@ class MotorControlIc(MotorControl):
         Parameters:
         position: Actual position.
         """
-        self.write_axis_field(self._ic.FIELD.XACTUAL, position)
+        self._axis_fields.write(self._fields.XACTUAL, position)
 
     def get_actual_position(self):
         """
@@ -113,7 +115,7 @@ class MotorControlIc(MotorControl):
 
         Returns: Actual position for this axis.
         """
-        return self.read_axis_field(self._ic.FIELD.XACTUAL, True)
+        return self._axis_fields.read(self._fields.XACTUAL, True)
 
     def set_target_velocity(self, velocity):
         """
@@ -132,7 +134,7 @@ class MotorControlIc(MotorControl):
 
         Returns: Target velocity for this axis.
         """
-        return self.read_axis_field(self._ic.FIELD.VMAX, True)
+        return self._axis_fields.read(self._fields.VMAX)
 
     def get_actual_velocity(self):
         """
@@ -141,7 +143,7 @@ class MotorControlIc(MotorControl):
 
         Returns: Actual velocity for this axis.
         """
-        return self.read_axis_field(self._ic.FIELD.VACTUAL, True)
+        return self._axis_fields.read(self._fields.VACTUAL, True)
 
     # ic specific functions
 
@@ -156,7 +158,7 @@ class MotorControlIc(MotorControl):
         field: Base register field for any axis.
         value: Value to write to the target register field for this axis.
         """
-        return self._parent.write_register_field(field[self._axis] if type(field) == list else field, value)
+        return self._axis_fields.write(field[self._axis] if isinstance(field, list) else field, value)
 
     def read_axis_field(self, field, signed=False):
         """
@@ -170,8 +172,7 @@ class MotorControlIc(MotorControl):
 
         Returns: Value of the target register field for the given axis.
         """
-        value = self._parent.read_register_field(field[self._axis] if type(field) == list else field)
-        return to_signed_32(value) if signed else value
+        return self._axis_fields.read(field[self._axis] if isinstance(field, list) else field, signed)
 
     # Properties
     target_position = property(get_target_position, set_target_position)
@@ -7,6 +7,7 @@
 ################################################################################
 
 from pytrinamic.features.solenoid_control import SolenoidControl
+from pytrinamic.ic.axis_fields import AxisFields
 
 class SolenoidControlIC(SolenoidControl):
     """
@@ -16,17 +17,19 @@ class SolenoidControlIC(SolenoidControl):
     def __init__(self, eval_board, ic, axis):
         super().__init__(eval_board, axis)
         self._ic = ic
+        self._axis_fields = AxisFields(eval_board, ic, axis)
+        self._fields = self._axis_fields.FIELD
 
     def set_high(self):
         """
         Apply high voltage.
         This writes 1 to the corresponding CNTL channel field.
         """
-        self._parent.write_axis_field(self._axis, self._ic.FIELD.CNTL, 1)
+        self._axis_fields.write(self._fields.CNTL, 1)
 
     def set_low(self):
         """
         Apply low voltage.
         This writes 0 to the corresponding CNTL channel field.
         """
-        self._parent.write_axis_field(self._axis, self._ic.FIELD.CNTL, 0)
+        self._axis_fields.write(self._fields.CNTL, 0)
@@ -7,6 +7,7 @@
 ################################################################################
 
 from pytrinamic.features.solenoid import Solenoid
+from pytrinamic.ic.axis_fields import AxisFields
 
 class SolenoidIC(Solenoid):
     """
@@ -40,6 +41,8 @@ class SolenoidIC(Solenoid):
     def __init__(self, eval_board, ic, axis):
         super().__init__(eval_board, axis)
         self._ic = ic
+        self._axis_fields = AxisFields(eval_board, ic, axis)
+        self._fields = self._axis_fields.FIELD
 
     def set_voltage_supply(self, u_supply):
         """
@@ -99,11 +102,11 @@ class SolenoidIC(Solenoid):
         Parameters:
         u_dc_h: High DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
+        vdr = (self._axis_fields.read(self._fields.VDR_NDUTY) == 1)
+        cdr = (self._axis_fields.read(self._fields.CTRL_MODE) == 1)
+        fsf = self.__map_fsf.get(self._axis_fields.read(self._fields.CTRL_MODE), 1.0)
         print("U_DC_H {}".format(round(self.__u_dc_value(u_dc_h, self.__u_supply, vdr, cdr, fsf))))
-        self._parent.write_axis_field(self._axis, self._ic.FIELD.DC_H, round(self.__u_dc_value(u_dc_h, self.__u_supply, vdr, cdr, fsf)))
+        self._axis_fields.write(self._fields.DC_H, round(self.__u_dc_value(u_dc_h, self.__u_supply, vdr, cdr, fsf)))
 
     def get_voltage_high(self):
         """
@@ -113,10 +116,10 @@ class SolenoidIC(Solenoid):
         Returns:
         High DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        return self.__u_dc_real(self._parent.read_axis_field(self._axis, self._ic.FIELD.DC_H), self.__u_supply, vdr, cdr, fsf)
+        vdr = (self._axis_fields.read(self._fields.VDR_NDUTY) == 1)
+        cdr = (self._axis_fields.read(self._fields.CTRL_MODE) == 1)
+        fsf = self.__map_fsf.get(self._axis_fields.read(self._fields.CTRL_MODE), 1.0)
+        return self.__u_dc_real(self._axis_fields.read(self._fields.DC_H), self.__u_supply, vdr, cdr, fsf)
 
     def set_voltage_low(self, u_dc_l):
         """
@@ -126,10 +129,10 @@ class SolenoidIC(Solenoid):
         Parameters:
         u_dc_l: Low DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        self._parent.write_axis_field(self._axis, self._ic.FIELD.DC_L, round(self.__u_dc_value(u_dc_l, self.__u_supply, vdr, cdr, fsf)))
+        vdr = (self._axis_fields.read(self._fields.VDR_NDUTY) == 1)
+        cdr = (self._axis_fields.read(self._fields.CTRL_MODE) == 1)
+        fsf = self.__map_fsf.get(self._axis_fields.read(self._fields.CTRL_MODE), 1.0)
+        self._axis_fields.write(self._fields.DC_L, round(self.__u_dc_value(u_dc_l, self.__u_supply, vdr, cdr, fsf)))
 
     def get_voltage_low(self):
         """
@@ -139,10 +142,10 @@ class SolenoidIC(Solenoid):
         Returns:
         Low DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        return self.__u_dc_real(self._parent.read_axis_field(self._axis, self._ic.FIELD.DC_L), self.__u_supply, vdr, cdr, fsf)
+        vdr = (self._axis_fields.read(self._fields.VDR_NDUTY) == 1)
+        cdr = (self._axis_fields.read(self._fields.CTRL_MODE) == 1)
+        fsf = self.__map_fsf.get(self._axis_fields.read(self._fields.CTRL_MODE), 1.0)
+        return self.__u_dc_real(self._axis_fields.read(self._fields.DC_L), self.__u_supply, vdr, cdr, fsf)
 
     def set_voltage_low_high(self, u_dc_l2h):
         """
@@ -152,10 +155,10 @@ class SolenoidIC(Solenoid):
         Parameters:
         u_dc_l2h: Low to high DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        self._parent.write_axis_field(self._axis, self._ic.FIELD.DC_L2H, round(self.__u_dc_value(u_dc_l2h, self.__u_supply, vdr, cdr, fsf)))
+        vdr = (self._axis_fields.read(self._fields.VDR_NDUTY) == 1)
+        cdr = (self._axis_fields.read(self._fields.CTRL_MODE) == 1)
+        fsf = self.__map_fsf.get(self._axis_fields.read(self._fields.CTRL_MODE), 1.0)
+        self._axis_fields.write(self._fields.DC_L2H, round(self.__u_dc_value(u_dc_l2h, self.__u_supply, vdr, cdr, fsf)))
 
     def get_voltage_low_high(self):
         """
@@ -165,10 +168,10 @@ class SolenoidIC(Solenoid):
         Returns:
         Low to high DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        return self.__u_dc_real(self._parent.read_axis_field(self._axis, self._ic.FIELD.DC_L2H), self.__u_supply, vdr, cdr, fsf)
+        vdr = (self._axis_fields.read(self._fields.VDR_NDUTY) == 1)
+        cdr = (self._axis_fields.read(self._fields.CTRL_MODE) == 1)
+        fsf = self.__map_fsf.get(self._axis_fields.read(self._fields.CTRL_MODE), 1.0)
+        return self.__u_dc_real(self._axis_fields.read(self._fields.DC_L2H), self.__u_supply, vdr, cdr, fsf)
 
     def set_voltage_high_low(self, u_dc_h2l):
         """
@@ -178,10 +181,10 @@ class SolenoidIC(Solenoid):
         Parameters:
         u_dc_h2l: High to low DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        self._parent.write_axis_field(self._axis, self._ic.FIELD.DC_H2L, round(self.__u_dc_value(u_dc_h2l, self.__u_supply, vdr, cdr, fsf)))
+        vdr = (self._axis_fields.read(self._fields.VDR_NDUTY) == 1)
+        cdr = (self._axis_fields.read(self._fields.CTRL_MODE) == 1)
+        fsf = self.__map_fsf.get(self._axis_fields.read(self._fields.CTRL_MODE), 1.0)
+        self._axis_fields.write(self._fields.DC_H2L, round(self.__u_dc_value(u_dc_h2l, self.__u_supply, vdr, cdr, fsf)))
 
     def get_voltage_high_low(self):
         """
@@ -191,10 +194,10 @@ class SolenoidIC(Solenoid):
         Returns:
         High to low DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        return self.__u_dc_real(self._parent.read_axis_field(self._axis, self._ic.FIELD.DC_H2L), self.__u_supply, vdr, cdr, fsf)
+        vdr = (self._axis_fields.read(self._fields.VDR_NDUTY) == 1)
+        cdr = (self._axis_fields.read(self._fields.CTRL_MODE) == 1)
+        fsf = self.__map_fsf.get(self._axis_fields.read(self._fields.CTRL_MODE), 1.0)
+        return self.__u_dc_real(self._axis_fields.read(self._fields.DC_H2L), self.__u_supply, vdr, cdr, fsf)
 
     def set_frequency(self, u_ac_freq):
         """
@@ -205,8 +208,8 @@ class SolenoidIC(Solenoid):
         Parameters:
         u_ac_freq: AC frequency.
         """
-        pwm_freq = self.__map_pwm_freq.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.F_PWM_M), 100E3)
-        self._parent.write_axis_field(self._axis, self._ic.FIELD.DELTA_PHI, round(self.__delta_phi(pwm_freq, u_ac_freq)))
+        pwm_freq = self.__map_pwm_freq.get(self._axis_fields.read(self._fields.F_PWM_M), 100E3)
+        self._axis_fields.write(self._fields.DELTA_PHI, round(self.__delta_phi(pwm_freq, u_ac_freq)))
 
     def get_frequency(self):
         """
@@ -217,8 +220,8 @@ class SolenoidIC(Solenoid):
         Returns:
         AC frequency.
         """
-        pwm_freq = self.__map_pwm_freq.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.F_PWM_M), 100E3)
-        return self.__f_AC(pwm_freq, self._parent.read_axis_field(self._axis, self._ic.FIELD.DELTA_PHI))
+        pwm_freq = self.__map_pwm_freq.get(self._axis_fields.read(self._fields.F_PWM_M), 100E3)
+        return self.__f_AC(pwm_freq, self._axis_fields.read(self._fields.DELTA_PHI))
 
     def set_voltage_ac(self, u_ac):
         """
@@ -228,8 +231,8 @@ class SolenoidIC(Solenoid):
         Parameters:
         u_ac: AC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        self._parent.write_axis_field(self._axis, self._ic.FIELD.U_AC, round(self.__u_ac_value(u_ac, self.__u_supply, vdr)))
+        vdr = (self._axis_fields.read(self._fields.VDR_NDUTY) == 1)
+        self._axis_fields.write(self._fields.U_AC, round(self.__u_ac_value(u_ac, self.__u_supply, vdr)))
 
     def get_voltage_ac(self):
         """
@@ -238,8 +241,8 @@ class SolenoidIC(Solenoid):
         Returns:
         AC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        return self.__u_ac_real(self._parent.read_axis_field(self._axis, self._ic.FIELD.U_AC), self.__u_supply, vdr)
+        vdr = (self._axis_fields.read(self._fields.VDR_NDUTY) == 1)
+        return self.__u_ac_real(self._axis_fields.read(self._fields.U_AC), self.__u_supply, vdr)
 
     # Properties
     u_supply = property(get_voltage_supply, set_voltage_supply)
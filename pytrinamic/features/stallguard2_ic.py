@@ -7,6 +7,7 @@
 ################################################################################
 
 from pytrinamic.features.stallguard2 import StallGuard2
+from pytrinamic.ic.axis_fields import AxisFields
 
 
 class StallGuard2IC(StallGuard2):
@@ -17,6 +18,8 @@ class StallGuard2IC(StallGuard2):
     def __init__(self, eval_board, ic, axis):
         super().__init__(eval_board, axis)
         self._ic = ic
+        self._axis_fields = AxisFields(eval_board, ic, axis)
+        self._fields = self._axis_fields.FIELD
 
     def set_filter(self, enable_filter):
         """
@@ -28,7 +31,7 @@ class StallGuard2IC(StallGuard2):
         0 - Disable StallGuard2 filter
         1 - Enable StallGuard2 filter
         """
-        self._parent.write_axis_field(self._ic.FIELD.SFILT, enable_filter)
+        self._axis_fields.write(self._fields.SFILT, enable_filter)
 
     def get_filter(self):
         """
@@ -39,7 +42,7 @@ class StallGuard2IC(StallGuard2):
         0 - StallGuard2 filter disabled
         1 - StallGuard2 filter enabled
         """
-        return self._parent.read_axis_field(self._ic.FIELD.SFILT)
+        return self._axis_fields.read(self._fields.SFILT)
 
     def set_threshold(self, threshold):
         """
@@ -49,7 +52,7 @@ class StallGuard2IC(StallGuard2):
         Parameters:
         threshold: StallGuard2 threshold. Default 0. Lower values mean higher sensibility.
         """
-        self._parent.write_axis_field(self._ic.FIELD.SGT, threshold)
+        self._axis_fields.write(self._fields.SGT, threshold)
 
     def get_threshold(self):
         """
@@ -58,7 +61,7 @@ class StallGuard2IC(StallGuard2):
 
         Returns: StallGuard2 threshold.
         """
-        return self._parent.read_axis_field(self._ic.FIELD.SGT)
+        return self._axis_fields.read(self._fields.SGT, True)
 
     def set_stop_velocity(self, velocity):
         """
@@ -70,9 +73,9 @@ class StallGuard2IC(StallGuard2):
         Parameters:
         velocity: Velocity threshold.
         """
-        self._parent.write_axis_field(self._ic.FIELD.SG_STOP, int(min(velocity, 1)))
+        self._axis_fields.write(self._fields.SG_STOP, int(min(velocity, 1)))
         velocity = int(min(0xFFFFF, int((1 << 24) / max(1, velocity))))
-        self._parent.write_axis_field(self._ic.FIELD.TCOOLTHRS, velocity)
+        self._axis_fields.write(self._fields.TCOOLTHRS, velocity)
 
     def get_stop_velocity(self):
         """
@@ -83,11 +86,11 @@ class StallGuard2IC(StallGuard2):
 
         Returns: Velocity threshold.
         """
-        velocity = self._parent.read_axis_field(self._ic.FIELD.TCOOLTHRS)
+        velocity = self._axis_fields.read(self._fields.TCOOLTHRS)
         return int(min(0xFFFFF, int((1 << 24) / max(1, velocity))))
 
     def get_load_value(self):
-        return self._parent.read_axis_field(self._ic.FIELD.SG_RESULT)
+        return self._axis_fields.read(self._fields.SG_RESULT)
 
     # Properties
     filter = property(get_filter, set_filter)
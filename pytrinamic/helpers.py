@@ -29,6 +29,104 @@ def to_signed_16(x):
     return (m ^ 0x00008000) - 0x00008000
 
 
+class BitFieldArray:
+    """
+    The BitField functions for NumPy arrays of register values, e.g. of
+    recorded DRV_STATUS samples:
+
+        sg_result = BitFieldArray.get(samples, TMC5160.FIELD.SG_RESULT)
+        drv_status = BitFieldArray.decode(TMC5160, TMC5160.REG.DRV_STATUS, samples)
+        drv_status["CS_ACTUAL"]
+
+    Register values may be given as any integer array, e.g. int32 values.
+    Field values are returned as uint32 arrays, or as int32 arrays for signed
+    fields.
+
+    This class requires NumPy.
+    """
+
+    @staticmethod
+    def _numpy():
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError("BitFieldArray requires NumPy (pip install numpy)") from e
+        return numpy
+
+    @staticmethod
+    def _registers(data):
+        np = BitFieldArray._numpy()
+        return np.asarray(data).astype(np.int64) & 0xFFFFFFFF
+
+    @staticmethod
+    def field_get(data, mask, shift, signed=False):
+        """
+        Extract a field from an array of register values. Signed fields are
+        sign extended from the field width.
+        """
+        np = BitFieldArray._numpy()
+        values = (BitFieldArray._registers(data) & mask) >> shift
+        if not signed:
+            return values.astype(np.uint32)
+        sign_bit = ((mask >> shift) + 1) >> 1
+        return ((values ^ sign_bit) - sign_bit).astype(np.int32)
+
+    @staticmethod
+    def field_set(data, mask, shift, value):
+        """
+        Set a field in an array of register values. The value can be a scalar
+        or an array broadcast against data.
+        """
+        np = BitFieldArray._numpy()
+        values = np.asarray(value).astype(np.int64)
+        return ((BitFieldArray._registers(data) & ~mask) | ((values << shift) & mask)).astype(np.uint32)
+
+    @staticmethod
+    def get(data, field, signed=False):
+        """
+        Extract a field given as (address, mask, shift) tuple of an IC FIELD
+        class from an array of register values.
+        """
+        return BitFieldArray.field_get(data, field[1], field[2], signed)
+
+    @staticmethod
+    def set(data, field, value):
+        """
+        Set a field given as (address, mask, shift) tuple of an IC FIELD class
+        in an array of register values.
+        """
+        return BitFieldArray.field_set(data, field[1], field[2], value)
+
+    @staticmethod
+    def to_signed_32(data):
+        """Convert an array of unsigned integers to 32 bit signed integers."""
+        np = BitFieldArray._numpy()
+        return ((BitFieldArray._registers(data) ^ 0x80000000) - 0x80000000).astype(np.int32)
+
+    @staticmethod
+    def decode(ic, register_address, data):
+        """
+        Unpack all fields of a register into a structured array with one
+        column per field, see ic.register_database. Fields in the
+        SIGNED_FIELDS of the IC are sign extended.
+
+        Parameters:
+        ic: The IC class or instance, e.g. TMC5160.
+        register_address: Address of the register.
+        data: Array of register values.
+        """
+        from .ic.register_database import RegisterDatabase
+
+        np = BitFieldArray._numpy()
+        fields = RegisterDatabase.of(ic).fields(register_address)
+        registers = BitFieldArray._registers(data)
+        dtype = np.dtype([(field.name, np.int32 if field.signed else np.uint32) for field in fields])
+        decoded = np.empty(registers.shape, dtype=dtype)
+        for field in fields:
+            decoded[field.name] = BitFieldArray.field_get(registers, field.mask, field.shift, field.signed)
+        return decoded
+
+
 class EEPROM:
     """
     This class provides basic access to an EEPROM.
@@ -157,6 +157,50 @@ class MAX22216(TMCIc):
         FAULT0              = 0x65
         FAULT1              = 0x66
 
+    VOLATILE_REGISTERS = {
+        REG.STATUS,
+        REG.ADC_VM_MEASUREMENT,
+        REG.U_AC_SCAN,
+        REG.I_DPM_PEAK_0,
+        REG.I_DPM_VALLEY_0,
+        REG.TRAVEL_TIME_0,
+        REG.REACTION_TIME_0,
+        REG.I_ADC_0,
+        REG.I_DC_0,
+        REG.I_IND_AC_0,
+        REG.R_0,
+        REG.PWM_DUTY_0,
+        REG.I_DPM_PEAK_1,
+        REG.I_DPM_VALLEY_1,
+        REG.TRAVEL_TIME_1,
+        REG.REACTION_TIME_1,
+        REG.I_ADC_1,
+        REG.I_DC_1,
+        REG.I_IND_AC_1,
+        REG.R_1,
+        REG.PWM_DUTY_1,
+        REG.I_DPM_PEAK_2,
+        REG.I_DPM_VALLEY_2,
+        REG.TRAVEL_TIME_2,
+        REG.REACTION_TIME_2,
+        REG.I_ADC_2,
+        REG.I_DC_2,
+        REG.I_IND_AC_2,
+        REG.R_2,
+        REG.PWM_DUTY_2,
+        REG.I_DPM_PEAK_3,
+        REG.I_DPM_VALLEY_3,
+        REG.TRAVEL_TIME_3,
+        REG.REACTION_TIME_3,
+        REG.I_ADC_3,
+        REG.I_DC_3,
+        REG.I_IND_AC_3,
+        REG.R_3,
+        REG.PWM_DUTY_3,
+        REG.FAULT0,
+        REG.FAULT1,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the MAX22216.
@@ -46,6 +46,17 @@ class TMC2130(TMCIc):
         ENCM_CTRL   = 0x72
         LOST_STEPS  = 0x73
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IOIN,
+        REG.TSTEP,
+        REG.MSCNT,
+        REG.MSCURACT,
+        REG.DRV_STATUS,
+        REG.PWM_SCALE,
+        REG.LOST_STEPS,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC2130.
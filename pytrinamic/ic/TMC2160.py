@@ -53,6 +53,20 @@ class TMC2160(TMCIc):
         PWM_AUTO       = 0x72
         LOST_STEPS     = 0x73
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IOIN_OUTPUT,
+        REG.OTP_READ,
+        REG.OFFSET_READ,
+        REG.TSTEP,
+        REG.MSCNT,
+        REG.MSCURACT,
+        REG.DRV_STATUS,
+        REG.PWM_SCALE,
+        REG.PWM_AUTO,
+        REG.LOST_STEPS,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC2160.
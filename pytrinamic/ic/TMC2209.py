@@ -56,6 +56,20 @@ class TMC2209(TMCIc):
         PWM_SCALE    = 0x71
         PWM_AUTO     = 0x72
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IFCNT,
+        REG.OTP_READ,
+        REG.IOIN,
+        REG.TSTEP,
+        REG.SG_RESULT,
+        REG.MSCNT,
+        REG.MSCURACT,
+        REG.DRV_STATUS,
+        REG.PWM_SCALE,
+        REG.PWM_AUTO,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC2209.
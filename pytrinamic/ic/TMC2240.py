@@ -66,6 +66,25 @@ class TMC2240(TMCIc):
         SG4_RESULT       = 0x75
         SG4_IND          = 0x76
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IFCNT,
+        REG.IOIN,
+        REG.TSTEP,
+        REG.X_ENC,
+        REG.ENC_STATUS,
+        REG.ENC_LATCH,
+        REG.ADC_VSUPPLY_AIN,
+        REG.ADC_TEMP,
+        REG.MSCNT,
+        REG.MSCURACT,
+        REG.DRV_STATUS,
+        REG.PWM_SCALE,
+        REG.PWM_AUTO,
+        REG.SG4_RESULT,
+        REG.SG4_IND,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC2240.
@@ -38,6 +38,19 @@ class TMC2300(TMCIc):
         PWM_SCALE  = 0x71
         PWM_AUTO   = 0x72
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IFCNT,
+        REG.IOIN,
+        REG.TSTEP,
+        REG.SG_VALUE,
+        REG.MSCNT,
+        REG.MSCURACT,
+        REG.DRV_STATUS,
+        REG.PWM_SCALE,
+        REG.PWM_AUTO,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC2300.
@@ -30,6 +30,12 @@ class TMC2590(TMCIc):
         SGCSCONF           = 0x0E
         DRVCONF            = 0x0F
 
+    VOLATILE_REGISTERS = {
+        REG.DRVSTATUS___MSTEP,
+        REG.DRVSTATUS___SG,
+        REG.DRVSTATUS___SG_SE,
+    }
+
     class FIELD(object):
         """
         Define all register bitfields of the TMC2590.
@@ -29,6 +29,12 @@ class TMC2660(TMCIc):
         SGCSCONF           = 0x0E
         DRVCONF            = 0x0F
 
+    VOLATILE_REGISTERS = {
+        REG.DRVSTATUS_MSTEP,
+        REG.DRVSTATUS_SG,
+        REG.DRVSTATUS_SG_SE,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC2660.
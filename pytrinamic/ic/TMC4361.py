@@ -140,6 +140,55 @@ class TMC4361(TMCIc):
         START_SIN______DAC_OFFSET                     = 0x7E
         VERSION_NO                                    = 0x7F
 
+    VOLATILE_REGISTERS = {
+        REG.ENC_IN_DATA,
+        REG.ENC_OUT_DATA,
+        REG.EVENTS,
+        REG.STATUS,
+        REG.XACTUAL,
+        REG.VACTUAL,
+        REG.AACTUAL,
+        REG.X_LATCH___REV_CNT___X_RANGE,
+        REG.X_PIPE0,
+        REG.X_PIPE1,
+        REG.X_PIPE2,
+        REG.X_PIPE3,
+        REG.X_PIPE4,
+        REG.X_PIPE5,
+        REG.X_PIPE6,
+        REG.X_PIPE7,
+        REG.SH_REG0,
+        REG.SH_REG1,
+        REG.SH_REG2,
+        REG.SH_REG3,
+        REG.SH_REG4,
+        REG.SH_REG5,
+        REG.SH_REG6,
+        REG.SH_REG7,
+        REG.SH_REG8,
+        REG.SH_REG9,
+        REG.SH_REG10,
+        REG.SH_REG11,
+        REG.SH_REG12,
+        REG.SH_REG13,
+        REG.ENC_POS,
+        REG.ENC_LATCH___ENC_RESET_VAL,
+        REG.ENC_POS_DEV___CL_TR_TOLERANCE,
+        REG.PID_ISUM_RD___PID_I___CL_VMAX_CALC_I,
+        REG.ENC_VMEAN_______SER_ENC_VARIATION___CL_CYCLE,
+        REG.V_ENC,
+        REG.V_ENC_MEAN,
+        REG.DATA_TO_ENC,
+        REG.DATA_FROM_ENC,
+        REG.COVER_LOW,
+        REG.COVER_HIGH___POLLING_REG,
+        REG.COVER_DRV_LOW,
+        REG.COVER_DRV_HIGH,
+        REG.MSCNT,
+        REG.CURRENTA_B,
+        REG.CURRENTA_B_SPI,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC4361.
@@ -8,6 +8,9 @@
 
 import struct
 from ..ic.tmc_ic import TMCIc
+from ..ic.field_transaction import FieldTransaction
+from ..ic.register_snapshot import take_snapshot, restore_snapshot
+from ..ic.register_multiplexer import RegisterMultiplexer
 from ..helpers import BitField, to_signed_32
 
 DATAGRAM_FORMAT = ">BI"
@@ -22,11 +25,14 @@ class TMC4671(TMCIc):
     def __init__(self, connection=None):
         super().__init__("TMC4671", self.__doc__)
         self._connection = connection
+        self._field_transaction = None
+        self._multiplexer = RegisterMultiplexer(self, self)
 
     # Only used for direct UART access without EvalSystem
     def write_register(self, register_address, value):
         datagram = struct.pack(DATAGRAM_FORMAT, register_address | 0x80, value & 0xFFFFFFFF)
         self._connection.send_datagram(datagram, DATAGRAM_LENGTH)
+        self._multiplexer.track_write(register_address, value)
 
     # Only used for direct UART access without EvalSystem
     def read_register(self, register_address, signed=False):
@@ -36,11 +42,87 @@ class TMC4671(TMCIc):
         value = values[1]
         return to_signed_32(value) if signed else value
 
+    # Only used for direct UART access without EvalSystem
+    def _access_registers(self, accesses):
+        datagrams = [struct.pack(DATAGRAM_FORMAT, register_address, 0) if value is None
+                     else struct.pack(DATAGRAM_FORMAT, register_address | 0x80, value & 0xFFFFFFFF)
+                     for register_address, value in accesses]
+        if hasattr(self._connection, "send_datagrams"):
+            replies = self._connection.send_datagrams(datagrams, DATAGRAM_LENGTH)
+            if len(replies) != len(datagrams):
+                raise ConnectionError(f"Received {len(replies)} of {len(datagrams)} replies")
+        else:
+            replies = [self._connection.send_datagram(datagram, DATAGRAM_LENGTH) for datagram in datagrams]
+        return [struct.unpack(DATAGRAM_FORMAT, reply)[1] for reply in replies]
+
+    # Only used for direct UART access without EvalSystem
+    def read_multiplexed(self, data_register, selector):
+        """
+        Reads a sub-register of a multiplexed register. The selector register
+        is only written if another sub-register was selected before.
+
+        Parameters:
+        data_register: Data register, e.g. REG.ADC_RAW_DATA.
+        selector: Sub-register, e.g. VARIANT.ADC_RAW_ADDR_ADC_I1_RAW_ADC_I0_RAW.
+        """
+        return self._multiplexer.read(data_register, selector)
+
+    # Only used for direct UART access without EvalSystem
+    def write_multiplexed(self, data_register, selector, value):
+        """
+        Writes a sub-register of a multiplexed register, e.g. of REG.CONFIG_DATA.
+        """
+        return self._multiplexer.write(data_register, selector, value)
+
+    # Only used for direct UART access without EvalSystem
+    def read_multiplexed_registers(self, data_register, selectors):
+        """
+        Reads several sub-registers of a multiplexed register in one burst.
+
+        Returns: List of the values in the order of selectors.
+        """
+        return self._multiplexer.read_many(data_register, selectors)
+
+    # Only used for direct UART access without EvalSystem
+    def invalidate_selectors(self):
+        """
+        Forgets the tracked selector register values, e.g. after an IC reset.
+        """
+        self._multiplexer.invalidate()
+
+    # Only used for direct UART access without EvalSystem
+    def snapshot(self, register_addresses=None):
+        """
+        Reads the registers into a RegisterSnapshot, see TMCLEval.snapshot().
+        """
+        return take_snapshot(self, self, register_addresses)
+
+    # Only used for direct UART access without EvalSystem
+    def restore(self, snapshot):
+        """
+        Writes the registers of a snapshot which differ from the current
+        values, see TMCLEval.restore().
+        """
+        return restore_snapshot(self, self, snapshot)
+
+    # Only used for direct UART access without EvalSystem
+    def field_transaction(self):
+        """
+        Returns a context manager collecting the register field writes, so
+        that each touched register is read and written once, see
+        TMCLEval.field_transaction().
+        """
+        return FieldTransaction(self)
+
     def write_register_field(self, field, value):
+        if self._field_transaction is not None:
+            return self._field_transaction.write_register_field(field, value)
         return self.write_register(field[0], BitField.field_set(self.read_register(field[0]),
                                                                 field[1], field[2], value))
 
     def read_register_field(self, field):
+        if self._field_transaction is not None:
+            return self._field_transaction.read_register_field(field)
         return BitField.field_get(self.read_register(field[0]), field[1], field[2])
 
     class REG:
@@ -182,6 +264,66 @@ class TMC4671(TMCIc):
         STATUS_FLAGS                        = 0x7C
         STATUS_MASK                         = 0x7D
 
+    VOLATILE_REGISTERS = {
+        REG.CHIPINFO_DATA,
+        REG.ADC_RAW_DATA,
+        REG.ADC_IWY_IUX,
+        REG.ADC_IV,
+        REG.OPENLOOP_VELOCITY_ACTUAL,
+        REG.AENC_DECODER_PHI_A_RAW,
+        REG.CONFIG_DATA,
+        REG.PHI_E,
+        REG.PID_TORQUE_FLUX_ACTUAL,
+        REG.PID_VELOCITY_ACTUAL,
+        REG.PID_POSITION_ACTUAL,
+        REG.PID_ERROR_DATA,
+        REG.INTERIM_DATA,
+        REG.INPUTS_RAW,
+        REG.OUTPUTS_RAW,
+        REG.STATUS_FLAGS,
+        REG.ABN_DECODER_COUNT,
+        REG.ABN_DECODER_COUNT_N,
+        REG.ABN_DECODER_PHI_E_PHI_M,
+        REG.ABN_2_DECODER_COUNT,
+        REG.ABN_2_DECODER_COUNT_N,
+        REG.ABN_2_DECODER_PHI_M,
+        REG.AENC_DECODER_COUNT,
+        REG.AENC_DECODER_COUNT_N,
+        REG.AENC_DECODER_PHI_A,
+        REG.AENC_DECODER_PHI_E_PHI_M,
+        REG.AENC_DECODER_POSITION,
+        REG.AENC_VN,
+        REG.AENC_WY_UX,
+        REG.HALL_PHI_E_INTERPOLATED_PHI_E,
+        REG.HALL_PHI_M,
+        REG.OPENLOOP_PHI,
+        # Selector registers, tracked by the RegisterMultiplexer
+        REG.CHIPINFO_ADDR,
+        REG.ADC_RAW_ADDR,
+        REG.CONFIG_ADDR,
+        REG.PID_ERROR_ADDR,
+        REG.INTERIM_ADDR,
+    }
+
+    # Data registers and their selector registers (see ic.register_multiplexer)
+    MULTIPLEXED_REGISTERS = {
+        REG.CHIPINFO_DATA: REG.CHIPINFO_ADDR,
+        REG.ADC_RAW_DATA: REG.ADC_RAW_ADDR,
+        REG.CONFIG_DATA: REG.CONFIG_ADDR,
+        REG.PID_ERROR_DATA: REG.PID_ERROR_ADDR,
+        REG.INTERIM_DATA: REG.INTERIM_ADDR,
+    }
+
+    SIGNED_FIELDS = {
+        "PHI_E_EXT", "PHI_M_EXT", "POSITION_EXT", "OPENLOOP_VELOCITY_TARGET", "OPENLOOP_VELOCITY_ACTUAL",
+        "UD_EXT", "UQ_EXT", "ABN_DECODER_PHI_M", "ABN_DECODER_PHI_E", "HALL_PHI_M", "HALL_PHI_E",
+        "AENC_DECODER_PHI_M", "AENC_DECODER_PHI_E", "PHI_E", "PID_FLUX_TARGET", "PID_TORQUE_TARGET",
+        "PID_FLUX_OFFSET", "PID_TORQUE_OFFSET", "PID_VELOCITY_TARGET", "PID_VELOCITY_OFFSET",
+        "PID_POSITION_TARGET", "PID_FLUX_ACTUAL", "PID_TORQUE_ACTUAL", "PID_VELOCITY_ACTUAL",
+        "PID_POSITION_ACTUAL", "PID_TORQUE_ERROR", "PID_FLUX_ERROR", "PID_VELOCITY_ERROR", "PID_POSITION_ERROR",
+        "FOC_UD", "FOC_UQ",
+    }
+
     class FIELD:
         """
         Defines all register bitfields of the TMC4671.
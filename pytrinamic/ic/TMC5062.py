@@ -73,6 +73,11 @@ class TMC5062(TMCIc):
         COOLCONF      = (0x6D, 0x7D)
         DRV_STATUS    = (0x6F, 0x7F)
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.INPUT_OUTPUT,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC5062.
@@ -137,6 +137,39 @@ class TMC5072(TMCIc):
         DCCTRL_M2       = 0x7E
         DRV_STATUS_M2   = 0x7F
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IFCNT,
+        REG.INPUT___OUTPUT,
+        REG.PWM_STATUS_M1,
+        REG.XACTUAL_M1,
+        REG.VACTUAL_M1,
+        REG.RAMP_STAT_M1,
+        REG.XLATCH_M1,
+        REG.X_ENC_M1,
+        REG.ENC_STATUS_M1,
+        REG.ENC_LATCH_M1,
+        REG.MSCNT_M1,
+        REG.MSCURACT_M1,
+        REG.DRV_STATUS_M1,
+        REG.PWM_STATUS_M2,
+        REG.XACTUAL_M2,
+        REG.VACTUAL_M2,
+        REG.RAMP_STAT_M2,
+        REG.XLATCH_M2,
+        REG.X_ENC_M2,
+        REG.ENC_STATUS_M2,
+        REG.ENC_LATCH_M2,
+        REG.MSCNT_M2,
+        REG.MSCURACT_M2,
+        REG.DRV_STATUS_M2,
+    }
+
+    SIGNED_FIELDS = {
+        "XACTUAL_M1", "VACTUAL_M1", "XTARGET_M1", "XLATCH_M1", "X_ENC_M1", "ENC_LATCH_M1", "CUR_A_M1", "CUR_B_M1", "SGT_M1",
+        "XACTUAL_M2", "VACTUAL_M2", "XTARGET_M2", "XLATCH_M2", "X_ENC_M2", "ENC_LATCH_M2", "CUR_A_M2", "CUR_B_M2", "SGT_M2",
+    }
+
     class FIELD(object):
         """
         Define all register bitfields of the TMC5072.
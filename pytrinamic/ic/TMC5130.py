@@ -109,6 +109,25 @@ class TMC5130(TMCIc):
         ENCM_CTRL      = 0x72
         LOST_STEPS     = 0x73
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IFCNT,
+        REG.IOIN_OUTPUT,
+        REG.TSTEP,
+        REG.XACTUAL,
+        REG.VACTUAL,
+        REG.RAMP_STAT,
+        REG.XLATCH,
+        REG.X_ENC,
+        REG.ENC_STATUS,
+        REG.ENC_LATCH,
+        REG.MSCNT,
+        REG.MSCURACT,
+        REG.DRV_STATUS,
+        REG.PWM_SCALE,
+        REG.LOST_STEPS,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC5130.
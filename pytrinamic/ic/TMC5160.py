@@ -84,6 +84,33 @@ class TMC5160(TMCIc):
         PWM_AUTO       = 0x72
         LOST_STEPS     = 0x73
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IFCNT,
+        REG.IOIN_OUTPUT,
+        REG.OTP_READ,
+        REG.OFFSET_READ,
+        REG.TSTEP,
+        REG.XACTUAL,
+        REG.VACTUAL,
+        REG.RAMP_STAT,
+        REG.XLATCH,
+        REG.X_ENC,
+        REG.ENC_STATUS,
+        REG.ENC_LATCH,
+        REG.ENC_DEVIATION,
+        REG.MSCNT,
+        REG.MSCURACT,
+        REG.DRV_STATUS,
+        REG.PWM_SCALE,
+        REG.PWM_AUTO,
+        REG.LOST_STEPS,
+    }
+
+    SIGNED_FIELDS = {
+        "XACTUAL", "VACTUAL", "XTARGET", "XLATCH", "X_ENC", "ENC_LATCH", "CUR_A", "CUR_B", "SGT",
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC5160.
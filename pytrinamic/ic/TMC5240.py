@@ -102,6 +102,31 @@ class TMC5240(TMCIc):
         SG4_RESULT	   = 0x75
         SG4_IND        = 0x76
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IFCNT,
+        REG.INP_OUT,
+        REG.TSTEP,
+        REG.XACTUAL,
+        REG.VACTUAL,
+        REG.AACTUAL,
+        REG.RAMPSTAT,
+        REG.XLATCH,
+        REG.XENC,
+        REG.ENC_STATUS,
+        REG.ENC_LATCH,
+        REG.ENC_DEVIATION,
+        REG.ADC_VSUPPLY_AIN,
+        REG.ADC_TEMP,
+        REG.MSCNT,
+        REG.MSCURACT,
+        REG.DRVSTATUS,
+        REG.PWMSCALE,
+        REG.PWM_AUTO,
+        REG.SG4_RESULT,
+        REG.SG4_IND,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC5240.
@@ -121,6 +121,37 @@ class TMC5262(TMCIc):
         DRV_STATUS = 0x6F
         PWMCONF = 0x70
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IOIN,
+        REG.TSTEP,
+        REG.STEPS_LOST,
+        REG.XACTUAL,
+        REG.VACTUAL,
+        REG.AACTUAL,
+        REG.RAMP_STAT,
+        REG.XLATCH,
+        REG.X_ENC,
+        REG.ENC_STATUS,
+        REG.ENC_LATCH,
+        REG.ENC_DEVIATION,
+        REG.CUR_ANGLE_MEAS,
+        REG.PI_RESULTS,
+        REG.COIL_INDUCT,
+        REG.R_COIL,
+        REG.SGP_IND_2_3,
+        REG.SGP_IND_0_1,
+        REG.INDUCTANCE_VOLTAGE,
+        REG.SGP_BEMF,
+        REG.COOLSTEPPLUS_LOAD_RESERVE,
+        REG.TSTEP_VELOCITY,
+        REG.ADC_VSUPPLY_TEMP,
+        REG.ADC_I,
+        REG.MSCNT,
+        REG.MSCURACT,
+        REG.DRV_STATUS,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC5262.
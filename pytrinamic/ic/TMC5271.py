@@ -89,6 +89,30 @@ class TMC5271(TMCIc):
         SG4_RESULT        = 0x40
         SG4_IND           = 0x41
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IFCNT,
+        REG.IOIN,
+        REG.MSLUT_DATA,
+        REG.TSTEP,
+        REG.XACTUAL,
+        REG.VACTUAL,
+        REG.AACTUAL,
+        REG.RAMP_STAT,
+        REG.XLATCH,
+        REG.X_ENC,
+        REG.ENC_STATUS,
+        REG.ENC_LATCH,
+        REG.ENC_DEVIATION,
+        REG.MSCNT,
+        REG.MSCURACT,
+        REG.DRV_STATUS,
+        REG.PWM_SCALE,
+        REG.PWM_AUTO,
+        REG.SG4_RESULT,
+        REG.SG4_IND,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC5271.
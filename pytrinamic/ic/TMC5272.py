@@ -140,6 +140,46 @@ class TMC5272(TMCIc):
         M1_SG4_RESULT        = 0x75
         M1_SG4_IND           = 0x76
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IFCNT,
+        REG.IOIN,
+        REG.M0_TSTEP,
+        REG.M0_XACTUAL,
+        REG.M0_VACTUAL,
+        REG.M0_AACTUAL,
+        REG.M0_RAMP_STAT,
+        REG.M0_XLATCH,
+        REG.M0_X_ENC,
+        REG.M0_ENC_STATUS,
+        REG.M0_ENC_LATCH,
+        REG.M0_ENC_DEVIATION,
+        REG.M0_MSCNT,
+        REG.M0_MSCURACT,
+        REG.M0_DRV_STATUS,
+        REG.M0_PWM_SCALE,
+        REG.M0_PWM_AUTO,
+        REG.M0_SG4_RESULT,
+        REG.M0_SG4_IND,
+        REG.M1_TSTEP,
+        REG.M1_XACTUAL,
+        REG.M1_VACTUAL,
+        REG.M1_AACTUAL,
+        REG.M1_RAMP_STAT,
+        REG.M1_XLATCH,
+        REG.M1_X_ENC,
+        REG.M1_ENC_STATUS,
+        REG.M1_ENC_LATCH,
+        REG.M1_ENC_DEVIATION,
+        REG.M1_MSCNT,
+        REG.M1_MSCURACT,
+        REG.M1_DRV_STATUS,
+        REG.M1_PWM_SCALE,
+        REG.M1_PWM_AUTO,
+        REG.M1_SG4_RESULT,
+        REG.M1_SG4_IND,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC5272.
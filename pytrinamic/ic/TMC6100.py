@@ -27,6 +27,12 @@ class TMC6100(TMCIc):
         SHORT_CONF      = 0x09
         DRV_CONF        = 0x0A
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IOIN_OUTPUT,
+        REG.OTP_READ,
+    }
+
     class FIELD:
 
         # GCONF
@@ -55,6 +55,13 @@ class TMC7300(TMCIc):
         DRV_STATUS    = 0x6F
         PWMCONF       = 0x70
 
+    VOLATILE_REGISTERS = {
+        REG.GSTAT,
+        REG.IFCNT,
+        REG.IOIN,
+        REG.DRV_STATUS,
+    }
+
     class FIELD:
         """
         Define all register bitfields of the TMC7300.
@@ -0,0 +1,84 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import threading
+import types
+
+
+class AxisFields:
+    """
+    Register field access for one axis of an IC.
+
+    Multi-axis ICs (e.g. TMC5072) define per-axis fields as lists like
+    PWM_AMPL = [PWM_AMPL_M1, PWM_AMPL_M2]. In the FIELD attribute of an
+    AxisFields these lists are resolved to the field of the axis once, so
+    FIELD.PWM_AMPL is the (address, mask, shift) tuple of that axis. Fields of
+    single-axis ICs are the same for every axis.
+
+    Example:
+        eval_board.axis(1).FIELD.PWM_AMPL
+        eval_board.axis(1).write(eval_board.axis(1).FIELD.PWM_AMPL, 200)
+    """
+
+    _field_classes = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def resolve(cls, ic, axis):
+        """
+        Return the FIELD class of an IC class or instance with the per-axis
+        fields resolved for the given axis. The result is cached per IC class
+        and axis.
+        """
+        ic_class = ic if isinstance(ic, type) else type(ic)
+        key = (ic_class, axis)
+        with cls._lock:
+            fields = cls._field_classes.get(key)
+            if fields is None:
+                resolved = {}
+                for name, field in vars(getattr(ic_class, "FIELD", object)).items():
+                    if name.startswith("_"):
+                        continue
+                    if isinstance(field, list):
+                        if axis >= len(field):
+                            # The IC has no such field for this axis
+                            continue
+                        field = field[axis]
+                    if isinstance(field, tuple):
+                        resolved[name] = field
+                fields = types.SimpleNamespace(**resolved)
+                cls._field_classes[key] = fields
+            return fields
+
+    def __init__(self, parent, ic, axis):
+        """
+        Parameters:
+        parent: Object providing write_register_field() and read_register_field(), e.g. a TMCLEval.
+        ic: The IC class or instance.
+        axis: Axis index.
+        """
+        self._parent = parent
+        self.axis = axis
+        self.FIELD = self.resolve(ic, axis)
+
+    def write(self, field, value):
+        """
+        Writes a field, e.g. FIELD.VMAX of this AxisFields.
+        """
+        return self._parent.write_register_field(field, value)
+
+    def read(self, field, signed=False):
+        """
+        Reads a field, e.g. FIELD.VMAX of this AxisFields.
+
+        Parameters:
+        field: Register field.
+        signed: Interpret the value as two's complement of the field width.
+        """
+        value = self._parent.read_register_field(field)
+        if signed:
+            sign_bit = ((field[1] >> field[2]) + 1) >> 1
+            value = (value ^ sign_bit) - sign_bit
+        return value
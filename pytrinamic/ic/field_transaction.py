@@ -0,0 +1,102 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+from ..helpers import BitField
+
+
+class FieldTransaction:
+    """
+    Collects register field writes and writes each touched register once.
+
+    While the transaction is active, write_register_field() calls of the
+    owner (e.g. a TMCLEval or a TMC4671) only update the pending register
+    values. On commit each register is read once, unless all of its bits
+    were written, and written once with all fields applied. Leaving the
+    with-statement block commits the transaction, an exception discards it.
+
+    Example:
+        with eval_board.field_transaction():
+            eval_board.write_register_field(TMC5160.FIELD.TOFF, 3)
+            eval_board.write_register_field(TMC5160.FIELD.TBL, 2)
+            eval_board.write_register_field(TMC5160.FIELD.MRES, 4)
+    """
+
+    def __init__(self, owner):
+        """
+        Parameters:
+        owner: Object providing read_register(address) and write_register(address, value).
+        """
+        self._owner = owner
+        self._pending = {}
+        self._nested = False
+
+    def __enter__(self):
+        current = getattr(self._owner, "_field_transaction", None)
+        if current is not None:
+            # A nested transaction is part of the outer one
+            self._nested = True
+            return current
+        self._owner._field_transaction = self
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        del value, traceback
+        if self._nested:
+            return
+        self._owner._field_transaction = None
+        if exit_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    def write_register_field(self, field, value):
+        """
+        Set a field of the pending register value.
+
+        Parameters:
+        field: (address, mask, shift) tuple from the FIELD class of the IC.
+        value: Field value.
+        """
+        address, mask, shift = field
+        pending = self._pending.setdefault(address, [0, 0])
+        pending[0] |= mask
+        pending[1] = BitField.field_set(pending[1], mask, shift, value)
+
+    def read_register_field(self, field):
+        """
+        Read a field, including the pending writes of the transaction.
+        """
+        address, mask, shift = field
+        pending = self._pending.get(address)
+        if pending is not None and pending[0] & mask == mask:
+            return BitField.field_get(pending[1], mask, shift)
+
+        value = self._owner.read_register(address)
+        if pending is not None:
+            value = (value & ~pending[0]) | pending[1]
+        return BitField.field_get(value, mask, shift)
+
+    def commit(self):
+        """
+        Write all pending registers.
+
+        Returns: The number of written registers.
+        """
+        pending, self._pending = self._pending, {}
+        for address, (mask, value) in pending.items():
+            if mask & 0xFFFFFFFF != 0xFFFFFFFF:
+                value |= self._owner.read_register(address) & ~mask & 0xFFFFFFFF
+            self._owner.write_register(address, value & 0xFFFFFFFF)
+        return len(pending)
+
+    def discard(self):
+        """
+        Drop all pending writes.
+        """
+        self._pending = {}
+
+    def __len__(self):
+        """Number of registers with pending writes."""
+        return len(self._pending)
@@ -0,0 +1,95 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+def volatile_registers(ic):
+    """
+    Return the set of the volatile register addresses of an IC, i.e. the
+    registers changing without being written.
+
+    They are declared by the VOLATILE_REGISTERS attribute of the IC class. All
+    registers of an IC without this declaration are volatile.
+    """
+    declared = getattr(ic, "VOLATILE_REGISTERS", None)
+    if declared is None:
+        return {address for _, address in _registers(ic)}
+    return set(declared)
+
+
+def _registers(ic):
+    registers = getattr(ic, "REG", None)
+    if registers is None:
+        return []
+    return [(name, address) for name, address in vars(registers).items()
+            if isinstance(address, int) and not name.startswith("_")]
+
+
+class RegisterCache:
+    """
+    Shadow copy of the non-volatile registers of an IC.
+
+    Each IC class declares the registers changing without being written in a
+    VOLATILE_REGISTERS set of addresses: positions, velocities, measurements,
+    status, event and latch registers, and the data registers of multiplexed
+    registers, whose value depends on the selector. These are always read
+    from the IC. ICs without registers need no declaration.
+
+    Register addresses not known to the IC are treated as volatile, so only
+    the configuration registers of the REG class are cached.
+    """
+
+    def __init__(self, ic=None, volatile=None):
+        """
+        Parameters:
+        ic: The IC whose registers are cached.
+        volatile: Additional volatile register addresses.
+        """
+        known = {address for _, address in _registers(ic)}
+        self._cacheable = known - volatile_registers(ic) - set(volatile or ())
+        self._values = {}
+        self.hits = 0
+        self.misses = 0
+
+    def is_volatile(self, register_address):
+        return register_address not in self._cacheable
+
+    def get(self, register_address):
+        """
+        Returns: The cached register value or None.
+        """
+        value = self._values.get(register_address)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def update(self, register_address, value):
+        """
+        Store a value read from or written to a register. Values of volatile
+        registers are not stored.
+        """
+        if register_address in self._cacheable:
+            self._values[register_address] = value & 0xFFFFFFFF
+
+    def invalidate(self, register_address=None):
+        """
+        Drop the cached value of a register, or of all registers if None.
+        """
+        if register_address is None:
+            self._values.clear()
+        else:
+            self._values.pop(register_address, None)
+
+    def addresses(self):
+        """
+        Returns: The sorted addresses of the cached registers.
+        """
+        return sorted(self._values)
+
+    def __contains__(self, register_address):
+        return register_address in self._values
+
+    def __len__(self):
+        return len(self._values)
@@ -0,0 +1,140 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import threading
+from collections import namedtuple
+
+Field = namedtuple("Field", ["name", "address", "mask", "shift", "signed"])
+
+
+class RegisterDatabase:
+    """
+    Address indexed register and field tables of an IC.
+
+    The tables are built once per IC class from its REG and FIELD classes.
+    Fields listed in the SIGNED_FIELDS attribute of the IC class are decoded
+    as two's complement values of the field width. It is a set of FIELD names,
+    e.g. of positions, velocities or offsets, whose registers hold a signed
+    value. Fields of ICs without this declaration are unsigned.
+
+    Example:
+        database = RegisterDatabase.of(TMC5160)
+        database.decode(TMC5160.REG.CHOPCONF, 0x10410150)
+        database.decode_dump({0x00: 0x00000008, 0x6C: 0x10410150})
+    """
+
+    _databases = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def of(cls, ic):
+        """
+        Return the cached database of an IC class or instance.
+        """
+        ic_class = ic if isinstance(ic, type) else type(ic)
+        with cls._lock:
+            database = cls._databases.get(ic_class)
+            if database is None:
+                database = cls(ic_class)
+                cls._databases[ic_class] = database
+            return database
+
+    def __init__(self, ic):
+        """
+        Parameters:
+        ic: IC class with REG and FIELD classes, e.g. TMC5160.
+        """
+        self.name = ic.__name__
+        self._register_names = {}
+        self._register_addresses = {}
+        for name, address in self._attributes(getattr(ic, "REG", None), int):
+            self._register_addresses[name] = address
+            # Keep the first name of registers with alias names
+            self._register_names.setdefault(address, name)
+
+        signed_fields = set(getattr(ic, "SIGNED_FIELDS", ()))
+        self._fields = {}
+        by_address = {}
+        for name, (address, mask, shift) in self._attributes(getattr(ic, "FIELD", None), tuple):
+            field = Field(name, address, mask, shift, name in signed_fields)
+            self._fields[name] = field
+            by_address.setdefault(address, []).append(field)
+        self._fields_by_address = {address: tuple(sorted(fields, key=lambda field: field.shift))
+                                   for address, fields in by_address.items()}
+
+        # (name, mask, shift, sign bit) per address for decode()
+        self._decoders = {address: tuple((field.name, field.mask, field.shift,
+                                          ((field.mask >> field.shift) + 1) >> 1 if field.signed else 0)
+                                         for field in fields)
+                          for address, fields in self._fields_by_address.items()}
+
+    @staticmethod
+    def _attributes(cls, value_type):
+        if cls is None:
+            return []
+        # Lists of per-axis fields are skipped, their elements are fields of their own
+        return [(name, value) for name, value in vars(cls).items()
+                if isinstance(value, value_type) and not name.startswith("_")]
+
+    def register_name(self, address):
+        """
+        Returns: The name of the register or None if unknown.
+        """
+        return self._register_names.get(address)
+
+    def register_address(self, name):
+        """
+        Returns: The address of the named register. Raises a KeyError if unknown.
+        """
+        return self._register_addresses[name]
+
+    def registers(self):
+        """
+        Returns: A dict of all register addresses and their names.
+        """
+        return dict(self._register_names)
+
+    def field(self, name):
+        """
+        Returns: The Field of the given name. Raises a KeyError if unknown.
+        """
+        return self._fields[name]
+
+    def fields(self, address):
+        """
+        Returns: A tuple of the Fields of a register, ordered by their shift.
+        """
+        return self._fields_by_address.get(address, ())
+
+    def decode(self, address, value):
+        """
+        Split a register value into its fields.
+
+        Parameters:
+        address: Register address.
+        value: Register value.
+
+        Returns: A dict of the field names and values, empty for registers
+        without fields.
+        """
+        fields = {}
+        for name, mask, shift, sign_bit in self._decoders.get(address, ()):
+            field_value = (value & mask) >> shift
+            if field_value & sign_bit:
+                field_value -= sign_bit << 1
+            fields[name] = field_value
+        return fields
+
+    def decode_dump(self, dump):
+        """
+        Split the register values of a register dump into their fields.
+
+        Parameters:
+        dump: A dict of register addresses and values.
+
+        Returns: A dict of the register addresses and the decoded fields,
+        see decode().
+        """
+        return {address: self.decode(address, value) for address, value in dump.items()}
@@ -0,0 +1,121 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+
+class RegisterMultiplexer:
+    """
+    Access to multiplexed registers, i.e. data registers showing the
+    sub-register selected by writing a selector register, e.g. ADC_RAW_DATA
+    and ADC_RAW_ADDR of the TMC4671.
+
+    The IC class declares its multiplexed registers in MULTIPLEXED_REGISTERS,
+    a dict of data register and selector register addresses. The last value
+    written to each selector register is tracked, so a selector is only
+    written when a different sub-register is accessed.
+
+    Bulk accesses are handed to the _access_registers(accesses) function of
+    the owner if it has one, e.g. to send them as one pipelined burst. It gets
+    a list of (address, value) tuples, value None meaning a read, and returns
+    the reply values in the same order.
+    """
+
+    def __init__(self, owner, ic):
+        """
+        Parameters:
+        owner: Object providing read_register(address) and write_register(address, value).
+        ic: The IC class or instance.
+        """
+        self._owner = owner
+        self._selector_registers = dict(getattr(ic, "MULTIPLEXED_REGISTERS", {}))
+        self._selectors = set(self._selector_registers.values())
+        self._selected = {}
+
+    def _selector_register(self, data_register):
+        try:
+            return self._selector_registers[data_register]
+        except KeyError:
+            raise ValueError(f"Register 0x{data_register:02X} is not a multiplexed register") from None
+
+    def track_write(self, register_address, value):
+        """
+        Notes a register write. Writes to selector registers are tracked.
+        """
+        if register_address in self._selectors:
+            self._selected[register_address] = value & 0xFFFFFFFF
+
+    def invalidate(self):
+        """
+        Forgets the tracked selector values, e.g. after an IC reset. The next
+        access writes the selector again.
+        """
+        self._selected.clear()
+
+    def _select(self, data_register, selector):
+        selector_register = self._selector_register(data_register)
+        if self._selected.get(selector_register) != selector:
+            try:
+                self._owner.write_register(selector_register, selector)
+            except Exception:
+                self._selected.pop(selector_register, None)
+                raise
+            self._selected[selector_register] = selector
+
+    def read(self, data_register, selector):
+        """
+        Reads a sub-register of a multiplexed register.
+
+        Parameters:
+        data_register: Address of the data register, e.g. REG.ADC_RAW_DATA.
+        selector: Sub-register to select, e.g. VARIANT.ADC_RAW_ADDR_ADC_I1_RAW_ADC_I0_RAW.
+        """
+        self._select(data_register, selector)
+        return self._owner.read_register(data_register)
+
+    def write(self, data_register, selector, value):
+        """
+        Writes a sub-register of a multiplexed register, e.g. of CONFIG_DATA.
+        """
+        self._select(data_register, selector)
+        return self._owner.write_register(data_register, value)
+
+    def read_many(self, data_register, selectors):
+        """
+        Reads several sub-registers of a multiplexed register in one burst of
+        selector writes and data reads.
+
+        Returns: List of the values in the order of selectors.
+        """
+        selector_register = self._selector_register(data_register)
+        selected = self._selected.get(selector_register)
+        accesses = []
+        for selector in selectors:
+            if selector != selected:
+                accesses.append((selector_register, selector))
+                selected = selector
+            accesses.append((data_register, None))
+
+        try:
+            values = self._access(accesses)
+        except Exception:
+            # The selector may have been written before the burst failed
+            self._selected.pop(selector_register, None)
+            raise
+        if selected is not None:
+            self._selected[selector_register] = selected
+        return [value for (_, written), value in zip(accesses, values) if written is None]
+
+    def _access(self, accesses):
+        bulk_access = getattr(self._owner, "_access_registers", None)
+        if bulk_access is not None:
+            return bulk_access(accesses)
+
+        values = []
+        for address, value in accesses:
+            if value is None:
+                values.append(self._owner.read_register(address))
+            else:
+                self._owner.write_register(address, value)
+                values.append(value)
+        return values
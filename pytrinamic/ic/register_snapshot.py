@@ -0,0 +1,133 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+from array import array
+
+from .register_cache import volatile_registers
+from .register_database import RegisterDatabase
+
+
+class RegisterSnapshot:
+    """
+    Register values of an IC, stored as sorted addresses and an array of
+    unsigned 32 bit values.
+    """
+
+    def __init__(self, ic_name, register_addresses, values):
+        """
+        Parameters:
+        ic_name: Name of the IC class, e.g. "TMC5160".
+        register_addresses: Register addresses.
+        values: Register values in the order of register_addresses.
+        """
+        items = sorted(zip(register_addresses, values))
+        self.ic_name = ic_name
+        self.addresses = tuple(address for address, _ in items)
+        self.values = array("I", (value & 0xFFFFFFFF for _, value in items))
+        self._index = {address: index for index, address in enumerate(self.addresses)}
+
+    def __getitem__(self, register_address):
+        return self.values[self._index[register_address]]
+
+    def __contains__(self, register_address):
+        return register_address in self._index
+
+    def __len__(self):
+        return len(self.addresses)
+
+    def __eq__(self, other):
+        if not isinstance(other, RegisterSnapshot):
+            return NotImplemented
+        return (self.ic_name, self.addresses, self.values) == (other.ic_name, other.addresses, other.values)
+
+    def items(self):
+        """
+        Returns: A list of (address, value) tuples.
+        """
+        return list(zip(self.addresses, self.values))
+
+    def as_dict(self):
+        return dict(zip(self.addresses, self.values))
+
+    def __repr__(self):
+        return "RegisterSnapshot({!r}, {} registers)".format(self.ic_name, len(self))
+
+
+def diff(a, b):
+    """
+    Compare two snapshots.
+
+    Returns: A dict of the addresses of the differing registers and their
+    (value in a, value in b) tuples. The value of a register missing in one
+    of the snapshots is None.
+    """
+    changed = {}
+    for address in sorted(set(a.addresses) | set(b.addresses)):
+        value_a = a[address] if address in a else None
+        value_b = b[address] if address in b else None
+        if value_a != value_b:
+            changed[address] = (value_a, value_b)
+    return changed
+
+
+def read_registers(owner, register_addresses):
+    """
+    Read registers with the read_registers() function of the owner if it has
+    one, otherwise one register after the other.
+    """
+    bulk_read = getattr(owner, "read_registers", None)
+    if bulk_read is not None:
+        return bulk_read(register_addresses)
+    return [owner.read_register(address) for address in register_addresses]
+
+
+def take_snapshot(owner, ic, register_addresses=None):
+    """
+    Read the registers of an IC into a RegisterSnapshot.
+
+    The IC classes don't mark write-only registers. Their read values are
+    meaningless, pass the register addresses without them to leave them out.
+
+    Parameters:
+    owner: Object providing read_register(address), e.g. a TMCLEval.
+    ic: The IC class or instance.
+    register_addresses: Registers to read, per default all non-volatile
+    registers of the IC (see register_cache.volatile_registers()).
+    """
+    if register_addresses is None:
+        volatile = volatile_registers(ic)
+        register_addresses = sorted(set(RegisterDatabase.of(ic).registers()) - volatile)
+    register_addresses = list(register_addresses)
+    values = read_registers(owner, register_addresses)
+    return RegisterSnapshot(RegisterDatabase.of(ic).name, register_addresses, values)
+
+
+def restore_snapshot(owner, ic, snapshot):
+    """
+    Write the registers of a snapshot which differ from the current register
+    values. Volatile registers (see register_cache.volatile_registers()) are
+    not written.
+
+    Parameters:
+    owner: Object providing read_register(address) and write_register(address, value).
+    ic: The IC class or instance.
+    snapshot: RegisterSnapshot of the same IC.
+
+    Returns: The addresses of the written registers.
+    """
+    name = RegisterDatabase.of(ic).name
+    if snapshot.ic_name != name:
+        raise ValueError(f"Snapshot of {snapshot.ic_name} can't be restored to {name}")
+
+    volatile = volatile_registers(ic)
+    register_addresses = [address for address in snapshot.addresses if address not in volatile]
+    current = read_registers(owner, register_addresses)
+
+    written = []
+    for address, value in zip(register_addresses, current):
+        if value & 0xFFFFFFFF != snapshot[address]:
+            owner.write_register(address, snapshot[address])
+            written.append(address)
+    return written
@@ -0,0 +1,53 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import importlib
+import sys
+import types
+
+
+class LazyPackage(types.ModuleType):
+    """
+    Package module type importing its exported names on first access
+    (see PEP 562), e.g. pytrinamic.modules.TMCM1636 only imports the TMCM1636
+    submodule instead of all modules.
+    """
+
+    def __getattr__(self, name):
+        submodule = self.__dict__.get("_lazy_exports", {}).get(name)
+        if submodule is None:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, self.__name__), name)
+        super().__setattr__(name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it to the package. For submodules named
+        # like their class (e.g. TMC2130.TMC2130) bind the class instead, as
+        # the package always exported the class under that name.
+        if (isinstance(value, types.ModuleType) and value.__name__ == f"{self.__name__}.{name}"
+                and name in self.__dict__.get("_lazy_exports", {})):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.__dict__.get("_lazy_exports", {})))
+
+
+def lazy_exports(package_name, exports):
+    """
+    Make the package [package_name] import its exported names lazily.
+
+    Parameters:
+    package_name: __name__ of the package.
+    exports: Dict mapping the exported names to the relative name of the
+    submodule defining them.
+
+    Returns: The list of exported names, to be used as __all__.
+    """
+    package = sys.modules[package_name]
+    package._lazy_exports = exports
+    package.__class__ = LazyPackage
+    return list(exports)
@@ -1,30 +1,36 @@
-from .tmcl_module import TMCLModule
-from .TMCC160 import TMCC160
-from .TMCM1021 import TMCM1021
-from .TMCM1111 import TMCM1111
-from .TMCM1140 import TMCM1140
-from .TMCM1141 import TMCM1141
-from .TMCM1160 import TMCM1160
-from .TMCM1161 import TMCM1161
-from .TMCM1240 import TMCM1240
-from .TMCM1260 import TMCM1260
-from .TMCM1270 import TMCM1270
-from .TMCM1276 import TMCM1276
-from .TMCM1311 import TMCM1311
-from .TMCM1370 import TMCM1370
-from .TMCM1617 import TMCM1617
-from .TMCM1630 import TMCM1630
-from .TMCM1633 import TMCM1633
-from .TMCM1636 import TMCM1636
-from .TMCM1637 import TMCM1637
-from .TMCM1638 import TMCM1638
-from .TMCM1640 import TMCM1640
-from .TMCM1670 import TMCM1670
-from .TMCM3110 import TMCM3110
-from .TMCM3312 import TMCM3312
-from .TMCM3351 import TMCM3351
-from .TMCM6110 import TMCM6110
-from .TMCM6212 import TMCM6212
-from .TMCM6214 import TMCM6214
-from .TMCM123x_0_1 import TMCM123x_0_1
-from .TMCM2611 import TMCM2611
+from ..lazy_import import lazy_exports
+
+# The submodules are imported on first access of their exported names
+__all__ = lazy_exports(__name__, {
+    "TMCLModule": ".tmcl_module",
+    "TMCC160": ".TMCC160",
+    "TMCM1021": ".TMCM1021",
+    "TMCM1111": ".TMCM1111",
+    "TMCM1140": ".TMCM1140",
+    "TMCM1141": ".TMCM1141",
+    "TMCM1160": ".TMCM1160",
+    "TMCM1161": ".TMCM1161",
+    "TMCM1240": ".TMCM1240",
+    "TMCM1260": ".TMCM1260",
+    "TMCM1270": ".TMCM1270",
+    "TMCM1276": ".TMCM1276",
+    "TMCM1311": ".TMCM1311",
+    "TMCM1370": ".TMCM1370",
+    "TMCM1617": ".TMCM1617",
+    "TMCM1630": ".TMCM1630",
+    "TMCM1633": ".TMCM1633",
+    "TMCM1636": ".TMCM1636",
+    "TMCM1637": ".TMCM1637",
+    "TMCM1638": ".TMCM1638",
+    "TMCM1640": ".TMCM1640",
+    "TMCM1670": ".TMCM1670",
+    "TMCM3110": ".TMCM3110",
+    "TMCM3312": ".TMCM3312",
+    "TMCM3351": ".TMCM3351",
+    "TMCM6110": ".TMCM6110",
+    "TMCM6212": ".TMCM6212",
+    "TMCM6214": ".TMCM6214",
+    "TMCM123x_0_1": ".TMCM123x_0_1",
+    "TMCM2611": ".TMCM2611",
+    "ModuleRegistry": ".module_registry",
+})
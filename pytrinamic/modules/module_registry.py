@@ -0,0 +1,166 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import re
+import threading
+
+from .. import modules
+
+# Version strings like "1636V308", "160V1.23" or "1636B100" in bootloader mode
+_VERSION_PATTERN = re.compile(r"(\d{3,4})([VB])")
+
+
+class ModuleRegistry:
+    """
+    Maps the module numbers of firmware version strings to the TMCLModule
+    classes and creates module instances for connected modules.
+
+    The firmware version of a module ID on a port is only requested once per
+    process. Later identifications, e.g. after a reconnect, use the cached
+    version string. Ports are told apart by the port_id of the interface,
+    modules of interfaces without a port_id are identified every time.
+
+    Example:
+        module = ModuleRegistry.create(ConnectionManager().connect())
+    """
+
+    # Module numbers of classes not named TMCM<number> or TMCC<number>
+    _IRREGULAR_NAMES = {
+        1230: "TMCM123x_0_1",
+        1231: "TMCM123x_0_1",
+    }
+
+    _classes = None
+    _versions = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def parse_version(version):
+        """
+        Return the module number and the firmware type ("V" for firmware,
+        "B" for bootloader) of a version string, e.g. (1636, "V") for
+        "1636V308". Returns None for unknown formats.
+        """
+        found = _VERSION_PATTERN.match(version or "")
+        if found is None:
+            return None
+        return int(found.group(1)), found.group(2)
+
+    @classmethod
+    def _class_table(cls):
+        if cls._classes is None:
+            classes = {}
+            # The classes of pytrinamic.modules are imported lazily on lookup
+            for name in modules.__all__:
+                found = re.fullmatch(r"TMC[CM](\d+)", name)
+                if found:
+                    classes[int(found.group(1))] = name
+            for number, name in cls._IRREGULAR_NAMES.items():
+                classes.setdefault(number, name)
+            cls._classes = classes
+        return cls._classes
+
+    @classmethod
+    def register(cls, module_number, module_class):
+        """
+        Register a TMCLModule subclass for a module number, e.g. for custom
+        firmware. Replaces the built-in class of that number.
+        """
+        with cls._lock:
+            cls._class_table()[module_number] = module_class
+
+    @classmethod
+    def module_numbers(cls):
+        """
+        Return the sorted list of the known module numbers.
+        """
+        with cls._lock:
+            return sorted(cls._class_table())
+
+    @classmethod
+    def get_class(cls, module_number):
+        """
+        Return the TMCLModule subclass of a module number or None if unknown.
+        """
+        with cls._lock:
+            module_class = cls._class_table().get(module_number)
+        if isinstance(module_class, str):
+            module_class = getattr(modules, module_class)
+        return module_class
+
+    @staticmethod
+    def _port_key(interface):
+        # None if the interface doesn't know its port, its modules aren't cached
+        return getattr(interface, "port_id", None)
+
+    @classmethod
+    def identify(cls, interface, module_id=None, refresh=False):
+        """
+        Return the firmware version string of a module, e.g. "1636V308".
+
+        :param interface: The TmclInterface the module is connected to.
+        :param int module_id: Module ID, per default the default module ID of the interface.
+        :param bool refresh: Request the version again instead of using the cached one.
+        """
+        if module_id is None:
+            module_id = interface._default_module_id
+        port_key = cls._port_key(interface)
+        if port_key is None:
+            return interface.get_version_string(module_id)
+        key = (port_key, module_id)
+
+        if not refresh:
+            with cls._lock:
+                version = cls._versions.get(key)
+            if version is not None:
+                return version
+
+        version = interface.get_version_string(module_id)
+        parsed = cls.parse_version(version)
+        with cls._lock:
+            if parsed is not None and parsed[1] == "V":
+                cls._versions[key] = version
+            else:
+                # Don't keep e.g. a bootloader version after a firmware update
+                cls._versions.pop(key, None)
+        return version
+
+    @classmethod
+    def forget(cls, interface=None, module_id=None):
+        """
+        Drop cached versions, of one module, of all modules on the port of
+        [interface], or all cached versions if interface is None.
+        """
+        with cls._lock:
+            if interface is None:
+                cls._versions.clear()
+                return
+            port_key = cls._port_key(interface)
+            for key in list(cls._versions):
+                if key[0] == port_key and module_id in (None, key[1]):
+                    del cls._versions[key]
+
+    @classmethod
+    def create(cls, interface, module_id=None, refresh=False):
+        """
+        Identify a module and return an instance of its TMCLModule subclass.
+
+        Raises a ValueError if the module is in bootloader mode or its module
+        number is unknown.
+        """
+        if module_id is None:
+            module_id = interface._default_module_id
+
+        version = cls.identify(interface, module_id, refresh)
+        parsed = cls.parse_version(version)
+        if parsed is None:
+            raise ValueError(f"Invalid version string {version!r} of module {module_id}")
+        if parsed[1] == "B":
+            raise ValueError(f"Module {module_id} is in bootloader mode ({version})")
+
+        module_class = cls.get_class(parsed[0])
+        if module_class is None:
+            raise ValueError(f"Unknown module number {parsed[0]} of module {module_id} ({version})")
+        return module_class(interface, module_id=module_id)
@@ -75,6 +75,59 @@ class TMCLModule(object):
         """
         return self.connection.get_axis_parameter(ap_type, axis, self.module_id, signed, self.ap_index_bit_width)
 
+    def prepare_get_axis_parameter(self, ap_type, axis, signed=False):
+        """
+        Prepares reading the axis parameter for the given axis of this module for
+        repeated use, e.g. polling the actual position in a control loop.
+
+        Parameters:
+        type: Axis parameter type. These can be retrieved from the APs class of this axis.
+        axis: Axis index for the parameter to get from.
+        signed: Indicates whether the value should be interpreted as signed or not.
+
+        Returns: PreparedTmclRequest, calling it returns the axis parameter value.
+        """
+        return self.connection.prepare_get_axis_parameter(ap_type, axis, self.module_id, signed,
+                                                          self.ap_index_bit_width)
+
+    def prepare_set_axis_parameter(self, ap_type, axis):
+        """
+        Prepares writing the axis parameter for the given axis of this module for
+        repeated use.
+
+        Parameters:
+        type: Axis parameter type. These can be retrieved from the APs class of this axis.
+        axis: Axis index for the parameter to be set.
+
+        Returns: PreparedTmclRequest, calling it with a value sets the axis parameter to that value.
+        """
+        return self.connection.prepare_set_axis_parameter(ap_type, axis, self.module_id, self.ap_index_bit_width)
+
+    def set_axis_parameters(self, parameters):
+        """
+        Sets many axis parameters of this module with pipelined requests.
+
+        Parameters:
+        parameters: Iterable of (type, axis, value) rows.
+
+        Returns: List of ParameterReply(index, axis, module_id, value, status) tuples.
+        """
+        return self.connection.set_axis_parameters(parameters, self.module_id, self.ap_index_bit_width)
+
+    def get_axis_parameters(self, parameters, signed=False):
+        """
+        Gets many axis parameters of this module with pipelined requests.
+
+        Parameters:
+        parameters: Iterable of (type, axis) rows, e.g. a list of tuples or a NumPy array with two columns.
+        signed: Indicates whether the values should be interpreted as signed or not.
+
+        Returns: List of ParameterReply(index, axis, module_id, value, status) tuples in the order of parameters.
+        If the module replied with an error status for a parameter, its value is None. If a reply had a wrong
+        checksum, its value and status are None. A link failure, e.g. a timeout, raises a ConnectionError.
+        """
+        return self.connection.get_axis_parameters(parameters, self.module_id, signed, self.ap_index_bit_width)
+
     def set_global_parameter(self, gp_type, bank, value):
         """
         Sets the global parameter on this module identified by type to the given value.
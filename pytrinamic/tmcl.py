@@ -9,6 +9,24 @@
 import struct
 
 _PACKAGE_STRUCTURE = ">BBBBIB"
+_PACKAGE_STRUCT = struct.Struct(_PACKAGE_STRUCTURE)
+
+
+def _check_datagram_size(data, offset=None):
+    """
+    Raise a struct.error like struct.unpack() if [data] holds no datagram at
+    [offset]. Without an offset the buffer must be exactly one datagram.
+    """
+    if offset is None:
+        if len(data) != _PACKAGE_STRUCT.size:
+            raise struct.error(f"A TMCL datagram has {_PACKAGE_STRUCT.size} bytes, got {len(data)}")
+    elif len(data) - offset < _PACKAGE_STRUCT.size:
+        raise struct.error(f"No TMCL datagram at offset {offset} of a {len(data)} byte buffer")
+
+
+def _value_byte_sum(value):
+    """Sum of the four bytes of a 32 bit value, as part of the TMCL checksum."""
+    return (value & 0xFF) + ((value >> 8) & 0xFF) + ((value >> 16) & 0xFF) + (value >> 24)
 
 
 class TMCL:
@@ -28,11 +46,7 @@ class TMCL:
 
     @staticmethod
     def calculate_checksum(data):
-        checksum = 0
-        for d in data:
-            checksum += d
-        checksum &= 0xFF
-        return checksum
+        return sum(data) & 0xFF
 
 
 class TMCLCommand:
@@ -148,6 +162,8 @@ class TMCLStatus:
 
 
 class TMCLRequest:
+    __slots__ = ("moduleAddress", "command", "commandType", "motorBank", "value", "checksum")
+
     def __init__(self, address, command, command_type, motor_bank, value, checksum=None):
         self.moduleAddress = address     & 0xFF
         self.command       = command     & 0xFF
@@ -161,16 +177,23 @@ class TMCLRequest:
 
     @staticmethod
     def from_buffer(data):
-        request_struct = struct.unpack(_PACKAGE_STRUCTURE, data)
-        return TMCLRequest(request_struct[0], request_struct[1], request_struct[2], request_struct[3],
-                           request_struct[4], request_struct[5])
+        _check_datagram_size(data)
+        return TMCLRequest(*_PACKAGE_STRUCT.unpack_from(data))
 
     def calculate_checksum(self):
-        self.checksum = TMCL.calculate_checksum(self.to_buffer()[:-1])
+        self.checksum = (self.moduleAddress + self.command + self.commandType + self.motorBank
+                         + _value_byte_sum(self.value)) & 0xFF
 
     def to_buffer(self):
-        return struct.pack(_PACKAGE_STRUCTURE, self.moduleAddress, self.command,
-                           self.commandType, self.motorBank, self.value, self.checksum)
+        return _PACKAGE_STRUCT.pack(self.moduleAddress, self.command, self.commandType, self.motorBank,
+                                    self.value, self.checksum)
+
+    def pack_into(self, buffer, offset=0):
+        """
+        Write the 9 byte datagram into a writable buffer (e.g. a reused bytearray).
+        """
+        _PACKAGE_STRUCT.pack_into(buffer, offset, self.moduleAddress, self.command, self.commandType,
+                                  self.motorBank, self.value, self.checksum)
 
     def __str__(self):
         return "TMCL_Request: {0:02X},{1:02X},{2:02X},{3:02X},{4:08X},{5:02X}".format(
@@ -184,6 +207,8 @@ class TMCLRequest:
 
 
 class TMCLReply:
+    __slots__ = ("reply_address", "module_address", "status", "command", "value", "checksum", "special")
+
     def __init__(self, reply_address, module_address, status, command, value, checksum=None, special=False):
         self.reply_address  = reply_address  & 0xFF
         self.module_address = module_address & 0xFF
@@ -197,20 +222,41 @@ class TMCLReply:
             self.calculate_checksum()
 
     @staticmethod
-    def from_buffer(data):
-        reply_struct = struct.unpack(_PACKAGE_STRUCTURE, data)
-        return TMCLReply(reply_struct[0], reply_struct[1], reply_struct[2], reply_struct[3],
-                         reply_struct[4], reply_struct[5])
+    def from_buffer(data, offset=None):
+        """
+        Decode a reply from a 9 byte datagram in any buffer (bytes, bytearray,
+        memoryview) without copying it. The unpacked fields are already in
+        range, so the masking of the constructor is skipped.
+
+        Without an [offset] the buffer must be exactly 9 bytes long.
+        """
+        _check_datagram_size(data, offset)
+        reply = TMCLReply.__new__(TMCLReply)
+        (reply.reply_address, reply.module_address, reply.status, reply.command, reply.value,
+         reply.checksum) = _PACKAGE_STRUCT.unpack_from(data, offset or 0)
+        reply.special = False
+        return reply
+
+    def _checksum(self):
+        return (self.reply_address + self.module_address + self.status + self.command
+                + _value_byte_sum(self.value)) & 0xFF
 
     def calculate_checksum(self):
-        self.checksum = TMCL.calculate_checksum(self.to_buffer()[:-1])
+        self.checksum = self._checksum()
 
     def is_checksum_correct(self):
-        return TMCL.calculate_checksum(self.to_buffer()[:-1]) == self.checksum
+        return self._checksum() == self.checksum
 
     def to_buffer(self):
-        return struct.pack(_PACKAGE_STRUCTURE, self.reply_address, self.module_address,
-                           self.status, self.command, self.value, self.checksum)
+        return _PACKAGE_STRUCT.pack(self.reply_address, self.module_address, self.status, self.command,
+                                    self.value, self.checksum)
+
+    def pack_into(self, buffer, offset=0):
+        """
+        Write the 9 byte datagram into a writable buffer (e.g. a reused bytearray).
+        """
+        _PACKAGE_STRUCT.pack_into(buffer, offset, self.reply_address, self.module_address, self.status,
+                                  self.command, self.value, self.checksum)
 
     def __str__(self):
         return "TMCL_Reply:   {0:02X},{1:02X},{2:02X},{3:02X},{4:08X},{5:02X}".format(
@@ -222,9 +268,6 @@ class TMCLReply:
             self.checksum
         )
 
-    def value(self):
-        return self.value
-
     def is_valid(self):
         return self.status == TMCLStatus.SUCCESS
 
@@ -233,6 +276,118 @@ class TMCLReply:
         return str(byte_string, "ascii")
 
 
+class TMCLBatch:
+    """
+    Vectorized codec for arrays of TMCL datagrams, e.g. logged traffic.
+
+    Datagrams are represented as NumPy structured arrays with one 9 byte
+    record per datagram, so decoding a buffer of N*9 bytes does not copy it.
+    The value field is an unsigned big-endian 32 bit integer, use
+    array["value"].astype(">i4") for signed values.
+
+    This class requires NumPy.
+    """
+
+    REQUEST_FIELDS = [("address", "u1"), ("command", "u1"), ("type", "u1"), ("motor", "u1"),
+                      ("value", ">u4"), ("checksum", "u1")]
+    REPLY_FIELDS = [("address", "u1"), ("module", "u1"), ("status", "u1"), ("command", "u1"),
+                    ("value", ">u4"), ("checksum", "u1")]
+
+    _dtypes = {}
+
+    @staticmethod
+    def _numpy():
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError("TMCLBatch requires NumPy (pip install numpy)") from e
+        return numpy
+
+    @staticmethod
+    def _dtype(fields):
+        np = TMCLBatch._numpy()
+        key = id(fields)
+        if key not in TMCLBatch._dtypes:
+            TMCLBatch._dtypes[key] = np.dtype(fields)
+        return TMCLBatch._dtypes[key]
+
+    @staticmethod
+    def request_dtype():
+        return TMCLBatch._dtype(TMCLBatch.REQUEST_FIELDS)
+
+    @staticmethod
+    def reply_dtype():
+        return TMCLBatch._dtype(TMCLBatch.REPLY_FIELDS)
+
+    @staticmethod
+    def _decode(data, dtype):
+        if len(data) % 9:
+            raise ValueError(f"Buffer length {len(data)} is not a multiple of the datagram length 9!")
+        return TMCLBatch._numpy().frombuffer(data, dtype=dtype)
+
+    @staticmethod
+    def decode_requests(data):
+        """
+        Decode a buffer of N*9 bytes into a structured array of N requests
+        with the fields address, command, type, motor, value and checksum.
+        """
+        return TMCLBatch._decode(data, TMCLBatch.request_dtype())
+
+    @staticmethod
+    def decode_replies(data):
+        """
+        Decode a buffer of N*9 bytes into a structured array of N replies
+        with the fields address, module, status, command, value and checksum.
+        """
+        return TMCLBatch._decode(data, TMCLBatch.reply_dtype())
+
+    @staticmethod
+    def _encode(dtype, columns):
+        np = TMCLBatch._numpy()
+        columns = np.broadcast_arrays(*[np.asarray(column) for column in columns])
+        datagrams = np.empty(columns[0].size, dtype=dtype)
+        for name, column in zip(dtype.names, columns):
+            datagrams[name] = column.ravel() & (0xFFFFFFFF if name == "value" else 0xFF)
+        datagrams["checksum"] = TMCLBatch.calculate_checksums(datagrams)
+        return datagrams
+
+    @staticmethod
+    def encode_requests(address, command, command_type, motor_bank, value):
+        """
+        Encode requests from scalars or arrays (broadcast against each other)
+        into a structured array with calculated checksums. Use tobytes() on
+        the result to get the datagrams.
+        """
+        return TMCLBatch._encode(TMCLBatch.request_dtype(), (address, command, command_type, motor_bank, value))
+
+    @staticmethod
+    def encode_replies(reply_address, module_address, status, command, value):
+        """
+        Encode replies from scalars or arrays (broadcast against each other)
+        into a structured array with calculated checksums.
+        """
+        return TMCLBatch._encode(TMCLBatch.reply_dtype(), (reply_address, module_address, status, command, value))
+
+    @staticmethod
+    def calculate_checksums(datagrams):
+        """
+        Calculate the checksums of a structured datagram array (or an N*9
+        byte array) as an uint8 array.
+        """
+        np = TMCLBatch._numpy()
+        raw = np.ascontiguousarray(datagrams).view(np.uint8).reshape(-1, 9)
+        return (raw[:, :8].sum(axis=1, dtype=np.uint32) & 0xFF).astype(np.uint8)
+
+    @staticmethod
+    def is_checksum_correct(datagrams):
+        """
+        Return a bool array telling which datagrams have a correct checksum.
+        """
+        np = TMCLBatch._numpy()
+        raw = np.ascontiguousarray(datagrams).view(np.uint8).reshape(-1, 9)
+        return TMCLBatch.calculate_checksums(raw) == raw[:, 8]
+
+
 class TMCLReplyError(Exception):
     def __init__(self, reply):
         self.reply = reply
@@ -242,6 +397,13 @@ class TMCLReplyChecksumError(TMCLReplyError):
     pass
 
 
+# Raised by the interfaces if no reply has been received in time. It is a
+# ConnectionError like the other link failures, and a RuntimeError as raised
+# by the serial interfaces before.
+class TMCLTimeoutError(ConnectionError, TimeoutError, RuntimeError):
+    pass
+
+
 class TMCLReplyStatusError(TMCLReplyError):
 
     def __get_status_code(self):
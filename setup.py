@@ -26,6 +26,10 @@ setuptools.setup(
         "Extra": [
             "IntelHex>=2.3"
         ],
+        # Optional: Vectorized codecs and register field operations
+        "NumPy": [
+            "numpy"
+        ],
     },
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -0,0 +1,43 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Loopback TMCL interface shared by the tests, no hardware needed."""
+
+from collections import deque
+
+from pytrinamic.connections.tmcl_interface import TmclInterface
+from pytrinamic.connections.can_tmcl_interface import CanTmclInterface
+from pytrinamic.tmcl import TMCLReply, TMCLRequest
+
+
+class LoopbackTmclInterface(TmclInterface):
+    """Replies to every request with value+1, optionally in reversed order."""
+
+    def __init__(self, reverse=False):
+        super().__init__()
+        self.replies = deque()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.reverse = reverse
+
+    def _send(self, host_id, module_id, data):
+        request = TMCLRequest.from_buffer(data)
+        status = 4 if request.commandType == 0xFF else 100
+        reply = TMCLReply(host_id, module_id, status, request.command, request.value + 1)
+        if self.reverse:
+            self.replies.appendleft(reply.to_buffer())
+        else:
+            self.replies.append(reply.to_buffer())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _recv(self, host_id, module_id):
+        self.in_flight -= 1
+        return self.replies.popleft()
+
+    def close(self):
+        pass
+
+    _match_reply = CanTmclInterface._match_reply
@@ -0,0 +1,49 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the AsyncTmclInterface with a loopback interface, no hardware needed."""
+
+import asyncio
+
+import pytest
+
+from pytrinamic.connections.async_tmcl_interface import AsyncTmclInterface
+from pytrinamic.tmcl import TMCLReplyStatusError
+
+from loopback_tmcl_interface import LoopbackTmclInterface
+
+
+def test_concurrent_requests():
+    async def main():
+        loopback = LoopbackTmclInterface(reverse=True)
+        interface = AsyncTmclInterface(loopback, window=3)
+        values = await asyncio.gather(*(interface.set_axis_parameter(0, 0, 10*module_id, module_id)
+                                        for module_id in (3, 4, 5)))
+        assert values == [31, 41, 51]
+        assert loopback.max_in_flight == 3
+
+    asyncio.run(main())
+
+
+def test_window_limits_requests_in_flight():
+    async def main():
+        loopback = LoopbackTmclInterface()
+        interface = AsyncTmclInterface(loopback, window=2)
+        values = await asyncio.gather(*(interface.set_axis_parameter(0, 0, value) for value in range(6)))
+        assert values == list(range(1, 7))
+        assert loopback.max_in_flight == 2
+
+    asyncio.run(main())
+
+
+def test_status_error():
+    async def main():
+        interface = AsyncTmclInterface(LoopbackTmclInterface())
+        with pytest.raises(TMCLReplyStatusError):
+            await interface.get_axis_parameter(0xFF, 0)
+        replies = await interface.get_axis_parameters([(1, 0), (0xFF, 0)])
+        assert [reply.value for reply in replies] == [1, None]
+
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the per-axis field resolution and the IC features with a simulated module, no hardware needed."""
+
+from pytrinamic.connections import SimulatedTmclInterface, SimulatedModule
+from pytrinamic.evalboards import TMC5072_eval, TMC5160_eval
+from pytrinamic.features.linear_ramp_ic import LinearRampIC
+from pytrinamic.features.current_ic import CurrentIC
+from pytrinamic.features.stallguard2_ic import StallGuard2IC
+from pytrinamic.ic import TMC5072, TMC5160
+from pytrinamic.ic.axis_fields import AxisFields
+
+
+def create_eval(eval_class, ic):
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(mc=ic)})
+    return interface, eval_class(interface)
+
+
+def test_axis_fields():
+    _, eval_board = create_eval(TMC5072_eval, TMC5072)
+    assert eval_board.axis(1) is eval_board.axis(1)
+    assert eval_board.axis(0).FIELD.PWM_AMPL == TMC5072.FIELD.PWM_AMPL_M1
+    assert eval_board.axis(1).FIELD.PWM_AMPL == TMC5072.FIELD.PWM_AMPL_M2
+    # Resolved once per IC class and axis
+    assert AxisFields.resolve(TMC5072, 1) is eval_board.axis(1).FIELD
+    assert AxisFields.resolve(eval_board.ics[0], 1) is eval_board.axis(1).FIELD
+    assert not hasattr(AxisFields.resolve(TMC5072, 2), "PWM_AMPL")
+
+    # Fields of single-axis ICs are the same on every axis
+    assert AxisFields.resolve(TMC5160, 0).TOFF == TMC5160.FIELD.TOFF
+
+    axis = eval_board.axis(1)
+    axis.write(axis.FIELD.PWM_AMPL, 200)
+    assert eval_board.read_register_field(TMC5072.FIELD.PWM_AMPL_M2) == 200
+    assert eval_board.read_register_field(TMC5072.FIELD.PWM_AMPL_M1) == 0
+    assert eval_board.read_axis_field(1, TMC5072.FIELD.PWM_AMPL) == 200
+
+    # Signed fields are sign extended from the field width
+    eval_board.write_register(TMC5072.REG.VACTUAL_M2, 0x00FFFFF6)
+    assert eval_board.read_axis_field(1, TMC5072.FIELD.VACTUAL, signed=True) == -10
+    assert eval_board.ics[0].motors[1].actual_velocity == -10
+
+
+def test_ic_features():
+    interface, eval_board = create_eval(TMC5072_eval, TMC5072)
+    motor = eval_board.ics[0].motors[1]
+    motor.move_to(-1000, 5000)
+    assert eval_board.read_register(TMC5072.REG.XTARGET_M2, signed=True) == -1000
+    assert eval_board.read_register(TMC5072.REG.VMAX_M2) == 5000
+    assert motor.target_position == -1000
+    motor.rotate(-300)
+    assert motor.target_velocity == 300
+    assert eval_board.read_register_field(TMC5072.FIELD.RAMPMODE_M2) == 2
+
+    ramp = LinearRampIC(eval_board, eval_board.ics[0], 1)
+    ramp.max_velocity = 1234
+    ramp.max_acceleration = 56
+    assert eval_board.read_register(TMC5072.REG.VMAX_M2) == 1234
+    assert eval_board.read_register(TMC5072.REG.AMAX_M2) == 56
+    assert (ramp.max_velocity, ramp.max_acceleration) == (1234, 56)
+
+    current = CurrentIC(eval_board, eval_board.ics[0], 1)
+    current.run = 20
+    assert eval_board.read_register_field(TMC5072.FIELD.IRUN_M2) == 20
+    assert eval_board.read_register_field(TMC5072.FIELD.IRUN_M1) == 0
+
+    _, eval_board = create_eval(TMC5160_eval, TMC5160)
+    stallguard = StallGuard2IC(eval_board, eval_board.ics[0], 0)
+    stallguard.threshold = -5
+    assert stallguard.threshold == -5
+    assert eval_board.read_register_field(TMC5160.FIELD.SGT) == 0x7B
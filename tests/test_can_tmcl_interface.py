@@ -0,0 +1,81 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the reply dispatcher of the CanTmclInterface with a simulated bus, no hardware needed."""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pytrinamic.connections.can_tmcl_interface import CanTmclInterface
+from pytrinamic.tmcl import TMCLRequest, TMCLReply, TMCLCommand
+
+
+class SimulatedBusTmclInterface(CanTmclInterface):
+    """Each module replies with value+module_id after a delay depending on its module ID."""
+
+    def __init__(self, silent_modules=()):
+        CanTmclInterface.__init__(self, "sim", 1000000, 2, 1, 0.5)
+        self._frames = queue.Queue()
+        self.silent_modules = silent_modules
+
+    def _send(self, host_id, module_id, data):
+        request = TMCLRequest.from_buffer(data)
+        if module_id in self.silent_modules:
+            return
+        reply = TMCLReply(2, module_id, 100, request.command, request.value + module_id)
+        threading.Timer(0.005 * (6 - module_id), self._frames.put, [reply.to_buffer()]).start()
+
+    def _recv(self, host_id, module_id):
+        try:
+            return self._frames.get(timeout=self._timeout_s)
+        except queue.Empty:
+            raise ConnectionError("Recv timed out") from None
+
+
+def test_can_concurrent_modules():
+    interface = SimulatedBusTmclInterface()
+
+    def worker(module_id):
+        return [interface.get_global_parameter(0, 0, module_id) for _ in range(10)]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(worker, (3, 4, 5)))
+
+    assert results == [[3] * 10, [4] * 10, [5] * 10]
+    assert not interface._pending
+
+
+def test_can_timeout_of_one_module():
+    interface = SimulatedBusTmclInterface(silent_modules=(7,))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        silent = executor.submit(interface.get_global_parameter, 0, 0, 7)
+        values = [interface.get_global_parameter(0, 0, 4) for _ in range(5)]
+        with pytest.raises(ConnectionError):
+            silent.result()
+
+    assert values == [4] * 5
+    assert not interface._pending
+
+
+class VersionBusTmclInterface(SimulatedBusTmclInterface):
+    """Modules reply to the ASCII version request with "<module_id>V100"."""
+
+    def _send(self, host_id, module_id, data):
+        request = TMCLRequest.from_buffer(data)
+        if request.command != TMCLCommand.GET_FIRMWARE_VERSION or request.commandType != 0:
+            return SimulatedBusTmclInterface._send(self, host_id, module_id, data)
+        reply = bytes([host_id]) + "{:04d}V100".format(module_id).encode("ascii")
+        threading.Timer(0.005, self._frames.put, [reply]).start()
+
+
+def test_can_version_string():
+    interface = VersionBusTmclInterface()
+    assert interface.get_version_string(3) == "0003V100"
+    assert interface.get_global_parameter(0, 0, 4) == 4
+    assert not interface._pending
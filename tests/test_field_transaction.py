@@ -0,0 +1,113 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the batching of register field writes with a simulated module, no hardware needed."""
+
+import struct
+
+import pytest
+
+from pytrinamic.connections import SimulatedTmclInterface, SimulatedModule
+from pytrinamic.evalboards import TMC5160_eval
+from pytrinamic.ic import TMC5160, TMC4671
+from pytrinamic.tmcl import TMCLCommand
+
+
+class UartIcConnection:
+    """Answers the 5 byte register datagrams of the direct UART access."""
+
+    def __init__(self):
+        self.registers = {}
+        self.datagrams = 0
+
+    def send_datagram(self, data, recv_size):
+        assert recv_size == 5
+        self.datagrams += 1
+        address, value = struct.unpack(">BI", data)
+        if address & 0x80:
+            self.registers[address & 0x7F] = value
+        return struct.pack(">BI", address & 0x7F, self.registers.get(address & 0x7F, 0))
+
+
+def configure_chopper(eval_board):
+    eval_board.write_register_field(TMC5160.FIELD.TOFF, 3)
+    eval_board.write_register_field(TMC5160.FIELD.TFD_2__0_, 4)
+    eval_board.write_register_field(TMC5160.FIELD.OFFSET, 1)
+    eval_board.write_register_field(TMC5160.FIELD.TBL, 2)
+    eval_board.write_register_field(TMC5160.FIELD.MRES, 4)
+    eval_board.write_register_field(TMC5160.FIELD.IRUN, 31)
+    eval_board.write_register_field(TMC5160.FIELD.IHOLD, 8)
+
+
+def test_field_transaction():
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(mc=TMC5160)})
+    statistics = interface.enable_statistics()
+    eval_board = TMC5160_eval(interface)
+    eval_board.write_register(TMC5160.REG.CHOPCONF, 0x10000000)
+    statistics.reset()
+
+    with eval_board.field_transaction() as transaction:
+        configure_chopper(eval_board)
+        assert len(transaction) == 2
+        # The pending values are visible within the transaction
+        assert eval_board.read_register_field(TMC5160.FIELD.MRES) == 4
+        assert statistics.count() == 0
+    # One read and one write per register
+    assert statistics.count(TMCLCommand.READ_MC) == 2
+    assert statistics.count(TMCLCommand.WRITE_MC) == 2
+
+    chopconf = eval_board.read_register(TMC5160.REG.CHOPCONF)
+    assert chopconf & 0x10000000
+    for field, value in ((TMC5160.FIELD.TOFF, 3), (TMC5160.FIELD.TFD_2__0_, 4), (TMC5160.FIELD.OFFSET, 1),
+                         (TMC5160.FIELD.TBL, 2), (TMC5160.FIELD.MRES, 4)):
+        assert eval_board.read_register_field(field) == value
+    assert eval_board.read_register_field(TMC5160.FIELD.IRUN) == 31
+
+    # Fields covering the whole register need no read, cached registers neither
+    eval_board.enable_register_cache()
+    eval_board.read_register(TMC5160.REG.CHOPCONF)
+    statistics.reset()
+    with eval_board.field_transaction():
+        eval_board.write_register_field(TMC5160.FIELD.XACTUAL, -5)
+        eval_board.write_register_field(TMC5160.FIELD.TOFF, 5)
+    assert statistics.count(TMCLCommand.READ_MC) == 0
+    assert statistics.count(TMCLCommand.WRITE_MC) == 2
+    assert eval_board.read_register(TMC5160.REG.XACTUAL, signed=True) == -5
+
+
+def test_field_transaction_discard():
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(mc=TMC5160)})
+    statistics = interface.enable_statistics()
+    eval_board = TMC5160_eval(interface)
+
+    with pytest.raises(RuntimeError):
+        with eval_board.field_transaction():
+            eval_board.write_register_field(TMC5160.FIELD.TOFF, 3)
+            raise RuntimeError()
+    assert statistics.count() == 0
+    assert eval_board.read_register_field(TMC5160.FIELD.TOFF) == 0
+
+    # Nested transactions are committed with the outer one
+    with eval_board.field_transaction() as outer:
+        with eval_board.field_transaction() as inner:
+            eval_board.write_register_field(TMC5160.FIELD.TOFF, 3)
+        assert inner is outer
+        assert len(outer) == 1
+    assert eval_board.read_register_field(TMC5160.FIELD.TOFF) == 3
+
+
+def test_field_transaction_uart():
+    connection = UartIcConnection()
+    ic = TMC4671(connection)
+    ic.write_register_field(TMC4671.FIELD.N_POLE_PAIRS, 4)
+    ic.write_register_field(TMC4671.FIELD.MOTOR_TYPE, 3)
+    assert connection.datagrams == 4
+
+    connection.datagrams = 0
+    with ic.field_transaction():
+        ic.write_register_field(TMC4671.FIELD.N_POLE_PAIRS, 7)
+        ic.write_register_field(TMC4671.FIELD.MOTOR_TYPE, 1)
+    assert connection.datagrams == 2
+    assert connection.registers[TMC4671.REG.MOTOR_TYPE_N_POLE_PAIRS] == 0x00010007
@@ -0,0 +1,54 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the register field helpers, the array versions are compared with the scalar ones."""
+
+import pytest
+
+from pytrinamic.helpers import BitField, to_signed_32
+from pytrinamic.ic import TMC5160, TMC4671
+
+SAMPLES = [0x00000000, 0x80130155, 0x001F03FF, 0xFFFFFFFF, 0x7F0A0000, 0x12345678]
+
+
+def test_bit_field_array():
+    np = pytest.importorskip("numpy")
+    from pytrinamic.helpers import BitFieldArray
+
+    samples = np.array(SAMPLES, dtype=np.uint32)
+    for field in (TMC5160.FIELD.SG_RESULT, TMC5160.FIELD.CS_ACTUAL, TMC5160.FIELD.STST):
+        values = BitFieldArray.get(samples, field)
+        assert values.dtype == np.uint32
+        assert values.tolist() == [BitField.field_get(sample, field[1], field[2]) for sample in SAMPLES]
+
+    # Signed register values are accepted as well
+    assert BitFieldArray.get(samples.view(np.int32), TMC5160.FIELD.STST).tolist() == [0, 1, 0, 1, 0, 0]
+
+    # Sign extension from the field width
+    sgt = BitFieldArray.get(np.array([0x007F0000, 0x003F0000, 0x00400000]), TMC5160.FIELD.SGT, signed=True)
+    assert sgt.dtype == np.int32
+    assert sgt.tolist() == [-1, 63, -64]
+    assert BitFieldArray.to_signed_32(samples).tolist() == [to_signed_32(sample) for sample in SAMPLES]
+
+    toff = TMC5160.FIELD.TOFF
+    assert BitFieldArray.set(samples, toff, 3).tolist() == \
+        [BitField.field_set(sample, toff[1], toff[2], 3) for sample in SAMPLES]
+    assert BitFieldArray.field_set(np.zeros(3), 0xF0, 4, np.arange(3)).tolist() == [0x00, 0x10, 0x20]
+
+
+def test_bit_field_array_decode():
+    np = pytest.importorskip("numpy")
+    from pytrinamic.helpers import BitFieldArray
+
+    drv_status = BitFieldArray.decode(TMC5160, TMC5160.REG.DRV_STATUS, SAMPLES)
+    assert drv_status.shape == (len(SAMPLES),)
+    assert drv_status["SG_RESULT"].tolist() == [sample & 0x3FF for sample in SAMPLES]
+    assert drv_status["CS_ACTUAL"].tolist() == [(sample >> 16) & 0x1F for sample in SAMPLES]
+    assert drv_status["STST"].tolist() == [sample >> 31 for sample in SAMPLES]
+
+    actual = BitFieldArray.decode(TMC4671, TMC4671.REG.PID_TORQUE_FLUX_ACTUAL, np.array([[0xFFFF0010, 0x7FFF8000]]))
+    assert actual.shape == (1, 2)
+    assert actual["PID_TORQUE_ACTUAL"].tolist() == [[-1, 0x7FFF]]
+    assert actual["PID_FLUX_ACTUAL"].tolist() == [[16, -0x8000]]
@@ -0,0 +1,57 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the lazy imports, each import is run in a fresh interpreter."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+PACKAGES = ["pytrinamic.connections", "pytrinamic.modules", "pytrinamic.evalboards", "pytrinamic.ic"]
+
+
+def run_import(statement):
+    """
+    Execute the import [statement] in a new interpreter and return the names
+    of the imported modules.
+    """
+    script = (
+        "import json, sys\n"
+        f"{statement}\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_package_import_is_lazy(package):
+    modules = run_import(f"import {package}")
+    submodules = {module for module in modules if module.startswith(package + ".")}
+    assert submodules == set()
+    assert not {"can", "canopen", "serial"} & modules
+
+
+def test_single_class_import():
+    modules = run_import("from pytrinamic.modules import TMCM1636")
+    assert "pytrinamic.modules.TMCM1636" in modules
+    assert "pytrinamic.modules.TMCM1140" not in modules
+
+    modules = run_import("from pytrinamic.evalboards import TMC5160_eval")
+    assert "pytrinamic.ic.TMC5160" in modules
+    assert "pytrinamic.ic.TMC2130" not in modules
+
+    # The ConnectionManager only imports the selected interface
+    modules = run_import("from pytrinamic.connections import ConnectionManager; "
+                            "ConnectionManager('--interface serial_tmcl')")
+    assert "pytrinamic.connections.serial_tmcl_interface" in modules
+    assert not {"can", "canopen", "pytrinamic.connections.can_tmcl.pcan_tmcl_interface"} & modules
+
+
+def test_top_level_import():
+    modules = run_import("import pytrinamic; from pytrinamic.connections import ConnectionManager")
+    assert not {"serial", "can", "usb"} & modules
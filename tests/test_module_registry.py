@@ -0,0 +1,99 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the module identification with simulated modules, no hardware needed."""
+
+import pytest
+
+from pytrinamic.connections import SimulatedTmclInterface, SimulatedModule
+from pytrinamic.modules import ModuleRegistry, TMCLModule, TMCM1636, TMCM6214, TMCM123x_0_1
+
+
+@pytest.fixture
+def registry():
+    yield ModuleRegistry
+    ModuleRegistry.forget()
+
+
+class CountingInterface(SimulatedTmclInterface):
+
+    def __init__(self, port, modules):
+        SimulatedTmclInterface.__init__(self, port, modules=modules)
+        self.version_requests = 0
+
+    def get_version_string(self, module_id=None):
+        self.version_requests += 1
+        return SimulatedTmclInterface.get_version_string(self, module_id)
+
+
+def test_parse_version():
+    assert ModuleRegistry.parse_version("1636V308") == (1636, "V")
+    assert ModuleRegistry.parse_version("160V1.23") == (160, "V")
+    assert ModuleRegistry.parse_version("6214B102") == (6214, "B")
+    assert ModuleRegistry.parse_version("garbage!") is None
+
+
+def test_module_classes():
+    assert ModuleRegistry.get_class(1636) is TMCM1636
+    assert ModuleRegistry.get_class(1231) is TMCM123x_0_1
+    assert ModuleRegistry.get_class(9999) is None
+    assert 6214 in ModuleRegistry.module_numbers()
+
+
+def test_create(registry):
+    modules = {1: SimulatedModule(TMCM1636, version="1636V308"), 2: SimulatedModule(TMCM6214, version="6214V105"),
+               3: SimulatedModule(version="9999V100"), 4: SimulatedModule(version="1636B100")}
+    interface = CountingInterface("create", modules)
+
+    module = registry.create(interface)
+    assert isinstance(module, TMCM1636) and module.module_id == 1
+    assert isinstance(registry.create(interface, 2), TMCM6214)
+    with pytest.raises(ValueError, match="Unknown module number"):
+        registry.create(interface, 3)
+    with pytest.raises(ValueError, match="bootloader"):
+        registry.create(interface, 4)
+    assert interface.version_requests == 4
+
+    # Reconnecting to the same port skips the version requests of known modules
+    interface = CountingInterface("create", modules)
+    assert isinstance(registry.create(interface, 2), TMCM6214)
+    assert interface.version_requests == 0
+    registry.create(interface, 2, refresh=True)
+    assert interface.version_requests == 1
+    registry.forget(interface, 2)
+    registry.create(interface, 2)
+    assert interface.version_requests == 2
+    with pytest.raises(ValueError, match="bootloader"):
+        registry.create(interface, 4)
+    assert interface.version_requests == 3
+
+    # Other ports have their own modules
+    other = CountingInterface("other", {2: SimulatedModule(TMCM1636, version="1636V308")})
+    assert isinstance(registry.create(other, 2), TMCM1636)
+
+
+def test_register(registry, monkeypatch):
+    monkeypatch.setattr(ModuleRegistry, "_classes", None)
+
+    class CustomModule(TMCLModule):
+        pass
+
+    registry.register(9999, CustomModule)
+    interface = SimulatedTmclInterface("register", modules={5: SimulatedModule(version="9999V100")})
+    assert type(registry.create(interface, 5)) is CustomModule
+
+
+def test_port_identity(registry):
+    modules = {1: SimulatedModule(TMCM1636, version="1636V308")}
+    assert CountingInterface("a", modules).port_id != CountingInterface("b", modules).port_id
+
+    # Interfaces without a port identity aren't cached
+    class AnonymousInterface(CountingInterface):
+        port_id = None
+
+    interface = AnonymousInterface("a", modules)
+    registry.create(interface)
+    registry.create(interface)
+    assert interface.version_requests == 2
@@ -0,0 +1,86 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the cached and parallel port listing of the ConnectionManager, no hardware needed."""
+
+import time
+
+from pytrinamic.connections import ConnectionManager, PortListCache, SimulatedTmclInterface
+
+
+class SlowInterface:
+    delay_s = 0.2
+    calls = 0
+    ports = ["port0", "port1"]
+
+    @classmethod
+    def list(cls):
+        cls.calls += 1
+        time.sleep(cls.delay_s)
+        return list(cls.ports)
+
+
+class OtherSlowInterface(SlowInterface):
+    ports = ["other0"]
+
+
+class BrokenInterface:
+    @staticmethod
+    def list():
+        raise OSError("Driver not installed")
+
+
+def test_port_list_cache(monkeypatch):
+    cache = PortListCache(ttl_s=60)
+    SlowInterface.calls = 0
+
+    assert cache.list(SlowInterface) == ["port0", "port1"]
+    start = time.perf_counter()
+    assert cache.list(SlowInterface) == ["port0", "port1"]
+    assert time.perf_counter() - start < SlowInterface.delay_s / 2
+    assert SlowInterface.calls == 1
+
+    # A changed device state, e.g. a plugged in adapter, invalidates the cache
+    monkeypatch.setattr(PortListCache, "_device_state", classmethod(lambda cls: ("changed",)))
+    cache.list(SlowInterface)
+    assert SlowInterface.calls == 2
+    cache.list(SlowInterface)
+    assert SlowInterface.calls == 2
+
+    cache.list(SlowInterface, refresh=True)
+    assert SlowInterface.calls == 3
+    cache.invalidate(SlowInterface)
+    cache.list(SlowInterface)
+    assert SlowInterface.calls == 4
+
+    cache.ttl_s = 0
+    cache.list(SlowInterface)
+    assert SlowInterface.calls == 5
+
+
+def test_port_list_cache_parallel():
+    cache = PortListCache()
+    start = time.perf_counter()
+    port_lists = cache.list_many([SlowInterface, OtherSlowInterface, BrokenInterface])
+    assert time.perf_counter() - start < 2 * SlowInterface.delay_s
+    assert port_lists == {SlowInterface: ["port0", "port1"], OtherSlowInterface: ["other0"], BrokenInterface: []}
+
+
+def test_connection_manager_port_cache(monkeypatch):
+    monkeypatch.setattr(ConnectionManager, "PORT_CACHE", PortListCache())
+    calls = []
+    monkeypatch.setattr(SimulatedTmclInterface, "list", staticmethod(lambda: calls.append(1) or ["sim"]))
+
+    connection_manager = ConnectionManager("--interface simulated_tmcl")
+    for _ in range(3):
+        connection_manager.connect()
+        connection_manager.disconnect()
+    assert len(calls) == 1
+
+    assert ConnectionManager.list_all_connections(["simulated_tmcl", "replay_tmcl"]) == {
+        "simulated_tmcl": ["sim"],
+        "replay_tmcl": [],
+    }
+    assert len(calls) == 1
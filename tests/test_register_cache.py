@@ -0,0 +1,99 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the register shadow cache of the eval boards with a simulated module, no hardware needed."""
+
+from pytrinamic.connections import SimulatedTmclInterface, SimulatedModule
+from pytrinamic.evalboards import TMC5160_eval
+from pytrinamic.ic import MAX22216, TMC4361, TMC4671, TMC5160
+from pytrinamic.ic.register_cache import RegisterCache, volatile_registers
+from pytrinamic.tmcl import TMCLCommand
+
+
+def configure(eval_board):
+    eval_board.write_register_field(TMC5160.FIELD.EN_PWM_MODE, 1)
+    eval_board.write_register_field(TMC5160.FIELD.MULTISTEP_FILT, 1)
+    eval_board.write_register_field(TMC5160.FIELD.IHOLD, 8)
+    eval_board.write_register_field(TMC5160.FIELD.IRUN, 31)
+    eval_board.write_register_field(TMC5160.FIELD.IHOLDDELAY, 6)
+    eval_board.write_register_field(TMC5160.FIELD.TOFF, 3)
+    eval_board.write_register_field(TMC5160.FIELD.TBL, 2)
+    eval_board.write_register(TMC5160.REG.AMAX, 1000)
+
+
+def test_volatile_registers():
+    volatile = volatile_registers(TMC5160)
+    for register in (TMC5160.REG.XACTUAL, TMC5160.REG.VACTUAL, TMC5160.REG.DRV_STATUS, TMC5160.REG.RAMP_STAT,
+                     TMC5160.REG.GSTAT, TMC5160.REG.TSTEP):
+        assert register in volatile
+    for register in (TMC5160.REG.GCONF, TMC5160.REG.CHOPCONF, TMC5160.REG.IHOLD_IRUN, TMC5160.REG.VMAX):
+        assert register not in volatile
+    # Declared by the IC class
+    assert TMC4671.REG.ABN_DECODER_COUNT in volatile_registers(TMC4671)
+    assert TMC4671.REG.PID_VELOCITY_ACTUAL in volatile_registers(TMC4671)
+    assert TMC4671.REG.PID_VELOCITY_LIMIT not in volatile_registers(TMC4671)
+    for register in (MAX22216.REG.FAULT0, MAX22216.REG.I_DC_0, MAX22216.REG.R_3, MAX22216.REG.U_AC_SCAN):
+        assert register in volatile_registers(MAX22216)
+    for register in (TMC4361.REG.EVENTS, TMC4361.REG.ENC_POS, TMC4361.REG.X_PIPE0, TMC4361.REG.CURRENTA_B):
+        assert register in volatile_registers(TMC4361)
+
+    # All registers of ICs without a declaration are volatile
+    class UndeclaredIC:
+        class REG:
+            CONF = 0x00
+            STATUS = 0x01
+
+    assert volatile_registers(UndeclaredIC) == {0x00, 0x01}
+    assert RegisterCache(UndeclaredIC).is_volatile(0x00)
+
+    cache = RegisterCache(TMC5160, volatile=[TMC5160.REG.XTARGET])
+    assert cache.is_volatile(TMC5160.REG.XTARGET)
+    assert cache.is_volatile(0x7F)
+
+
+def test_register_cache_traffic():
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(mc=TMC5160)})
+    statistics = interface.enable_statistics()
+    eval_board = TMC5160_eval(interface)
+
+    configure(eval_board)
+    uncached = statistics.count()
+    statistics.reset()
+
+    # Each register is read once, then field writes don't need a read
+    eval_board.enable_register_cache()
+    assert "read_register" not in vars(eval_board)
+    configure(eval_board)
+    assert statistics.count(TMCLCommand.READ_MC) == 3  # GCONF, IHOLD_IRUN, CHOPCONF
+    statistics.reset()
+    configure(eval_board)
+    cached = statistics.count()
+    assert cached <= uncached // 2 + 1
+    assert statistics.count(TMCLCommand.READ_MC) == 0
+    assert eval_board.read_register_field(TMC5160.FIELD.IRUN) == 31
+    assert eval_board.read_register(TMC5160.REG.AMAX) == 1000
+    assert statistics.count() == cached
+
+    # Volatile registers always go to the module
+    for _ in range(3):
+        eval_board.read_register(TMC5160.REG.XACTUAL, signed=True)
+    assert statistics.count() == cached + 3
+
+    # Changes by others are only seen after an invalidation or refresh
+    interface.modules[1].registers[TMCLCommand.READ_MC][(0, TMC5160.REG.AMAX)] = 500
+    assert eval_board.read_register(TMC5160.REG.AMAX) == 1000
+    eval_board.invalidate_register_cache(TMC5160.REG.AMAX)
+    assert eval_board.read_register(TMC5160.REG.AMAX) == 500
+    interface.modules[1].registers[TMCLCommand.READ_MC][(0, TMC5160.REG.AMAX)] = 0xFFFFFFFF
+    eval_board.refresh_register_cache()
+    assert eval_board.read_register(TMC5160.REG.AMAX, signed=True) == -1
+    assert eval_board.register_cache.addresses() == sorted([TMC5160.REG.GCONF, TMC5160.REG.IHOLD_IRUN,
+                                                            TMC5160.REG.CHOPCONF, TMC5160.REG.AMAX])
+
+    eval_board.disable_register_cache()
+    statistics.reset()
+    eval_board.read_register(TMC5160.REG.AMAX)
+    assert statistics.count() == 1
+    assert eval_board.register_cache is None
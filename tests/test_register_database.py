@@ -0,0 +1,70 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the register database built from the REG and FIELD classes of the ICs."""
+
+import pytest
+
+import pytrinamic.ic
+from pytrinamic.ic import TMC5160, TMC5072, TMC4671
+from pytrinamic.ic.register_database import RegisterDatabase, Field
+
+
+def test_register_database():
+    database = RegisterDatabase.of(TMC5160)
+    assert RegisterDatabase.of(TMC5160()) is database
+
+    assert database.register_name(TMC5160.REG.CHOPCONF) == "CHOPCONF"
+    assert database.register_name(0x7F) is None
+    assert database.register_address("CHOPCONF") == 0x6C
+    assert database.field("TOFF") == Field("TOFF", 0x6C, 0x0000000F, 0, False)
+    assert database.field("XACTUAL").signed
+    with pytest.raises(KeyError):
+        database.field("NO_FIELD")
+
+    fields = database.fields(TMC5160.REG.CHOPCONF)
+    assert [field.shift for field in fields] == sorted(field.shift for field in fields)
+    assert {"TOFF", "TBL", "MRES", "INTPOL"} <= {field.name for field in fields}
+    assert database.fields(0x7F) == ()
+
+
+def test_decode():
+    database = RegisterDatabase.of(TMC5160)
+    chopconf = database.decode(TMC5160.REG.CHOPCONF, 0x14010003)
+    assert chopconf["TOFF"] == 3
+    assert chopconf["TBL"] == 2
+    assert chopconf["MRES"] == 4
+    assert chopconf["INTPOL"] == 1
+    assert chopconf["CHM"] == 0
+
+    # Two's complement of the field width
+    assert database.decode(TMC5160.REG.XACTUAL, 0xFFFFFFFE) == {"XACTUAL": -2}
+    assert database.decode(TMC5160.REG.COOLCONF, 0x007F0000)["SGT"] == -1
+    assert database.decode(TMC5160.REG.COOLCONF, 0x003F0000)["SGT"] == 63
+    assert database.decode(TMC5160.REG.VMAX, 0xFFFFFFFF)["VMAX"] == 0x7FFFFF
+
+    dump = database.decode_dump({TMC5160.REG.CHOPCONF: 0x14010003, 0x7F: 1})
+    assert dump[TMC5160.REG.CHOPCONF] == chopconf
+    assert dump[0x7F] == {}
+
+    # Per-axis field lists are covered by their elements
+    database = RegisterDatabase.of(TMC5072)
+    assert database.decode(TMC5072.REG.XACTUAL_M2, 0x80000000) == {"XACTUAL_M2": -0x80000000}
+
+    database = RegisterDatabase.of(TMC4671)
+    fields = database.decode(TMC4671.REG.PID_TORQUE_FLUX_ACTUAL, 0xFFFF0010)
+    assert fields == {"PID_FLUX_ACTUAL": 16, "PID_TORQUE_ACTUAL": -1}
+
+
+@pytest.mark.parametrize("name", pytrinamic.ic.__all__)
+def test_register_database_of_all_ics(name):
+    ic = getattr(pytrinamic.ic, name)
+    database = RegisterDatabase.of(ic)
+    for signed_field in getattr(ic, "SIGNED_FIELDS", ()):
+        assert database.field(signed_field).signed
+    for address in database.registers():
+        for field in database.fields(address):
+            assert field.mask >> field.shift << field.shift == field.mask
+            assert database.decode(address, field.mask)[field.name] != 0
@@ -0,0 +1,119 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the access to the TMC4671 multiplexed registers, no hardware needed."""
+
+import struct
+
+import pytest
+
+from pytrinamic.connections import SimulatedTmclInterface, SimulatedModule
+from pytrinamic.evalboards import TMC4671_eval
+from pytrinamic.ic import TMC4671
+from pytrinamic.tmcl import TMCLCommand
+
+ADC_RAW = TMC4671.REG.ADC_RAW_DATA
+I1_I0 = TMC4671.VARIANT.ADC_RAW_ADDR_ADC_I1_RAW_ADC_I0_RAW
+VM_AGPI_A = TMC4671.VARIANT.ADC_RAW_ADDR_ADC_AGPI_A_RAW_ADC_VM_RAW
+
+
+class UartIcConnection:
+    """Answers register datagrams, ADC_RAW_DATA shows the selected ADC_RAW_ADDR sub-register."""
+
+    def __init__(self):
+        self.registers = {}
+        self.adc_raw = {I1_I0: 0x01000200, VM_AGPI_A: 0x03000400}
+        self.datagrams = 0
+        self.bursts = 0
+
+    def send_datagram(self, data, recv_size):
+        self.datagrams += 1
+        address, value = struct.unpack(">BI", data)
+        if address & 0x80:
+            self.registers[address & 0x7F] = value
+        elif address == ADC_RAW:
+            value = self.adc_raw.get(self.registers.get(TMC4671.REG.ADC_RAW_ADDR, 0), 0)
+        else:
+            value = self.registers.get(address, 0)
+        return struct.pack(">BI", address & 0x7F, value)
+
+    def send_datagrams(self, datagrams, recv_size):
+        self.bursts += 1
+        return [self.send_datagram(datagram, recv_size) for datagram in datagrams]
+
+
+def test_multiplexed_eval():
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(mc=TMC4671)})
+    statistics = interface.enable_statistics()
+    eval_board = TMC4671_eval(interface)
+
+    for _ in range(10):
+        eval_board.read_multiplexed(ADC_RAW, I1_I0)
+    # The selector is written once
+    assert statistics.count(TMCLCommand.WRITE_MC) == 1
+    assert statistics.count(TMCLCommand.READ_MC) == 10
+
+    statistics.reset()
+    eval_board.read_multiplexed(ADC_RAW, VM_AGPI_A)
+    eval_board.write_register(TMC4671.REG.ADC_RAW_ADDR, I1_I0)
+    eval_board.read_multiplexed(ADC_RAW, I1_I0)
+    assert statistics.count(TMCLCommand.WRITE_MC) == 2
+
+    # Bulk reads only write the selector when it changes
+    statistics.reset()
+    values = eval_board.read_multiplexed_registers(ADC_RAW, [I1_I0, VM_AGPI_A, VM_AGPI_A, I1_I0])
+    assert len(values) == 4
+    assert statistics.count(TMCLCommand.WRITE_MC) == 2
+    assert statistics.count(TMCLCommand.READ_MC) == 4
+    assert interface.modules[1].registers[TMCLCommand.READ_MC][(0, TMC4671.REG.ADC_RAW_ADDR)] == I1_I0
+
+    statistics.reset()
+    eval_board.invalidate_selectors()
+    eval_board.write_multiplexed(TMC4671.REG.CONFIG_DATA, TMC4671.VARIANT.CONFIG_ADDR_biquad_v_enable, 1)
+    assert statistics.count(TMCLCommand.WRITE_MC) == 2
+
+    with pytest.raises(ValueError):
+        eval_board.read_multiplexed(TMC4671.REG.PID_VELOCITY_LIMIT, 0)
+
+
+def test_multiplexed_uart():
+    connection = UartIcConnection()
+    ic = TMC4671(connection)
+
+    assert ic.read_multiplexed(ADC_RAW, VM_AGPI_A) == 0x03000400
+    assert ic.read_multiplexed(ADC_RAW, VM_AGPI_A) == 0x03000400
+    assert connection.datagrams == 3
+
+    connection.datagrams = 0
+    values = ic.read_multiplexed_registers(ADC_RAW, [I1_I0, VM_AGPI_A, I1_I0])
+    assert values == [0x01000200, 0x03000400, 0x01000200]
+    assert connection.datagrams == 6
+    assert connection.bursts == 1
+
+    # Selector writes by write_register are tracked
+    connection.datagrams = 0
+    ic.write_register(TMC4671.REG.ADC_RAW_ADDR, VM_AGPI_A)
+    assert ic.read_multiplexed(ADC_RAW, VM_AGPI_A) == 0x03000400
+    assert connection.datagrams == 2
+
+
+def test_multiplexed_failed_burst():
+    connection = UartIcConnection()
+    ic = TMC4671(connection)
+    assert ic.read_multiplexed(ADC_RAW, I1_I0) == 0x01000200
+
+    def send_datagrams(datagrams, recv_size):
+        # The selector write reaches the IC, then the link fails
+        connection.send_datagram(datagrams[0], recv_size)
+        raise ConnectionError("Link lost")
+
+    connection.send_datagrams = send_datagrams
+    with pytest.raises(ConnectionError):
+        ic.read_multiplexed_registers(ADC_RAW, [VM_AGPI_A, I1_I0])
+
+    # The selector is written again instead of reading the wrong sub-register
+    connection.datagrams = 0
+    assert ic.read_multiplexed(ADC_RAW, I1_I0) == 0x01000200
+    assert connection.datagrams == 2
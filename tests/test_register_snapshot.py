@@ -0,0 +1,109 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing register snapshots and their restore with a simulated module, no hardware needed."""
+
+import struct
+
+import pytest
+
+from pytrinamic.connections import SimulatedTmclInterface, SimulatedModule
+from pytrinamic.evalboards import TMC2130_eval, TMC5160_eval
+from pytrinamic.ic import TMC2130, TMC5160, TMC4671
+from pytrinamic.ic.register_database import RegisterDatabase
+from pytrinamic.ic.register_snapshot import RegisterSnapshot, diff
+from pytrinamic.tmcl import TMCLCommand
+
+
+def test_snapshot_diff_restore():
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(mc=TMC5160)})
+    statistics = interface.enable_statistics()
+    eval_board = TMC5160_eval(interface)
+
+    eval_board.write_register(TMC5160.REG.XACTUAL, 1000)
+    recipe_a = eval_board.snapshot()
+    # Volatile registers are left out per default
+    assert len(recipe_a) == len(RegisterDatabase.of(TMC5160).registers()) - len(TMC5160.VOLATILE_REGISTERS)
+    assert TMC5160.REG.XACTUAL not in recipe_a
+    position = eval_board.snapshot([TMC5160.REG.XACTUAL])
+    assert position[TMC5160.REG.XACTUAL] == 1000
+
+    eval_board.write_register_field(TMC5160.FIELD.TOFF, 3)
+    eval_board.write_register(TMC5160.REG.VMAX, 50000)
+    eval_board.write_register(TMC5160.REG.XACTUAL, -20)
+    recipe_b = eval_board.snapshot()
+    assert diff(recipe_a, recipe_b) == {
+        TMC5160.REG.VMAX: (0, 50000),
+        TMC5160.REG.CHOPCONF: (0, 3),
+    }
+    assert diff(recipe_a, recipe_a) == {}
+
+    # Only the changed registers are written, volatile ones are skipped
+    statistics.reset()
+    assert eval_board.restore(recipe_a) == [TMC5160.REG.VMAX, TMC5160.REG.CHOPCONF]
+    assert statistics.count(TMCLCommand.WRITE_MC) == 2
+    assert eval_board.restore(position) == []
+    assert eval_board.read_register(TMC5160.REG.XACTUAL, signed=True) == -20
+    assert eval_board.restore(recipe_a) == []
+
+    # With the register cache the current values don't need to be read
+    eval_board.enable_register_cache()
+    eval_board.restore(recipe_b)
+    statistics.reset()
+    assert eval_board.restore(recipe_a) == [TMC5160.REG.VMAX, TMC5160.REG.CHOPCONF]
+    assert statistics.count(TMCLCommand.READ_MC) == 0
+    assert statistics.count(TMCLCommand.WRITE_MC) == 2
+
+    with pytest.raises(ValueError):
+        eval_board.restore(RegisterSnapshot("TMC4671", [0x00], [0]))
+
+
+def test_snapshot_subset():
+    snapshot = RegisterSnapshot("TMC5160", [0x6C, 0x00], [3, -1])
+    assert snapshot.addresses == (0x00, 0x6C)
+    assert snapshot[0x00] == 0xFFFFFFFF
+    assert 0x6C in snapshot and 0x01 not in snapshot
+    assert snapshot.items() == [(0x00, 0xFFFFFFFF), (0x6C, 3)]
+    assert diff(snapshot, RegisterSnapshot("TMC5160", [0x00], [0xFFFFFFFF])) == {0x6C: (3, None)}
+
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(mc=TMC5160)})
+    eval_board = TMC5160_eval(interface)
+    assert eval_board.snapshot([TMC5160.REG.CHOPCONF]).as_dict() == {TMC5160.REG.CHOPCONF: 0}
+
+
+def test_snapshot_uart():
+    registers = {}
+
+    class UartIcConnection:
+        def send_datagram(self, data, recv_size):
+            address, value = struct.unpack(">BI", data)
+            if address & 0x80:
+                registers[address & 0x7F] = value
+            return struct.pack(">BI", address & 0x7F, registers.get(address & 0x7F, 0))
+
+    ic = TMC4671(UartIcConnection())
+    snapshot = ic.snapshot()
+    ic.write_register(TMC4671.REG.PID_VELOCITY_LIMIT, 1000)
+    assert ic.restore(snapshot) == [TMC4671.REG.PID_VELOCITY_LIMIT]
+    assert registers[TMC4671.REG.PID_VELOCITY_LIMIT] == 0
+
+
+def test_snapshot_driver_connection():
+    registers = {TMC2130.REG.CHOPCONF: 0x000100C3}
+
+    class DriverConnection:
+        """Connection without TMCL, only providing the driver register functions."""
+        def write_drv(self, register_address, value, module_id=None):
+            registers[register_address] = value
+
+        def read_drv(self, register_address, module_id=None, signed=False):
+            return registers.get(register_address, 0)
+
+    eval_board = TMC2130_eval(DriverConnection())
+    snapshot = eval_board.snapshot([TMC2130.REG.GCONF, TMC2130.REG.CHOPCONF])
+    assert snapshot.as_dict() == {TMC2130.REG.GCONF: 0, TMC2130.REG.CHOPCONF: 0x000100C3}
+    eval_board.write_register(TMC2130.REG.CHOPCONF, 0)
+    assert eval_board.restore(snapshot) == [TMC2130.REG.CHOPCONF]
+    assert registers[TMC2130.REG.CHOPCONF] == 0x000100C3
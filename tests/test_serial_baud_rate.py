@@ -0,0 +1,88 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the serial baud rate negotiation with a simulated serial port, no hardware needed."""
+
+import logging
+
+import pytest
+
+from pytrinamic.connections import SerialTmclInterface, SerialBaudRate, SimulatedModule
+from pytrinamic.tmcl import TMCLRequest, TMCLReply
+
+
+class SimulatedSerial:
+    """A serial port to a module that replies at its own baud rate and corrupts replies above max_baudrate."""
+
+    def __init__(self, module_baudrate, max_baudrate, lost_switch_replies=()):
+        self.baudrate = 9600
+        self.timeout = 1
+        self.module_baudrate = module_baudrate
+        self.max_baudrate = max_baudrate
+        # Rates switched to without a reply
+        self.lost_switch_replies = set(lost_switch_replies)
+        self.module = SimulatedModule()
+        self._rx = b""
+
+    def write(self, data):
+        if self.baudrate != self.module_baudrate:
+            return
+        request = TMCLRequest.from_buffer(data)
+        status, value = self.module.handle(request)
+        reply = bytearray(TMCLReply(2, 1, status, request.command, value).to_buffer())
+        if self.module_baudrate > self.max_baudrate:
+            reply[8] ^= 0x55
+        if request.command == 9 and request.commandType == SerialBaudRate.GP_SERIAL_BAUD_RATE:
+            self.module_baudrate = {code: rate for rate, code in SerialBaudRate.CODES.items()}[request.value]
+            if self.module_baudrate in self.lost_switch_replies:
+                return
+        self._rx += reply
+
+    def read(self, size):
+        data, self._rx = self._rx[:size], self._rx[size:]
+        return data
+
+    def reset_input_buffer(self):
+        self._rx = b""
+
+    def close(self):
+        pass
+
+
+class SimulatedSerialTmclInterface(SerialTmclInterface):
+
+    def __init__(self, serial_port):
+        super(SerialTmclInterface, self).__init__(2, 1)
+        self.logger = logging.getLogger("SimulatedSerialTmclInterface")
+        self._serial = serial_port
+        self._baudrate = serial_port.baudrate
+
+
+def test_negotiate_baud_rate():
+    port = SimulatedSerial(module_baudrate=19200, max_baudrate=250000)
+    interface = SimulatedSerialTmclInterface(port)
+
+    assert SerialBaudRate.probe(interface) == 19200
+    assert SerialBaudRate.negotiate(interface) == 250000
+    assert port.baudrate == port.module_baudrate == 250000
+    assert interface.get_global_parameter(SerialBaudRate.GP_SERIAL_BAUD_RATE, 0) == SerialBaudRate.CODES[250000]
+    assert interface.get_timeout() == 1
+
+
+def test_negotiate_baud_rate_lost_reply():
+    port = SimulatedSerial(module_baudrate=19200, max_baudrate=500000, lost_switch_replies=[500000])
+    interface = SimulatedSerialTmclInterface(port)
+
+    # The module switches to 500000 baud without replying, the negotiation continues from there
+    assert SerialBaudRate.negotiate(interface, timeout_s=0.01) == 500000
+    assert port.baudrate == port.module_baudrate == 500000
+
+
+def test_negotiate_baud_rate_no_module():
+    port = SimulatedSerial(module_baudrate=12345, max_baudrate=250000)
+    interface = SimulatedSerialTmclInterface(port)
+    with pytest.raises(ConnectionError):
+        SerialBaudRate.negotiate(interface, rates=[115200, 9600])
+    assert port.baudrate == 9600
@@ -0,0 +1,84 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the simulated TMCL modules, no hardware needed."""
+
+import time
+
+import pytest
+
+from pytrinamic.connections import SimulatedTmclInterface, SimulatedModule, ConnectionManager
+from pytrinamic.modules import TMCM1636, TMCM6214
+from pytrinamic.evalboards import TMC5160_eval
+from pytrinamic.ic import TMC5160
+from pytrinamic.RAMDebug import RAMDebug, Channel
+from pytrinamic.tmcl import TMCLReplyStatusError, TMCLStatus
+
+
+def test_simulated_modules():
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(TMCM1636), 3: SimulatedModule(TMCM6214)})
+    tmcm1636 = TMCM1636(interface)
+    tmcm6214 = TMCM6214(interface, module_id=3)
+
+    tmcm1636.motors[0].linear_ramp.max_velocity = 1000
+    assert tmcm1636.motors[0].linear_ramp.max_velocity == 1000
+
+    tmcm6214.move_to(5, -200)
+    assert tmcm6214.motors[5].actual_position == -200
+    tmcm6214.move_by(5, 50)
+    assert tmcm6214.motors[5].get_target_position() == -150
+    tmcm6214.rotate(2, -300)
+    assert tmcm6214.motors[2].actual_velocity == -300
+
+    tmcm6214.set_global_parameter(TMCM6214.GP0.RS485Baudrate, 0, 7)
+    assert tmcm6214.get_global_parameter(TMCM6214.GP0.RS485Baudrate, 0) == 7
+    assert interface.get_version_string(3) == "6214V100"
+
+    with pytest.raises(TMCLReplyStatusError) as excinfo:
+        tmcm1636.get_axis_parameter(250, 0)
+    assert excinfo.value.status_code == TMCLStatus.WRONG_TYPE
+    with pytest.raises(TMCLReplyStatusError):
+        tmcm6214.get_axis_parameter(0, 6)
+    with pytest.raises(ConnectionError):
+        interface.get_axis_parameter(0, 0, module_id=7)
+
+
+def test_simulated_eval_registers_and_ramdebug():
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(mc=TMC5160)})
+    eval_board = TMC5160_eval(interface)
+    eval_board.write_register(TMC5160.REG.XTARGET, 51200)
+    assert eval_board.read_register(TMC5160.REG.XTARGET) == 51200
+
+    with pytest.raises(TMCLReplyStatusError):
+        eval_board.read_register(0x7F)
+
+    ramdebug = RAMDebug(interface)
+    ramdebug.set_channel(Channel.register(0, TMC5160.REG.XTARGET))
+    ramdebug.set_channel(Channel.systick())
+    ramdebug.set_sample_count(4)
+    ramdebug.start_measurement()
+    assert ramdebug.is_measurement_done()
+    assert ramdebug.get_samples() == [[51200] * 4, [0, 1, 2, 3]]
+
+
+def test_simulated_timing():
+    interface = SimulatedTmclInterface(datarate=1000000, latency_s=0.002)
+    start = time.perf_counter()
+    for _ in range(5):
+        interface.get_axis_parameter(0, 0)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    interface.get_axis_parameters([(0, 0)] * 5, window=5)
+    pipelined = time.perf_counter() - start
+
+    assert sequential >= 0.01
+    assert pipelined < sequential
+
+
+def test_simulated_connection_manager():
+    with ConnectionManager("--interface simulated_tmcl --module-id 4").connect() as interface:
+        interface.set_axis_parameter(1, 0, 42, module_id=4)
+        assert interface.get_axis_parameter(1, 0, module_id=4) == 42
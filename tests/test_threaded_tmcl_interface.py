@@ -0,0 +1,59 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the ThreadedTmclInterface with a loopback interface, no hardware needed."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pytrinamic.connections import ThreadedTmclInterface
+from pytrinamic.tmcl import TMCLCommand, TMCLReplyStatusError
+
+from loopback_tmcl_interface import LoopbackTmclInterface
+
+
+def test_threaded_concurrent_callers():
+    loopback = LoopbackTmclInterface()
+    with ThreadedTmclInterface(loopback, window=4) as interface:
+        def worker(module_id):
+            return [interface.get_global_parameter(0, 0, module_id) for _ in range(20)]
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(worker, range(1, 6)))
+
+    assert results == [[0 + 1] * 20] * 5
+    assert loopback.max_in_flight <= 4
+    assert loopback.in_flight == 0
+
+
+def test_threaded_submit_and_bulk():
+    with ThreadedTmclInterface(LoopbackTmclInterface()) as interface:
+        futures = [interface.submit(interface._create_request(TMCLCommand.GAP, 0, 0, value, 3)) for value in range(10)]
+        assert [future.result().value for future in futures] == list(range(1, 11))
+
+        replies = interface.get_axis_parameters([(1, 0), (0xFF, 0)])
+        assert [reply.status for reply in replies] == [100, 4]
+
+        with pytest.raises(TMCLReplyStatusError):
+            interface.get_axis_parameter(0xFF, 0)
+
+    with pytest.raises(ConnectionError):
+        interface.get_axis_parameter(1, 0)
+
+
+def test_threaded_io_failure():
+    class FailingInterface(LoopbackTmclInterface):
+        def _match_reply(self, requests, reply):
+            raise ValueError("Unexpected failure")
+
+    with ThreadedTmclInterface(FailingInterface()) as interface:
+        futures = [interface.submit(interface._create_request(TMCLCommand.GAP, 0, 0, value, 1)) for value in range(3)]
+        # The pending requests fail instead of waiting forever
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(timeout=5)
+        with pytest.raises(ConnectionError):
+            interface.get_axis_parameter(1, 0)
@@ -0,0 +1,96 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the TMCL datagram codec."""
+
+import struct
+
+import pytest
+
+from pytrinamic.tmcl import TMCL, TMCLRequest, TMCLReply
+
+
+@pytest.mark.parametrize('fields', [
+    (1, 6, 4, 0, 0),
+    (3, 5, 140, 2, 0xFFFFFFFF),
+    (255, 146, 0x6C, 0x10, 0x12345678),
+    (2, 136, 0, 0, -1000),
+])
+def test_request_roundtrip(fields):
+    request = TMCLRequest(*fields)
+    data = request.to_buffer()
+    assert request.checksum == sum(data[:8]) & 0xFF
+    assert data == struct.pack(">BBBBIB", fields[0], fields[1], fields[2], fields[3], fields[4] & 0xFFFFFFFF,
+                               request.checksum)
+
+    buffer = bytearray(12)
+    request.pack_into(buffer, 3)
+    assert bytes(buffer[3:]) == data
+
+    decoded = TMCLRequest.from_buffer(data)
+    assert str(decoded) == str(request)
+
+
+def test_reply_from_memoryview():
+    replies = [TMCLReply(2, module_id, 100, 6, module_id*1000) for module_id in range(1, 4)]
+    buffer = bytearray(9*len(replies))
+    for i, reply in enumerate(replies):
+        reply.pack_into(buffer, 9*i)
+
+    view = memoryview(buffer)
+    for i, reply in enumerate(replies):
+        decoded = TMCLReply.from_buffer(view, 9*i)
+        assert decoded.is_checksum_correct()
+        assert (decoded.module_address, decoded.value, decoded.checksum) == (reply.module_address, reply.value,
+                                                                             reply.checksum)
+
+    buffer[8] ^= 0xFF
+    assert not TMCLReply.from_buffer(buffer, 0).is_checksum_correct()
+
+    # Without an offset the buffer must hold exactly one datagram
+    with pytest.raises(struct.error):
+        TMCLReply.from_buffer(buffer)
+    with pytest.raises(struct.error):
+        TMCLReply.from_buffer(view, 9*len(replies) - 4)
+    with pytest.raises(struct.error):
+        TMCLRequest.from_buffer(bytes(10))
+
+
+def test_calculate_checksum():
+    data = bytes([0xFA, 0xFB, 0xFC, 0xFD, 0xFE, 0xFF, 0x00, 0x01])
+    assert TMCL.calculate_checksum(data) == sum(data) % 256
+    assert TMCL.calculate_checksum([0xFF, 0x01]) == 0
+
+
+def test_batch_decode_replies():
+    np = pytest.importorskip("numpy")
+    from pytrinamic.tmcl import TMCLBatch
+
+    replies = [TMCLReply(2, module_id, 100, 6, module_id*1000 - 3000) for module_id in range(1, 6)]
+    data = b"".join(reply.to_buffer() for reply in replies)
+
+    array = TMCLBatch.decode_replies(memoryview(data))
+    assert list(array["module"]) == [1, 2, 3, 4, 5]
+    assert list(array["value"].astype(">i4")) == [-2000, -1000, 0, 1000, 2000]
+    assert list(array["checksum"]) == [reply.checksum for reply in replies]
+    assert TMCLBatch.is_checksum_correct(array).all()
+
+    corrupted = bytearray(data)
+    corrupted[9 + 4] ^= 0x01
+    assert list(TMCLBatch.is_checksum_correct(TMCLBatch.decode_replies(corrupted))) == [True, False, True, True, True]
+
+    with pytest.raises(ValueError):
+        TMCLBatch.decode_replies(data[:-1])
+
+
+def test_batch_encode_requests():
+    np = pytest.importorskip("numpy")
+    from pytrinamic.tmcl import TMCLBatch
+
+    indices = np.arange(10)
+    array = TMCLBatch.encode_requests(1, 6, indices, 0, -indices)
+    expected = b"".join(TMCLRequest(1, 6, int(index), 0, -int(index)).to_buffer() for index in indices)
+    assert array.tobytes() == expected
+    assert TMCLBatch.decode_requests(expected)["type"].tolist() == indices.tolist()
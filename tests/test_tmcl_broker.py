@@ -0,0 +1,144 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the TMCL broker with local clients and a loopback interface, no hardware needed."""
+
+import os
+import socket
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pytrinamic.connections import (TmclBroker, BrokerTmclInterface, TcpTmclInterface, ConnectionManager,
+                                    SimulatedTmclInterface, SimulatedModule)
+from pytrinamic.connections.tmcl_broker import parse_address
+from pytrinamic.modules import TMCM1636
+from pytrinamic.tmcl import TMCLCommand, TMCLReplyStatusError, TMCLTimeoutError
+
+from loopback_tmcl_interface import LoopbackTmclInterface
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets not available")
+
+
+def test_broker_clients(tmp_path):
+    device = LoopbackTmclInterface()
+    address = str(tmp_path / "broker.sock")
+    with TmclBroker(device, address, window=4).start():
+        def client(module_id):
+            with BrokerTmclInterface(address, module_id=module_id) as interface:
+                values = [interface.get_global_parameter(0, 0) for _ in range(5)]
+                replies = interface.get_axis_parameters([(index, 0) for index in range(20)] + [(0xFF, 0)])
+                with pytest.raises(TMCLReplyStatusError):
+                    interface.get_axis_parameter(0xFF, 0)
+                return values, [reply.value for reply in replies]
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(client, (1, 2, 3)))
+
+        for values, reply_values in results:
+            assert values == [1] * 5
+            assert reply_values == [1] * 20 + [None]
+        assert device.max_in_flight <= 4
+
+        with ConnectionManager(f"--interface broker_tmcl --port {address}").connect() as interface:
+            with interface.pipeline(window=10) as pipeline:
+                futures = [pipeline.send(TMCLCommand.GAP, 0, 0, value) for value in range(10)]
+            assert [future.result().value for future in futures] == list(range(1, 11))
+
+    with pytest.raises(ConnectionError):
+        BrokerTmclInterface(address)
+
+
+def test_broker_tcp():
+    device = LoopbackTmclInterface()
+    with TmclBroker(device, "localhost:0", window=8).start() as broker:
+        host, port = broker.address
+        assert port != 0
+
+        with ConnectionManager(f"--interface tcp_tmcl --port {host}:{port}").connect() as interface:
+            assert isinstance(interface, TcpTmclInterface)
+            assert interface.get_global_parameter(0, 0) == 1
+            # One batch travels in a single packet and is pipelined on the device
+            with interface.pipeline(window=32) as pipeline:
+                futures = [pipeline.send(TMCLCommand.GAP, 0, 0, value) for value in range(32)]
+            assert [future.result().value for future in futures] == list(range(1, 33))
+            with pytest.raises(TMCLReplyStatusError):
+                interface.get_axis_parameter(0xFF, 0)
+        assert device.max_in_flight == 8
+
+    with pytest.raises(ConnectionError):
+        TcpTmclInterface(f"{host}:{port}")
+
+
+def test_parse_address():
+    assert parse_address("localhost:9393") == ("localhost", 9393)
+    assert parse_address("[::1]:80") == ("::1", 80)
+    assert parse_address(("0.0.0.0", 0)) == ("0.0.0.0", 0)
+    assert parse_address("/tmp/tmcl.sock") == "/tmp/tmcl.sock"
+    assert parse_address("C:\\tmcl:1") == "C:\\tmcl:1"
+
+
+def test_broker_socket_file(tmp_path):
+    address = str(tmp_path / "broker.sock")
+
+    # Other files are not replaced
+    with open(address, "w") as file:
+        file.write("data")
+    with pytest.raises(FileExistsError):
+        TmclBroker(LoopbackTmclInterface(), address)
+    with open(address) as file:
+        assert file.read() == "data"
+    (tmp_path / "broker.sock").unlink()
+
+    # A running broker keeps its socket, a stale socket is replaced
+    with TmclBroker(LoopbackTmclInterface(), address).start():
+        # Only the owner may connect
+        assert stat.S_IMODE(os.stat(address).st_mode) == 0o600
+        with pytest.raises(OSError):
+            TmclBroker(LoopbackTmclInterface(), address)
+        with BrokerTmclInterface(address) as interface:
+            assert interface.get_global_parameter(0, 0) == 1
+
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(address)
+    stale.close()
+    with TmclBroker(LoopbackTmclInterface(), address).start():
+        with BrokerTmclInterface(address) as interface:
+            assert interface.get_global_parameter(0, 0) == 1
+        # The socket file of the broker is removed on close, another one is kept
+        (tmp_path / "broker.sock").unlink()
+        other = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        other.bind(address)
+    assert (tmp_path / "broker.sock").exists()
+    other.close()
+
+
+def test_broker_timeout(tmp_path):
+    address = str(tmp_path / "broker.sock")
+    device = SimulatedTmclInterface(modules={1: SimulatedModule(TMCM1636)})
+    with TmclBroker(device, address).start():
+        with BrokerTmclInterface(address) as interface:
+            with pytest.raises(TMCLTimeoutError):
+                interface.get_axis_parameter(0, 0, module_id=5)
+            assert interface.get_axis_parameter(0, 0) == 0
+
+
+def test_broker_device_failure(tmp_path, caplog):
+    address = str(tmp_path / "broker.sock")
+    device = LoopbackTmclInterface()
+
+    def match_reply(requests, reply):
+        raise ValueError("Corrupted reply")
+
+    device._match_reply = match_reply
+    with TmclBroker(device, address).start():
+        with BrokerTmclInterface(address) as interface:
+            # The request in flight and all further requests fail instead of blocking
+            with pytest.raises(ConnectionError):
+                interface.get_global_parameter(0, 0)
+            with pytest.raises(ConnectionError):
+                interface.get_global_parameter(0, 0)
+    assert "Serving the device failed." in caplog.text
@@ -0,0 +1,78 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the module discovery with simulated modules, no hardware needed."""
+
+import queue
+import threading
+import time
+
+from pytrinamic.connections import TmclDiscovery, DiscoveredModule, SimulatedTmclInterface, SimulatedModule
+from pytrinamic.connections.can_tmcl_interface import CanTmclInterface
+from pytrinamic.modules import TMCM1636, TMCM6214
+from pytrinamic.tmcl import TMCLRequest, TMCLReply
+
+
+class SimulatedCanBus(CanTmclInterface):
+    """CAN interface with SimulatedModules replying after a short delay."""
+
+    def __init__(self, modules, timeout_s=0.05):
+        CanTmclInterface.__init__(self, "sim", 1000000, 2, 1, timeout_s)
+        self._frames = queue.Queue()
+        self.modules = modules
+        self.requests = 0
+
+    def _send(self, host_id, module_id, data):
+        self.requests += 1
+        module = self.modules.get(module_id)
+        if module is None:
+            return
+        request = TMCLRequest.from_buffer(data)
+        status, value = module.handle(request)
+        reply = TMCLReply(host_id, module_id, status, request.command, value)
+        threading.Timer(0.001, self._frames.put, [reply.to_buffer()]).start()
+
+    def _recv(self, host_id, module_id):
+        try:
+            return self._frames.get(timeout=self._timeout_s)
+        except queue.Empty:
+            raise ConnectionError("Recv timed out") from None
+
+
+def test_probe_serial():
+    interface = SimulatedTmclInterface(modules={
+        3: SimulatedModule(TMCM1636, version="1636V105"),
+        5: SimulatedModule(TMCM6214, version="6214V123"),
+    })
+    assert TmclDiscovery.probe(interface, range(1, 9)) == [(3, "1636V105", 1636), (5, "6214V123", 6214)]
+
+
+def test_probe_can_pipelined():
+    interface = SimulatedCanBus({
+        7: SimulatedModule(TMCM1636, version="1636V105"),
+        40: SimulatedModule(TMCM6214, version="6214V123"),
+        41: SimulatedModule(TMCM6214, version="6214V123"),
+    })
+
+    start = time.perf_counter()
+    found = TmclDiscovery.probe(interface, range(1, 65), window=32)
+    duration = time.perf_counter() - start
+
+    assert found == [(7, "1636V105", 1636), (40, "6214V123", 6214), (41, "6214V123", 6214)]
+    assert interface.requests == 64
+    # Two batches of 32 module IDs, each waiting for one timeout
+    assert duration < 10 * interface._timeout_s
+
+
+def test_scan():
+    discovery = TmclDiscovery(["simulated_tmcl", "dummy_tmcl"], range(1, 5))
+    modules = discovery.scan()
+    assert modules == [DiscoveredModule("simulated_tmcl", "sim", 1, "0000V000", 0)]
+
+    table = TmclDiscovery.format_table(modules).splitlines()
+    assert table[0].split() == ["Interface", "Port", "Module", "ID", "Version", "Type"]
+    assert table[1].split() == ["simulated_tmcl", "sim", "1", "0000V000", "0"]
+
+    assert TmclDiscovery(["simulated_tmcl"], exclude=["sim"]).scan() == []
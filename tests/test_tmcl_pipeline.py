@@ -0,0 +1,84 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the TmclPipeline with a loopback interface, no hardware needed."""
+
+import pytest
+
+from pytrinamic.tmcl import TMCLCommand, TMCLReplyStatusError, TMCLReplyChecksumError, TMCLTimeoutError
+
+from loopback_tmcl_interface import LoopbackTmclInterface
+
+
+def test_pipeline_window():
+    interface = LoopbackTmclInterface()
+    with interface.pipeline(window=4) as pipeline:
+        futures = [pipeline.send(TMCLCommand.GAP, 0, 0, value) for value in range(10)]
+    assert [future.result().value for future in futures] == list(range(1, 11))
+    assert interface.max_in_flight == 4
+
+
+def test_pipeline_out_of_order():
+    interface = LoopbackTmclInterface(reverse=True)
+    with interface.pipeline(window=3) as pipeline:
+        futures = [pipeline.send(TMCLCommand.GAP, 0, 0, 10*module_id, module_id) for module_id in (3, 4, 5)]
+    assert [future.result().value for future in futures] == [31, 41, 51]
+
+
+def test_pipeline_status_error():
+    interface = LoopbackTmclInterface()
+    with interface.pipeline() as pipeline:
+        good = pipeline.send(TMCLCommand.GAP, 0, 0, 1)
+        bad = pipeline.send(TMCLCommand.GAP, 0xFF, 0, 2)
+    assert good.result().value == 2
+    with pytest.raises(TMCLReplyStatusError):
+        bad.result()
+
+
+def test_result_drives_pipeline():
+    interface = LoopbackTmclInterface()
+    pipeline = interface.pipeline(window=8)
+    futures = [pipeline.send(TMCLCommand.GAP, 0, 0, value) for value in range(3)]
+    assert not futures[1].done()
+    assert futures[1].result().value == 2
+    assert futures[0].done()
+    pipeline.flush()
+    assert pipeline.in_flight == 0
+
+
+def test_get_axis_parameters():
+    interface = LoopbackTmclInterface()
+    replies = interface.get_axis_parameters([(0, 0), (300, 1, 5), (0xFF, 0)], module_id=3, index_bit_width=12)
+    assert [(reply.index, reply.axis, reply.module_id) for reply in replies] == [(0, 0, 3), (300, 1, 5), (0xFF, 0, 3)]
+    assert [reply.value for reply in replies] == [1, 1, None]
+    assert [reply.status for reply in replies] == [100, 100, 4]
+
+
+def test_get_axis_parameters_failures():
+    interface = LoopbackTmclInterface()
+
+    def reply_check(reply):
+        if reply.module_address == 2:
+            raise TMCLReplyChecksumError(reply)
+
+    interface._reply_check = reply_check
+    replies = interface.get_axis_parameters([(0, 0), (0, 0, 2), (0xFF, 0)], module_id=1)
+    assert [(reply.value, reply.status) for reply in replies] == [(1, 100), (None, None), (None, 4)]
+
+    # A timeout fails the whole call
+    def recv(host_id, module_id):
+        raise TMCLTimeoutError("No reply")
+
+    interface._recv = recv
+    with pytest.raises(ConnectionError):
+        interface.get_axis_parameters([(0, 0), (1, 0)])
+
+
+def test_set_axis_parameters():
+    interface = LoopbackTmclInterface()
+    replies = interface.set_axis_parameters([(4, 0, 1000), (5, 0, -2)], module_id=1)
+    assert [reply.value for reply in replies] == [1001, 0xFFFFFFFF]
+    with pytest.raises(ValueError):
+        interface.set_axis_parameters([(256, 0, 0)])
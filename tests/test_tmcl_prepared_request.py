@@ -0,0 +1,57 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing prepared TMCL requests with simulated modules, no hardware needed."""
+
+import pytest
+
+from pytrinamic.connections import SimulatedTmclInterface, SimulatedModule
+from pytrinamic.modules import TMCM1636
+from pytrinamic.tmcl import TMCLCommand, TMCLReplyStatusError, TMCLReplyChecksumError
+
+from loopback_tmcl_interface import LoopbackTmclInterface
+
+
+def test_prepared_axis_parameters():
+    interface = SimulatedTmclInterface(modules={3: SimulatedModule(TMCM1636)})
+    module = TMCM1636(interface, module_id=3)
+    ap = TMCM1636._MotorTypeA.AP
+
+    set_target = module.prepare_set_axis_parameter(ap.TargetPosition, 0)
+    get_target = module.prepare_get_axis_parameter(ap.TargetPosition, 0, signed=True)
+    for value in (0, 1, -1, 123456, -(2**31)):
+        set_target(value)
+        assert get_target() == value
+    assert module.get_axis_parameter(ap.TargetPosition, 0, signed=True) == -(2**31)
+    assert set_target.request.value == 2**31
+
+    statistics = interface.enable_statistics()
+    assert get_target() == -(2**31)
+    assert statistics.count(TMCLCommand.GAP) == 1
+
+    with pytest.raises(TMCLReplyStatusError):
+        interface.prepare_get_axis_parameter(250, 0, module_id=3)()
+    with pytest.raises(ValueError):
+        interface.prepare_get_axis_parameter(256, 0)
+
+
+def test_prepared_checksum():
+    class CorruptingInterface(LoopbackTmclInterface):
+        _checksum_replies = True
+
+        def _recv(self, host_id, module_id):
+            data = bytearray(super()._recv(host_id, module_id))
+            data[8] ^= 0xFF
+            return data
+
+        def _reply_check(self, reply):
+            if not reply.is_checksum_correct():
+                raise TMCLReplyChecksumError(reply)
+
+    prepared = CorruptingInterface().prepare(TMCLCommand.GAP, 0, 0)
+    with pytest.raises(TMCLReplyChecksumError):
+        prepared(5)
+
+    assert LoopbackTmclInterface().prepare(TMCLCommand.GAP, 0, 0)(5) == 6
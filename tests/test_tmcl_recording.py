@@ -0,0 +1,85 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the TMCL traffic recorder and the replay interface, no hardware needed."""
+
+import logging
+
+import pytest
+
+from pytrinamic.connections import RecordingTmclInterface, ReplayTmclInterface, TmclRecording
+from pytrinamic.tmcl import TMCLCommand
+
+from loopback_tmcl_interface import LoopbackTmclInterface
+
+
+def _record(path):
+    with RecordingTmclInterface(LoopbackTmclInterface(), path) as interface:
+        values = [interface.get_axis_parameter(index, 0) for index in range(3)]
+        values += [reply.value for reply in interface.get_axis_parameters([(3, 0), (4, 0)])]
+    return values
+
+
+def test_recording(tmp_path):
+    path = str(tmp_path / "session.tmclrec")
+    assert _record(path) == [1, 1, 1, 1, 1]
+    _record(path)
+
+    with TmclRecording(path) as recording:
+        assert len(recording) == 20
+        assert [record.direction for record in recording][:4] == [TmclRecording.TX, TmclRecording.RX] * 2
+        timestamps = [record.timestamp_ns for record in recording]
+        assert timestamps == sorted(timestamps)
+        requests = [request for _, request in recording.requests()]
+        assert [request.commandType for request in requests[:5]] == [0, 1, 2, 3, 4]
+        assert all(reply.command == TMCLCommand.GAP for _, reply in recording.replies())
+        assert recording[-1] == list(recording)[-1]
+
+
+def test_recording_partial_record(tmp_path):
+    path = str(tmp_path / "session.tmclrec")
+    _record(path)
+    # An interrupted recording ends with a partial record
+    with open(path, "ab") as file:
+        file.write(bytes(5))
+
+    _record(path)
+    with TmclRecording(path) as recording:
+        assert len(recording) == 20
+        assert all(record.direction in (TmclRecording.TX, TmclRecording.RX) for record in recording)
+        assert all(reply.command == TMCLCommand.GAP for _, reply in recording.replies())
+
+
+def test_recording_after_close(tmp_path):
+    path = str(tmp_path / "session.tmclrec")
+    interface = RecordingTmclInterface(LoopbackTmclInterface(), path)
+    interface.get_axis_parameter(0, 0)
+    interface.close()
+
+    # Late datagrams of the wrapped interface are dropped
+    interface._record(TmclRecording.RX, bytes(9))
+    interface.flush()
+    interface.close()
+    with TmclRecording(path) as recording:
+        assert len(recording) == 2
+
+
+def test_replay(tmp_path, caplog):
+    path = str(tmp_path / "session.tmclrec")
+    _record(path)
+
+    with ReplayTmclInterface(path) as interface:
+        assert [interface.get_axis_parameter(index, 0) for index in range(3)] == [1, 1, 1]
+
+        with caplog.at_level(logging.WARNING):
+            assert interface.get_axis_parameter(10, 0) == 1
+        assert "differs from the recording" in caplog.text
+
+        interface.get_axis_parameter(4, 0)
+        with pytest.raises(ConnectionError):
+            interface.get_axis_parameter(5, 0)
+
+    with pytest.raises(ConnectionError):
+        ReplayTmclInterface(str(tmp_path / "missing.tmclrec"))
@@ -0,0 +1,82 @@
+################################################################################
+# Copyright © 2026 Analog Devices Inc. All Rights Reserved. This software is
+# proprietary & confidential to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Testing the TMCL request statistics with simulated modules, no hardware needed."""
+
+import pytest
+
+from pytrinamic.connections import SimulatedTmclInterface, SimulatedModule
+from pytrinamic.connections.tmcl_statistics import _bucket_index, _bucket_range
+from pytrinamic.modules import TMCM1636
+from pytrinamic.tmcl import TMCLCommand, TMCLRequest, TMCLReplyStatusError, TMCLTimeoutError
+
+
+def test_latency_buckets():
+    for value in list(range(100)) + [1000, 12345, 10**6, 10**9 + 7]:
+        lower, upper = _bucket_range(_bucket_index(value))
+        assert lower <= value < upper
+        assert upper - lower <= max(1, lower / 8)
+
+
+def test_statistics():
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(TMCM1636)}, latency_s=0.001)
+    statistics = interface.enable_statistics()
+
+    for _ in range(3):
+        interface.get_axis_parameter(0, 0)
+    interface.set_global_parameter(77, 0, 1)
+    with pytest.raises(TMCLReplyStatusError):
+        interface.get_axis_parameter(250, 0)
+    with pytest.raises(ConnectionError):
+        interface.get_axis_parameter(0, 0, module_id=5)
+    interface.get_axis_parameters([(0, 0), (250, 0)])
+
+    assert statistics.count() == 8
+    assert statistics.count(TMCLCommand.GAP) == 7
+    assert statistics.count(module_id=5) == 1
+    assert (statistics.status_errors, statistics.timeouts, statistics.errors) == (2, 1, 3)
+    assert 1e6 <= statistics.latency_percentile(50, TMCLCommand.GAP) < 1e8
+    assert sum(count for _, _, count in statistics.latency_histogram()) == 7
+    assert "Opcode   6: 7 requests" in str(statistics)
+
+    snapshot = statistics.snapshot()
+    statistics.reset()
+    assert statistics.count() == 0
+    assert statistics.latency_percentile(50) is None
+    assert snapshot.count() == 8
+
+    interface.disable_statistics()
+    interface.get_axis_parameter(0, 0)
+    assert statistics.count() == 0
+
+
+def test_statistics_enabled_in_flight():
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(TMCM1636)})
+    pipeline = interface.pipeline(window=4)
+    pipeline.send(TMCLCommand.GAP, 0, 0, 0)
+    pipeline.send(TMCLCommand.GAP, 1, 0, 0)
+
+    # Requests sent before enabling the statistics are not measured
+    statistics = interface.enable_statistics()
+    pipeline.send(TMCLCommand.GAP, 2, 0, 0)
+    pipeline.flush()
+    assert statistics.count() == 1
+    assert statistics.latency_percentile(100) < 1e9
+
+
+def test_error_classification():
+    interface = SimulatedTmclInterface(modules={1: SimulatedModule(TMCM1636)})
+    statistics = interface.enable_statistics()
+    with pytest.raises(TMCLTimeoutError):
+        interface.get_axis_parameter(0, 0, module_id=5)
+    # Callers catching the former RuntimeError of the serial interfaces still work
+    with pytest.raises(RuntimeError):
+        interface.get_axis_parameter(0, 0, module_id=5)
+
+    # Timeouts are told apart by the exception type, not by the message
+    request = TMCLRequest(1, TMCLCommand.GAP, 0, 0, 0)
+    statistics.record(request, 1000, ConnectionError("Port closed, timed out waiting for the lock"))
+    statistics.record(request, 1000, TMCLTimeoutError("No reply"))
+    assert (statistics.timeouts, statistics.link_errors) == (3, 1)